@@ -1,10 +1,11 @@
 import random
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from ..base.errors import NetworkError, RateLimitError
 from ..models.crypto_hourly import CryptoHourlyMarket
@@ -36,6 +37,8 @@ class Exchange(ABC):
         self.rate_limit = self.config.get("rate_limit", 10)  # requests per second
         self.last_request_time = 0
         self.request_times = []  # For sliding window rate limiting
+        # Guards request_times: exchanges issue requests from worker threads
+        self._rate_limit_lock = threading.Lock()
 
         # Retry configuration
         self.max_retries = self.config.get("max_retries", 3)
@@ -386,49 +389,49 @@ class Exchange(ABC):
 
     def _check_rate_limit(self):
         """Check and enforce rate limiting"""
-        current_time = time.time()
+        with self._rate_limit_lock:
+            current_time = time.time()
 
-        # Clean old requests (older than 1 second)
-        self.request_times = [t for t in self.request_times if current_time - t < 1.0]
+            # Clean old requests (older than 1 second)
+            self.request_times = [t for t in self.request_times if current_time - t < 1.0]
 
-        # Check if we've exceeded the rate limit
-        if len(self.request_times) >= self.rate_limit:
-            sleep_time = 1.0 - (current_time - self.request_times[0])
-            if sleep_time > 0:
-                if self.verbose:
-                    print(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+            # Check if we've exceeded the rate limit
+            if len(self.request_times) >= self.rate_limit:
+                sleep_time = 1.0 - (current_time - self.request_times[0])
+                if sleep_time > 0:
+                    if self.verbose:
+                        print(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
+                    time.sleep(sleep_time)
+
+            # Record this request
+            self.request_times.append(current_time)
+
+    def _call_with_retry(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call func with rate limiting and retry on network errors.
 
-        # Record this request
-        self.request_times.append(current_time)
+        Retries NetworkError/RateLimitError with exponential backoff and jitter;
+        any other exception propagates immediately. Unlike _retry_on_failure this
+        does not allocate a wrapper per call.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._check_rate_limit()
+                return func(*args, **kwargs)
+            except (NetworkError, RateLimitError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_delay * (self.retry_backoff**attempt) + random.uniform(0, 1)
+                if self.verbose:
+                    print(f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s: {e}")
+                time.sleep(delay)
 
     def _retry_on_failure(self, func):
         """Decorator for retry logic with exponential backoff"""
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-
-            for attempt in range(self.max_retries + 1):
-                try:
-                    self._check_rate_limit()
-                    return func(*args, **kwargs)
-                except (NetworkError, RateLimitError) as e:
-                    last_exception = e
-                    if attempt < self.max_retries:
-                        delay = self.retry_delay * (self.retry_backoff**attempt) + random.uniform(
-                            0, 1
-                        )
-                        if self.verbose:
-                            print(f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s: {e}")
-                        time.sleep(delay)
-                    else:
-                        raise last_exception
-                except Exception as e:
-                    # Don't retry on non-network errors
-                    raise e
-
-            raise last_exception
+            return self._call_with_retry(func, *args, **kwargs)
 
         return wrapper
 
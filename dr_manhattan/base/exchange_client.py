@@ -634,10 +634,30 @@ class ExchangeClient:
         Args:
             market_id: Market ID to cancel orders for
 
+        Exchanges that declare the "cancel_orders" capability cancel the market's
+        orders in one batch call (unless a subclass overrides cancel_order); the
+        count comes from the exchange's per-order results.
+
         Returns:
             Number of orders cancelled
         """
         orders = self.fetch_open_orders(market_id=market_id)
+        if not orders:
+            return 0
+
+        use_batch = (
+            bool(market_id)
+            and self._exchange.describe()["has"].get("cancel_orders", False)
+            and type(self).cancel_order is ExchangeClient.cancel_order
+        )
+        if use_batch:
+            cancelled_orders, failed = self._exchange.cancel_orders(
+                [(order.id, market_id) for order in orders]
+            )
+            for order_id, e in failed.items():
+                logger.warning(f"Failed to cancel order {order_id}: {e}")
+            return len(cancelled_orders)
+
         cancelled = 0
 
         for order in orders:
@@ -6,14 +6,33 @@ Uses REST API for communication and EIP-712 for order signing.
 """
 
 import json
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import requests
+from eth_abi import encode as abi_encode
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_utils import keccak
+from requests.adapters import HTTPAdapter
 
 from ..base.errors import (
     AuthenticationError,
@@ -27,12 +46,15 @@ from ..base.exchange import Exchange
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus
 from ..models.position import Position
+from ..utils import setup_logger
+from ..utils.market_cache import cached_on_market, freeze
 from .limitless_ws import (
     LimitlessUserWebSocket,
     LimitlessWebSocket,
     OrderbookUpdate,
     PositionUpdate,
     PriceUpdate,
+    RawLimitlessWebSocket,
     Trade,
     WebSocketState,
 )
@@ -41,6 +63,7 @@ __all__ = [
     "Limitless",
     "LimitlessWebSocket",
     "LimitlessUserWebSocket",
+    "RawLimitlessWebSocket",
     "WebSocketState",
     "OrderbookUpdate",
     "PriceUpdate",
@@ -48,8 +71,11 @@ __all__ = [
     "Trade",
 ]
 
+# Quiet by default; a verbose Limitless instance lowers the level to DEBUG
+logger = setup_logger(__name__, level=logging.WARNING)
 
-@dataclass
+
+@dataclass(slots=True)
 class PricePoint:
     """Represents a single price history point"""
 
@@ -75,7 +101,7 @@ class PublicTrade:
     transaction_hash: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NAV:
     """Net Asset Value calculation result"""
 
@@ -96,9 +122,70 @@ class Limitless(Exchange):
     BASE_URL = "https://api.limitless.exchange"
     WS_URL = "wss://ws.limitless.exchange"
     CHAIN_ID = 8453  # Base mainnet
+    BASE_RPC_URL = "https://mainnet.base.org"
+    USDC_ADDRESS = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"  # USDC on Base
+    HTTP_POOL_SIZE = 32  # Keep-alive connections per host (API and RPC)
+    BULK_CANCEL_THRESHOLD = 3  # Orders per market before cancel_orders tries one bulk DELETE
 
     SUPPORTED_INTERVALS: Sequence[str] = ("1m", "1h", "1d", "1w")
 
+    # API returns 0/1 for BUY/SELL on signed orders, strings elsewhere
+    _SIDE_MAP: Dict[Any, OrderSide] = {
+        0: OrderSide.BUY,
+        1: OrderSide.SELL,
+        "buy": OrderSide.BUY,
+        "sell": OrderSide.SELL,
+        "BUY": OrderSide.BUY,
+        "SELL": OrderSide.SELL,
+    }
+
+    _STATUS_MAP: Dict[str, OrderStatus] = {
+        "pending": OrderStatus.PENDING,
+        "open": OrderStatus.OPEN,
+        "live": OrderStatus.OPEN,
+        "active": OrderStatus.OPEN,
+        "filled": OrderStatus.FILLED,
+        "matched": OrderStatus.FILLED,
+        "partially_filled": OrderStatus.PARTIALLY_FILLED,
+        "partial": OrderStatus.PARTIALLY_FILLED,
+        "cancelled": OrderStatus.CANCELLED,
+        "canceled": OrderStatus.CANCELLED,
+        "rejected": OrderStatus.REJECTED,
+    }
+
+    # Portfolio API fields per outcome: (balance/position key, outcome, latest price key)
+    _PORTFOLIO_SIDES = (("yes", "Yes", "latestYesPrice"), ("no", "No", "latestNoPrice"))
+    _SCALE_6 = 1_000_000  # USDC and outcome token amounts use 6 decimals
+
+    # EIP-712 schema for order signing is fixed, so type hashes are computed once
+    _EIP712_DOMAIN_TYPEHASH = keccak(
+        text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+    )
+    _EIP712_NAME_HASH = keccak(text="Limitless CTF Exchange")
+    _EIP712_VERSION_HASH = keccak(text="1")
+    _ORDER_TYPEHASH = keccak(
+        text=(
+            "Order(uint256 salt,address maker,address signer,address taker,uint256 tokenId,"
+            "uint256 makerAmount,uint256 takerAmount,uint256 expiration,uint256 nonce,"
+            "uint256 feeRateBps,uint8 side,uint8 signatureType)"
+        )
+    )
+    _ORDER_ABI_TYPES = (
+        "bytes32",
+        "uint256",
+        "address",
+        "address",
+        "address",
+        "uint256",
+        "uint256",
+        "uint256",
+        "uint256",
+        "uint256",
+        "uint256",
+        "uint8",
+        "uint8",
+    )
+
     @property
     def id(self) -> str:
         return "limitless"
@@ -123,7 +210,7 @@ class Limitless(Exchange):
         self.host = self.config.get("host", self.BASE_URL)
         self.chain_id = self.config.get("chain_id", self.CHAIN_ID)
 
-        self._session = requests.Session()
+        self._session = self._create_session()
         self._account = None
         self._address = None
         self._authenticated = False
@@ -137,11 +224,32 @@ class Limitless(Exchange):
         self._token_to_slug: Dict[str, str] = {}
         # Track which token IDs are "No" tokens (need inverted orderbook)
         self._no_tokens: set = set()
+        # Exchange address -> EIP-712 domain separator
+        self._domain_separators: Dict[str, bytes] = {}
+        # Shared worker pool for independent requests (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # Initialize account and authenticate if private key provided
         if self.private_key:
             self._initialize_auth()
 
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive session shared by the REST API and Base RPC calls."""
+        session = requests.Session()
+        # Retries are handled by _call_with_retry, not urllib3
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.HTTP_POOL_SIZE, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+    def close(self):
+        """Close pooled HTTP connections and the worker pool."""
+        self._session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def _initialize_auth(self):
         """Initialize authentication with Limitless."""
         try:
@@ -199,8 +307,7 @@ class Limitless(Exchange):
 
             self._authenticated = True
 
-            if self.verbose:
-                print(f"Authenticated as {self._address}")
+            logger.info("Authenticated as %s", self._address)
 
         except requests.RequestException as e:
             raise AuthenticationError(f"Authentication failed: {e}")
@@ -230,57 +337,63 @@ class Limitless(Exchange):
         if require_auth:
             self._ensure_authenticated()
 
-        @self._retry_on_failure
-        def _make_request():
-            url = f"{self.host}{endpoint}"
+        return self._call_with_retry(self._send_request, method, endpoint, params, data)
 
-            try:
-                response = self._session.request(
-                    method, url, params=params, json=data, timeout=self.timeout
-                )
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+    ) -> Any:
+        """Send a single HTTP request to Limitless API and map errors (no retry)."""
+        url = f"{self.host}{endpoint}"
 
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
-
-                if response.status_code == 401 or response.status_code == 403:
-                    # Try to re-authenticate
-                    if self.private_key and self._account:
-                        self._authenticate()
-                        response = self._session.request(
-                            method, url, params=params, json=data, timeout=self.timeout
-                        )
-
-                response.raise_for_status()
-                return response.json()
-
-            except requests.Timeout as e:
-                raise NetworkError(f"Request timeout: {e}")
-            except requests.ConnectionError as e:
-                raise NetworkError(f"Connection error: {e}")
-            except requests.HTTPError as e:
-                # Try to get error details from response body
-                error_detail = ""
-                try:
-                    error_body = response.json()
-                    error_detail = error_body.get("message", str(error_body))
-                except Exception:
-                    error_detail = response.text[:200] if response.text else ""
-
-                if response.status_code == 404:
-                    raise ExchangeError(f"Resource not found: {endpoint}")
-                elif response.status_code == 401:
-                    raise AuthenticationError(f"Authentication failed: {e}")
-                elif response.status_code == 403:
-                    raise AuthenticationError(f"Access forbidden: {e}")
-                elif response.status_code == 400:
-                    raise ExchangeError(f"Bad request: {error_detail}")
-                else:
-                    raise ExchangeError(f"HTTP error: {e} - {error_detail}")
-            except requests.RequestException as e:
-                raise ExchangeError(f"Request failed: {e}")
+        try:
+            response = self._session.request(
+                method, url, params=params, json=data, timeout=self.timeout
+            )
+
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 1))
+                raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
 
-        return _make_request()
+            if response.status_code == 401 or response.status_code == 403:
+                # Try to re-authenticate
+                if self.private_key and self._account:
+                    self._authenticate()
+                    response = self._session.request(
+                        method, url, params=params, json=data, timeout=self.timeout
+                    )
+
+            response.raise_for_status()
+            return response.json()
+
+        except requests.Timeout as e:
+            raise NetworkError(f"Request timeout: {e}")
+        except requests.ConnectionError as e:
+            raise NetworkError(f"Connection error: {e}")
+        except requests.HTTPError as e:
+            # Try to get error details from response body
+            error_detail = ""
+            try:
+                error_body = response.json()
+                error_detail = error_body.get("message", str(error_body))
+            except Exception:
+                error_detail = response.text[:200] if response.text else ""
+
+            if response.status_code == 404:
+                raise ExchangeError(f"Resource not found: {endpoint}")
+            elif response.status_code == 401:
+                raise AuthenticationError(f"Authentication failed: {e}")
+            elif response.status_code == 403:
+                raise AuthenticationError(f"Access forbidden: {e}")
+            elif response.status_code == 400:
+                raise ExchangeError(f"Bad request: {error_detail}")
+            else:
+                raise ExchangeError(f"HTTP error: {e} - {error_detail}")
+        except requests.RequestException as e:
+            raise ExchangeError(f"Request failed: {e}")
 
     def fetch_markets(self, params: Optional[Dict[str, Any]] = None) -> List[Market]:
         """
@@ -297,28 +410,63 @@ class Limitless(Exchange):
             List of Market objects
         """
 
-        @self._retry_on_failure
-        def _fetch():
-            query_params = params or {}
-            page = query_params.get("page", 1)
-            limit = min(query_params.get("limit", 25), 25)  # API max is 25
+        query_params = params or {}
+        page = query_params.get("page", 1)
+        limit = min(query_params.get("limit", 25), 25)  # API max is 25
+
+        response = self._request(
+            "GET",
+            "/markets/active",
+            params={"page": page, "limit": limit, **query_params},
+        )
+
+        markets_data = response.get("data", response if isinstance(response, list) else [])
+        markets = [self._parse_market(m) for m in markets_data]
+
+        # Apply additional filters
+        if query_params.get("active") or (not query_params.get("closed", True)):
+            markets = [m for m in markets if m.is_open]
+
+        return markets
+
+    def iter_markets(self, params: Optional[Dict[str, Any]] = None) -> Iterator[Market]:
+        """
+        Lazily iterate over all active markets, one page at a time.
+
+        The API caps pages at 25 markets, so large listings are fetched and parsed
+        page by page as the caller consumes them instead of being materialized up
+        front. Breaking out of the loop stops further page requests.
+
+        Args:
+            params: Optional parameters (same as fetch_markets); page sets the start page
+
+        Yields:
+            Market objects
+        """
+        query_params = dict(params or {})
+        page = query_params.pop("page", 1)
+        limit = max(1, min(query_params.pop("limit", 25), 25))
+        open_only = query_params.get("active") or (not query_params.get("closed", True))
 
+        while True:
             response = self._request(
                 "GET",
                 "/markets/active",
-                params={"page": page, "limit": limit, **query_params},
+                params={**query_params, "page": page, "limit": limit},
             )
-
             markets_data = response.get("data", response if isinstance(response, list) else [])
-            markets = [self._parse_market(m) for m in markets_data]
 
-            # Apply additional filters
-            if query_params.get("active") or (not query_params.get("closed", True)):
-                markets = [m for m in markets if m.is_open]
+            if not markets_data:
+                return
 
-            return markets
+            for data in markets_data:
+                market = self._parse_market(data)
+                if not open_only or market.is_open:
+                    yield market
 
-        return _fetch()
+            if len(markets_data) < limit:
+                return
+            page += 1
 
     def fetch_market(self, market_id: str) -> Market:
         """
@@ -331,15 +479,11 @@ class Limitless(Exchange):
             Market object
         """
 
-        @self._retry_on_failure
-        def _fetch():
-            try:
-                data = self._request("GET", f"/markets/{market_id}")
-                return self._parse_market(data)
-            except ExchangeError:
-                raise MarketNotFound(f"Market {market_id} not found")
-
-        return _fetch()
+        try:
+            data = self._request("GET", f"/markets/{market_id}")
+            return self._parse_market(data)
+        except ExchangeError:
+            raise MarketNotFound(f"Market {market_id} not found")
 
     def fetch_markets_by_slug(self, slug: str) -> List[Market]:
         """
@@ -519,8 +663,7 @@ class Limitless(Exchange):
             return {"bids": bids, "asks": asks}
 
         except Exception as e:
-            if self.verbose:
-                print(f"Failed to fetch orderbook: {e}")
+            logger.warning("Failed to fetch orderbook: %s", e)
             return {"bids": [], "asks": []}
 
     def fetch_token_ids(self, market_id: str) -> List[str]:
@@ -733,69 +876,60 @@ class Limitless(Exchange):
 
         return order
 
-    def _sign_order_eip712(self, order: Dict[str, Any], exchange_address: str) -> str:
-        """Sign order using EIP-712 typed data."""
-        domain = {
-            "name": "Limitless CTF Exchange",
-            "version": "1",
-            "chainId": self.chain_id,
-            "verifyingContract": exchange_address,
-        }
-
-        types = {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"},
-            ],
-            "Order": [
-                {"name": "salt", "type": "uint256"},
-                {"name": "maker", "type": "address"},
-                {"name": "signer", "type": "address"},
-                {"name": "taker", "type": "address"},
-                {"name": "tokenId", "type": "uint256"},
-                {"name": "makerAmount", "type": "uint256"},
-                {"name": "takerAmount", "type": "uint256"},
-                {"name": "expiration", "type": "uint256"},
-                {"name": "nonce", "type": "uint256"},
-                {"name": "feeRateBps", "type": "uint256"},
-                {"name": "side", "type": "uint8"},
-                {"name": "signatureType", "type": "uint8"},
-            ],
-        }
-
-        # Order is already in correct numeric format for EIP-712 signing
-        message = {
-            "salt": order["salt"],
-            "maker": order["maker"],
-            "signer": order["signer"],
-            "taker": order["taker"],
-            "tokenId": order["tokenId"],
-            "makerAmount": order["makerAmount"],
-            "takerAmount": order["takerAmount"],
-            "expiration": order["expiration"],
-            "nonce": order["nonce"],
-            "feeRateBps": order["feeRateBps"],
-            "side": order["side"],
-            "signatureType": order["signatureType"],
-        }
-
-        typed_data = {
-            "types": types,
-            "primaryType": "Order",
-            "domain": domain,
-            "message": message,
-        }
+    def _domain_separator(self, exchange_address: str) -> bytes:
+        """Get the cached EIP-712 domain separator for an exchange contract."""
+        separator = self._domain_separators.get(exchange_address)
+        if separator is None:
+            separator = keccak(
+                abi_encode(
+                    ("bytes32", "bytes32", "bytes32", "uint256", "address"),
+                    (
+                        self._EIP712_DOMAIN_TYPEHASH,
+                        self._EIP712_NAME_HASH,
+                        self._EIP712_VERSION_HASH,
+                        self.chain_id,
+                        exchange_address,
+                    ),
+                )
+            )
+            self._domain_separators[exchange_address] = separator
+        return separator
 
-        encoded = encode_typed_data(full_message=typed_data)
-        signed = self._account.sign_message(encoded)
+    def _sign_order_eip712(self, order: Dict[str, Any], exchange_address: str) -> str:
+        """
+        Sign order using EIP-712 typed data.
 
-        signature = signed.signature.hex()
-        if not signature.startswith("0x"):
-            signature = "0x" + signature
+        The Order schema never changes, so the struct hash is ABI-encoded directly
+        against precomputed type hashes instead of going through encode_typed_data.
+        """
+        struct_hash = keccak(
+            abi_encode(
+                self._ORDER_ABI_TYPES,
+                (
+                    self._ORDER_TYPEHASH,
+                    order["salt"],
+                    order["maker"],
+                    order["signer"],
+                    order["taker"],
+                    order["tokenId"],
+                    order["makerAmount"],
+                    order["takerAmount"],
+                    order["expiration"],
+                    order["nonce"],
+                    order["feeRateBps"],
+                    order["side"],
+                    order["signatureType"],
+                ),
+            )
+        )
+        digest = keccak(b"\x19\x01" + self._domain_separator(exchange_address) + struct_hash)
+        signed = self._account._key_obj.sign_msg_hash(digest)
 
-        return signature
+        # eth_keys returns v as 0/1; Ethereum signatures use 27/28
+        signature = (
+            signed.r.to_bytes(32, "big") + signed.s.to_bytes(32, "big") + bytes([signed.v + 27])
+        )
+        return "0x" + signature.hex()
 
     def cancel_order(self, order_id: str, market_id: Optional[str] = None) -> Order:
         """
@@ -812,23 +946,96 @@ class Limitless(Exchange):
 
         try:
             self._request("DELETE", f"/orders/{order_id}", require_auth=True)
-
-            return Order(
-                id=order_id,
-                market_id=market_id or "",
-                outcome="",
-                side=OrderSide.BUY,
-                price=0,
-                size=0,
-                filled=0,
-                status=OrderStatus.CANCELLED,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
-            )
+            return self._cancelled_order(order_id, market_id)
 
         except Exception as e:
             raise ExchangeError(f"Failed to cancel order {order_id}: {e}")
 
+    @staticmethod
+    def _cancelled_order(order_id: str, market_id: Optional[str]) -> Order:
+        """Build the Order returned for a successful cancel."""
+        now = datetime.now(timezone.utc)
+        return Order(
+            id=order_id,
+            market_id=market_id or "",
+            outcome="",
+            side=OrderSide.BUY,
+            price=0,
+            size=0,
+            filled=0,
+            status=OrderStatus.CANCELLED,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def cancel_orders(
+        self, orders: Sequence[Tuple[str, str]]
+    ) -> Tuple[List[Order], Dict[str, ExchangeError]]:
+        """
+        Cancel multiple orders, grouped by market.
+
+        A market group of at least BULK_CANCEL_THRESHOLD orders that covers every
+        open order in that market is cleared with one cancel_all_orders request.
+        Other orders are cancelled individually and concurrently.
+
+        Args:
+            orders: (order_id, market_slug) pairs
+
+        Returns:
+            Tuple of (cancelled Order objects, {order_id: error} for failed cancels)
+        """
+        self._ensure_authenticated()
+
+        by_market: Dict[str, List[str]] = {}
+        for order_id, market_id in orders:
+            by_market.setdefault(market_id, []).append(order_id)
+
+        cancelled: List[Order] = []
+        failed: Dict[str, ExchangeError] = {}
+        singles: List[Tuple[str, str]] = []
+
+        for market_id, order_ids in by_market.items():
+            if market_id and len(order_ids) >= self.BULK_CANCEL_THRESHOLD:
+                bulk_ids = self._bulk_cancellable(market_id, order_ids)
+                if bulk_ids:
+                    try:
+                        self.cancel_all_orders(market_id=market_id)
+                        cancelled.extend(self._cancelled_order(oid, market_id) for oid in bulk_ids)
+                    except ExchangeError as e:
+                        # The bulk request may have partly applied: report, don't retry
+                        failed.update(dict.fromkeys(bulk_ids, e))
+                    order_ids = [oid for oid in order_ids if oid not in bulk_ids]
+            singles.extend((oid, market_id) for oid in order_ids)
+
+        if singles:
+            executor = self._get_executor()
+            futures = [
+                (oid, executor.submit(self.cancel_order, oid, market_id=mid))
+                for oid, mid in singles
+            ]
+            for oid, future in futures:
+                try:
+                    cancelled.append(future.result())
+                except ExchangeError as e:
+                    failed[oid] = e
+
+        return cancelled, failed
+
+    def _bulk_cancellable(self, market_id: str, order_ids: List[str]) -> set:
+        """
+        Order IDs to clear with one bulk cancel, or an empty set.
+
+        The per-market endpoint cancels every open order in the market, so it is
+        only used when order_ids include all of them.
+        """
+        try:
+            open_ids = {order.id for order in self.fetch_open_orders(market_id=market_id)}
+        except Exception:
+            return set()
+        if not open_ids or not open_ids.issubset(order_ids):
+            return set()
+        return open_ids
+
     def cancel_all_orders(
         self, market_id: Optional[str] = None, side: Optional[OrderSide] = None
     ) -> Dict[str, Any]:
@@ -897,16 +1104,10 @@ class Limitless(Exchange):
             query_params["statuses"] = "LIVE"
 
         # Build token_id -> outcome mapping if market_id provided
-        token_to_outcome: Dict[str, str] = {}
+        token_to_outcome: Mapping[str, str] = {}
         if market_id:
             try:
-                market = self.fetch_market(market_id)
-                tokens = market.metadata.get("tokens", {})
-                # tokens is {"Yes": "token_id_1", "No": "token_id_2"}
-                # We need reverse mapping: {"token_id_1": "Yes", "token_id_2": "No"}
-                for outcome, token_id in tokens.items():
-                    if token_id:
-                        token_to_outcome[str(token_id)] = outcome
+                token_to_outcome = self._token_outcome_map(self.fetch_market(market_id))
             except Exception:
                 pass
 
@@ -922,12 +1123,11 @@ class Limitless(Exchange):
             return [self._parse_order(o, token_to_outcome) for o in orders_data]
 
         except Exception as e:
-            if self.verbose:
-                print(f"Failed to fetch open orders: {e}")
+            logger.warning("Failed to fetch open orders: %s", e)
             return []
 
     def _parse_order(
-        self, data: Dict[str, Any], token_to_outcome: Optional[Dict[str, str]] = None
+        self, data: Dict[str, Any], token_to_outcome: Optional[Mapping[str, str]] = None
     ) -> Order:
         """Parse order data from API response."""
         order_id = str(data.get("id", data.get("orderId", "")))
@@ -935,10 +1135,9 @@ class Limitless(Exchange):
 
         # Parse side - API returns 0 for BUY, 1 for SELL (or string "buy"/"sell")
         side_raw = data.get("side", "buy")
-        if isinstance(side_raw, int):
-            side = OrderSide.BUY if side_raw == 0 else OrderSide.SELL
-        else:
-            side = OrderSide.BUY if str(side_raw).lower() == "buy" else OrderSide.SELL
+        side = self._SIDE_MAP.get(side_raw)
+        if side is None:
+            side = self._SIDE_MAP.get(str(side_raw).lower(), OrderSide.SELL)
 
         # Parse status
         status = self._parse_order_status(data.get("status", "open"))
@@ -980,8 +1179,9 @@ class Limitless(Exchange):
         outcome = data.get("outcome", "")
         if not outcome and token_to_outcome:
             # API may return "token" or "tokenId"
-            token_id = str(data.get("token", "") or data.get("tokenId", ""))
-            outcome = token_to_outcome.get(token_id, "")
+            token_id = data.get("token") or data.get("tokenId")
+            if token_id:
+                outcome = token_to_outcome.get(str(token_id), "")
 
         return Order(
             id=order_id,
@@ -1001,21 +1201,10 @@ class Limitless(Exchange):
         if status is None:
             return OrderStatus.OPEN
 
-        status_str = str(status).lower()
-        status_map = {
-            "pending": OrderStatus.PENDING,
-            "open": OrderStatus.OPEN,
-            "live": OrderStatus.OPEN,
-            "active": OrderStatus.OPEN,
-            "filled": OrderStatus.FILLED,
-            "matched": OrderStatus.FILLED,
-            "partially_filled": OrderStatus.PARTIALLY_FILLED,
-            "partial": OrderStatus.PARTIALLY_FILLED,
-            "cancelled": OrderStatus.CANCELLED,
-            "canceled": OrderStatus.CANCELLED,
-            "rejected": OrderStatus.REJECTED,
-        }
-        return status_map.get(status_str, OrderStatus.OPEN)
+        mapped = self._STATUS_MAP.get(status)
+        if mapped is not None:
+            return mapped
+        return self._STATUS_MAP.get(str(status).lower(), OrderStatus.OPEN)
 
     def fetch_positions(
         self, market_id: Optional[str] = None, params: Optional[Dict[str, Any]] = None
@@ -1039,20 +1228,16 @@ class Limitless(Exchange):
             clob_positions = response.get("clob", [])
 
             for pos_data in clob_positions:
-                parsed_positions = self._parse_portfolio_position(pos_data)
-
-                for position in parsed_positions:
-                    # Filter by market if specified
-                    if market_id and position.market_id != market_id:
-                        continue
+                # Filter by market before building Position objects
+                if market_id and pos_data.get("market", {}).get("slug", "") != market_id:
+                    continue
 
-                    positions.append(position)
+                positions.extend(self._parse_portfolio_position(pos_data))
 
             return positions
 
         except Exception as e:
-            if self.verbose:
-                print(f"Failed to fetch positions: {e}")
+            logger.warning("Failed to fetch positions: %s", e)
             return []
 
     def fetch_positions_for_market(self, market: Market) -> List[Position]:
@@ -1067,6 +1252,14 @@ class Limitless(Exchange):
         """
         return self.fetch_positions(market_id=market.id)
 
+    @staticmethod
+    def _fget(data: Dict[str, Any], *keys: str, default: float = 0.0) -> float:
+        """Float value of the first key present in data (falsy values map to default)."""
+        for key in keys:
+            if key in data:
+                return float(data[key] or default)
+        return default
+
     def _parse_portfolio_position(self, data: Dict[str, Any]) -> List[Position]:
         """
         Parse position data from portfolio API response.
@@ -1088,47 +1281,23 @@ class Limitless(Exchange):
         position_details = data.get("positions", {})
         latest_trade = data.get("latestTrade", {})
 
-        # Parse Yes position
-        yes_balance = float(tokens_balance.get("yes", 0) or 0)
-        if yes_balance > 0:
-            yes_details = position_details.get("yes", {})
-            fill_price = float(yes_details.get("fillPrice", 0) or 0)
-            # fillPrice is in scaled format (e.g., 650000 = 0.65)
-            avg_price = fill_price / 1_000_000 if fill_price > 1 else fill_price
-            current_price = float(latest_trade.get("latestYesPrice", 0) or 0)
-
-            # Convert balance from scaled format (6 decimals)
-            size = yes_balance / 1_000_000
-
-            positions.append(
-                Position(
-                    market_id=market_id,
-                    outcome="Yes",
-                    size=size,
-                    average_price=avg_price,
-                    current_price=current_price,
-                )
-            )
-
-        # Parse No position
-        no_balance = float(tokens_balance.get("no", 0) or 0)
-        if no_balance > 0:
-            no_details = position_details.get("no", {})
-            fill_price = float(no_details.get("fillPrice", 0) or 0)
-            # fillPrice is in scaled format (e.g., 350000 = 0.35)
-            avg_price = fill_price / 1_000_000 if fill_price > 1 else fill_price
-            current_price = float(latest_trade.get("latestNoPrice", 0) or 0)
+        for key, outcome, price_key in self._PORTFOLIO_SIDES:
+            balance = self._fget(tokens_balance, key)
+            if balance <= 0:
+                continue
 
-            # Convert balance from scaled format (6 decimals)
-            size = no_balance / 1_000_000
+            details = position_details.get(key, {})
+            fill_price = self._fget(details, "fillPrice")
 
             positions.append(
                 Position(
                     market_id=market_id,
-                    outcome="No",
-                    size=size,
-                    average_price=avg_price,
-                    current_price=current_price,
+                    outcome=outcome,
+                    # Balance is scaled to 6 decimals
+                    size=balance / self._SCALE_6,
+                    # fillPrice is usually scaled too (e.g., 650000 = 0.65)
+                    average_price=fill_price / self._SCALE_6 if fill_price > 1 else fill_price,
+                    current_price=self._fget(latest_trade, price_key),
                 )
             )
 
@@ -1141,11 +1310,9 @@ class Limitless(Exchange):
         market_id = market_data.get("slug", data.get("marketSlug", data.get("market_id", "")))
 
         outcome = data.get("outcome", data.get("tokenName", ""))
-        size = float(data.get("size", data.get("balance", 0)) or 0)
-        average_price = float(
-            data.get("avgEntryPrice", data.get("averagePrice", data.get("avg_price", 0))) or 0
-        )
-        current_price = float(data.get("currentPrice", data.get("price", 0)) or 0)
+        size = self._fget(data, "size", "balance")
+        average_price = self._fget(data, "avgEntryPrice", "averagePrice", "avg_price")
+        current_price = self._fget(data, "currentPrice", "price")
 
         return Position(
             market_id=market_id,
@@ -1155,6 +1322,23 @@ class Limitless(Exchange):
             current_price=current_price,
         )
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _balance_of_calldata(address: str) -> str:
+        """ERC20 balanceOf(address) call data (selector 0x70a08231 + padded address)."""
+        return "0x70a08231" + address[2:].lower().zfill(64)
+
+    def _eth_call(self, to: str, data: str) -> str:
+        """Execute a single eth_call against the Base RPC and return the hex result."""
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "eth_call",
+            "params": [{"to": to, "data": data}, "latest"],
+            "id": 1,
+        }
+        response = self._session.post(self.BASE_RPC_URL, json=payload, timeout=10)
+        return response.json().get("result", "0x0")
+
     def fetch_balance(self) -> Dict[str, float]:
         """
         Fetch account balance from on-chain USDC contract.
@@ -1164,28 +1348,11 @@ class Limitless(Exchange):
         """
         self._ensure_authenticated()
 
-        # USDC contract on Base
-        usdc_address = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
-        base_rpc = "https://mainnet.base.org"
-
         try:
-            # ERC20 balanceOf call
-            # balanceOf(address) selector = 0x70a08231
-            data = f"0x70a08231000000000000000000000000{self._address[2:].lower()}"
-
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_call",
-                "params": [{"to": usdc_address, "data": data}, "latest"],
-                "id": 1,
-            }
-
-            response = requests.post(base_rpc, json=payload, timeout=10)
-            result = response.json().get("result", "0x0")
+            result = self._eth_call(self.USDC_ADDRESS, self._balance_of_calldata(self._address))
 
-            # Convert from hex to int, then to USDC (6 decimals)
-            balance_wei = int(result, 16)
-            usdc_balance = balance_wei / (10**6)
+            # An empty "0x" (revert) raises here and falls through to the API below
+            usdc_balance = int(result, 16) / self._SCALE_6
 
             return {"USDC": usdc_balance}
 
@@ -1204,23 +1371,34 @@ class Limitless(Exchange):
                 pass
             raise ExchangeError(f"Failed to fetch balance: {e}")
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="limitless")
+        return self._executor
+
     def calculate_nav(self, market: Market) -> NAV:
         """
         Calculate Net Asset Value for a specific market.
 
+        Balance and positions are fetched concurrently.
+
         Args:
             market: Market object
 
         Returns:
             NAV object
         """
-        balances = self.fetch_balance()
-        cash = balances.get("USDC", 0.0)
+        executor = self._get_executor()
+        balance_future = executor.submit(self.fetch_balance)
+        positions_future = executor.submit(self.fetch_positions_for_market, market)
 
-        positions = self.fetch_positions_for_market(market)
-        positions_value = 0.0
-        positions_breakdown = []
+        cash = balance_future.result().get("USDC", 0.0)
+        positions = positions_future.result()
 
+        # Single pass: build the breakdown and accumulate the total together
+        positions_breakdown = []
+        positions_value = 0.0
         for pos in positions:
             value = pos.size * pos.current_price
             positions_value += value
@@ -1233,10 +1411,8 @@ class Limitless(Exchange):
                 }
             )
 
-        nav = cash + positions_value
-
         return NAV(
-            nav=nav,
+            nav=cash + positions_value,
             cash=cash,
             positions_value=positions_value,
             positions=positions_breakdown,
@@ -1247,19 +1423,35 @@ class Limitless(Exchange):
         if not timestamp:
             return None
 
+        # Exact type checks, most common API shape (ISO string) first
+        ts_type = type(timestamp)
+        try:
+            if ts_type is str:
+                return self._parse_iso_datetime(timestamp)
+            if ts_type is int or ts_type is float:
+                # Unix timestamp
+                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        except (ValueError, TypeError):
+            return None
+
         if isinstance(timestamp, datetime):
             return timestamp
 
         try:
             if isinstance(timestamp, (int, float)):
-                # Unix timestamp
                 return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            # ISO format string
-            ts_str = str(timestamp).replace("Z", "+00:00")
-            return datetime.fromisoformat(ts_str)
+            return self._parse_iso_datetime(str(timestamp))
         except (ValueError, TypeError):
             return None
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_iso_datetime(ts: str) -> datetime:
+        """Parse an ISO 8601 string (cached, the same timestamps recur across orders/events)."""
+        if ts.endswith("Z"):
+            ts = ts[:-1] + "+00:00"
+        return datetime.fromisoformat(ts)
+
     # Search and exploration methods
 
     def search_markets(
@@ -1296,11 +1488,13 @@ class Limitless(Exchange):
         if limit <= 0:
             return []
 
-        def _lower_list(values: Optional[Sequence[str]]) -> List[str]:
-            return [v.lower() for v in values] if values else []
-
-        query_lower = query.lower() if query else None
-        keyword_lowers = _lower_list(keywords)
+        match = self._build_search_predicate(
+            binary=binary,
+            min_liquidity=min_liquidity,
+            query_lower=query.lower() if query else None,
+            keyword_lowers=tuple(k.lower() for k in keywords) if keywords else (),
+            predicate=predicate,
+        )
 
         # Fetch markets
         params = {"page": page, "limit": min(limit, 50)}
@@ -1311,40 +1505,60 @@ class Limitless(Exchange):
 
         all_markets = self.fetch_markets(params)
 
-        # Client-side filtering
-        filtered: List[Market] = []
+        # Client-side filtering, stopping as soon as limit matches are found
+        return list(islice(filter(match, all_markets), limit))
 
-        for m in all_markets:
+    def _build_search_predicate(
+        self,
+        binary: Optional[bool],
+        min_liquidity: float,
+        query_lower: Optional[str],
+        keyword_lowers: Tuple[str, ...],
+        predicate: Optional[Callable[[Market], bool]],
+    ) -> Callable[[Market], bool]:
+        """Combine search_markets filters into a single market predicate."""
+        build_search_text = self._build_search_text
+
+        def match(m: Market) -> bool:
             if binary is not None and m.is_binary != binary:
-                continue
+                return False
             if m.liquidity < min_liquidity:
-                continue
+                return False
             if query_lower or keyword_lowers:
-                text = self._build_search_text(m)
+                # Cached lowercased text already includes the question
+                text = build_search_text(m)
                 if query_lower and query_lower not in text:
-                    continue
-                if any(k not in text for k in keyword_lowers):
-                    continue
+                    return False
+                for keyword in keyword_lowers:
+                    if keyword not in text:
+                        return False
             if predicate and not predicate(m):
-                continue
-            filtered.append(m)
-
-        if len(filtered) > limit:
-            filtered = filtered[:limit]
+                return False
+            return True
 
-        return filtered
+        return match
 
     @staticmethod
     def _build_search_text(market: Market) -> str:
-        """Build searchable text from market."""
+        """
+        Build searchable text from market.
+
+        Cached on the Market until the question or searched metadata change, so
+        repeated searches over the same objects skip the rebuild.
+        """
         meta = market.metadata
-        fields = [
+        fields = (
             market.question or "",
             meta.get("description", ""),
             meta.get("slug", ""),
             meta.get("category", ""),
-        ]
-        return " ".join(str(f) for f in fields).lower()
+        )
+        return cached_on_market(
+            market,
+            "_search_text",
+            freeze(fields),
+            lambda: " ".join(str(f) for f in fields).lower(),
+        )
 
     # Price history
 
@@ -1385,14 +1599,9 @@ class Limitless(Exchange):
         if end_to:
             params["to"] = end_to
 
-        @self._retry_on_failure
-        def _fetch() -> List[Dict[str, Any]]:
-            response = self._request(
-                "GET", f"/markets/{market_obj.id}/historical-price", params=params
-            )
-            return response.get("data", response if isinstance(response, list) else [])
+        response = self._request("GET", f"/markets/{market_obj.id}/historical-price", params=params)
+        history = response.get("data", response if isinstance(response, list) else [])
 
-        history = _fetch()
         points = self._parse_history(history)
 
         if as_dataframe:
@@ -1401,11 +1610,12 @@ class Limitless(Exchange):
             except ImportError as exc:
                 raise RuntimeError("pandas is required when as_dataframe=True.") from exc
 
+            # Points are already sorted by timestamp
             data = {
                 "timestamp": [p.timestamp for p in points],
                 "price": [p.price for p in points],
             }
-            return pd.DataFrame(data).sort_values("timestamp").reset_index(drop=True)
+            return pd.DataFrame(data)
 
         return points
 
@@ -1427,7 +1637,8 @@ class Limitless(Exchange):
                     ts = datetime.fromisoformat(str(t).replace("Z", "+00:00"))
 
                 parsed.append(PricePoint(timestamp=ts, price=float(p), raw=row))
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, OverflowError):
+                # Skips rows with out-of-range epochs (e.g. milliseconds)
                 continue
 
         return sorted(parsed, key=lambda item: item.timestamp)
@@ -1441,17 +1652,49 @@ class Limitless(Exchange):
             raise MarketNotFound(f"Market {market} not found")
         return fetched
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_token_ids_json(raw_ids: str) -> Tuple[str, ...]:
+        """Parse a JSON-encoded token ID list (cached, payloads repeat per market)."""
+        try:
+            parsed = json.loads(raw_ids)
+        except json.JSONDecodeError:
+            parsed = [raw_ids]
+        return tuple(str(token_id) for token_id in parsed if token_id)
+
     @staticmethod
     def _extract_token_ids(market: Market) -> List[str]:
         """Extract token IDs from market metadata."""
         raw_ids = market.metadata.get("clobTokenIds", []) or market.metadata.get("token_ids", [])
         if isinstance(raw_ids, str):
-            try:
-                raw_ids = json.loads(raw_ids)
-            except json.JSONDecodeError:
-                raw_ids = [raw_ids]
+            return list(Limitless._parse_token_ids_json(raw_ids))
         return [str(token_id) for token_id in raw_ids if token_id]
 
+    @classmethod
+    def _token_outcome_map(cls, market: Market) -> Mapping[str, str]:
+        """
+        Build the token ID -> outcome mapping used to label parsed orders.
+
+        Prefers metadata["tokens"] ({"Yes": "token_id_1", ...}) and falls back to
+        pairing clobTokenIds with outcomes. Cached on the Market until those change.
+        """
+        meta = market.metadata
+        source = freeze(
+            [meta.get("tokens"), meta.get("clobTokenIds"), meta.get("token_ids"), market.outcomes]
+        )
+
+        def build() -> Mapping[str, str]:
+            tokens = meta.get("tokens")
+            if isinstance(tokens, dict) and tokens:
+                mapping = {
+                    str(token_id): outcome for outcome, token_id in tokens.items() if token_id
+                }
+            else:
+                mapping = dict(zip(cls._extract_token_ids(market), market.outcomes))
+            return MappingProxyType(mapping)
+
+        return cached_on_market(market, "_token_to_outcome", source, build)
+
     def _lookup_token_id(self, market: Market, outcome: int | str | None) -> str:
         """Look up token ID for a specific outcome."""
         token_ids = self._extract_token_ids(market)
@@ -1463,6 +1706,10 @@ class Limitless(Exchange):
         elif isinstance(outcome, int):
             outcome_index = outcome
         else:
+            # Parsed markets already carry an outcome -> token ID mapping
+            tokens = market.metadata.get("tokens")
+            if isinstance(tokens, dict) and tokens.get(outcome):
+                return str(tokens[outcome])
             try:
                 outcome_index = market.outcomes.index(outcome)
             except ValueError as err:
@@ -1499,8 +1746,7 @@ class Limitless(Exchange):
             )
             return response.get("data", response if isinstance(response, list) else [])
         except Exception as e:
-            if self.verbose:
-                print(f"Failed to fetch feed events: {e}")
+            logger.warning("Failed to fetch feed events: %s", e)
             return []
 
     def fetch_market_events(
@@ -1525,8 +1771,7 @@ class Limitless(Exchange):
             )
             return response.get("data", response if isinstance(response, list) else [])
         except Exception as e:
-            if self.verbose:
-                print(f"Failed to fetch market events: {e}")
+            logger.warning("Failed to fetch market events: %s", e)
             return []
 
     def describe(self) -> Dict[str, Any]:
@@ -1538,10 +1783,12 @@ class Limitless(Exchange):
             "host": self.host,
             "has": {
                 "fetch_markets": True,
+                "iter_markets": True,
                 "fetch_market": True,
                 "fetch_markets_by_slug": True,
                 "create_order": True,
                 "cancel_order": True,
+                "cancel_orders": True,
                 "cancel_all_orders": True,
                 "fetch_order": True,
                 "fetch_open_orders": True,
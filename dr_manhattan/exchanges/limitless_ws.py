@@ -6,14 +6,19 @@ Documentation: https://api.limitless.exchange/api-v1
 """
 
 import asyncio
+import concurrent.futures
+import json
 import logging
+import os
 import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import socketio
+from socketio import packet as sio_packet
 
 from ..models.orderbook import OrderbookManager
 
@@ -28,7 +33,7 @@ class WebSocketState(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderbookUpdate:
     """Represents an orderbook update from WebSocket"""
 
@@ -36,9 +41,10 @@ class OrderbookUpdate:
     bids: List[tuple]  # [(price, size), ...]
     asks: List[tuple]  # [(price, size), ...]
     timestamp: datetime
+    timestamp_ms: Optional[int] = None  # Epoch millis, taken from the raw payload when numeric
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceUpdate:
     """Represents a price update from WebSocket (AMM markets)"""
 
@@ -49,7 +55,7 @@ class PriceUpdate:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionUpdate:
     """Represents a position update from WebSocket"""
 
@@ -61,7 +67,7 @@ class PositionUpdate:
     market_type: str  # "AMM" or "CLOB"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Represents a trade/fill event (compatible with Polymarket Trade)"""
 
@@ -83,6 +89,77 @@ class Trade:
 TradeCallback = Callable[["Trade"], None]
 
 
+class _OrjsonCodec:
+    """json-module shim over orjson for Socket.IO packets"""
+
+    def __init__(self, orjson_module):
+        self._orjson = orjson_module
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        try:
+            # orjson output is already compact, matching separators=(",", ":")
+            return self._orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson cannot encode integers wider than 64 bits
+            return json.dumps(obj, **kwargs)
+
+    def loads(self, data: Any) -> Any:
+        return self._orjson.loads(data)
+
+
+@lru_cache(maxsize=None)
+def _packet_class(use_orjson: bool) -> Any:
+    """Socket.IO packet class, decoding with orjson if requested and installed"""
+    if not use_orjson:
+        return "default"
+    try:
+        import orjson
+    except ImportError:
+        return "default"
+
+    class OrjsonPacket(sio_packet.Packet):
+        json = _OrjsonCodec(orjson)
+
+    return OrjsonPacket
+
+
+_UTC = timezone.utc
+_fromisoformat = datetime.fromisoformat
+_fromtimestamp = datetime.fromtimestamp
+_now = datetime.now
+
+
+def _parse_timestamp(ts: Any) -> datetime:
+    """Parse a WS timestamp (ISO string, unix seconds or millis); now() if missing"""
+    ts_type = type(ts)
+    if ts_type is str:
+        # Slice off a trailing Z rather than scanning the string with replace()
+        return _fromisoformat(ts[:-1] + "+00:00" if ts[-1:] == "Z" else ts)
+    if ts_type is int or ts_type is float:
+        return _fromtimestamp(ts / 1000 if ts > 1e12 else ts, _UTC)
+    return _now(_UTC)
+
+
+def _timestamp_ms(ts: Any, parsed: datetime) -> int:
+    """Epoch millis for a WS timestamp, straight from numeric payloads (no datetime round-trip)"""
+    ts_type = type(ts)
+    if ts_type is int or ts_type is float:
+        return int(ts) if ts > 1e12 else int(ts * 1000)
+    return int(parsed.timestamp() * 1000)
+
+
+# round(1 - p, 3) for every price on the 0.001 tick grid
+_NO_PRICE: Dict[float, float] = {i / 1000: round(1 - i / 1000, 3) for i in range(1001)}
+
+
+def _invert_levels(levels: List[tuple]) -> List[tuple]:
+    """Map Yes-side (price, size) levels to the No side, reversing their sort order."""
+    try:
+        return [(_NO_PRICE[price], size) for price, size in levels]
+    except KeyError:
+        return [(round(1 - price, 3), size) for price, size in levels]
+
+
 class LimitlessWebSocket:
     """
     Limitless WebSocket client for real-time market data.
@@ -97,6 +174,11 @@ class LimitlessWebSocket:
         ws.on_orderbook(callback)
         ws.subscribe_market("market-slug")
         ws.start()
+
+    With config {"bypass_parsing": True}, orderbook/price/position callbacks
+    receive the raw Socket.IO payload dict instead of the parsed dataclass.
+    With {"coalesce_orderbooks": True}, a slow orderbook consumer only sees the
+    newest snapshot per market; snapshots superseded while it runs are dropped.
     """
 
     WS_URL = "wss://ws.limitless.exchange"
@@ -106,6 +188,19 @@ class LimitlessWebSocket:
         self.config = config or {}
         self.verbose = self.config.get("verbose", False)
         self.session_cookie = self.config.get("session_cookie")
+        # Run the background loop on uvloop when it is installed (optional dependency)
+        self.use_uvloop = self.config.get("use_uvloop", True)
+        # Deliver raw payload dicts to orderbook/price/position callbacks (no dataclass parse)
+        self.bypass_parsing = self.config.get("bypass_parsing", False)
+        # Decode Socket.IO packets with orjson (optional dependency). Opt-in: orjson
+        # decodes integers wider than 64 bits as floats, so numeric token IDs lose precision
+        self.use_orjson = self.config.get("use_orjson", False)
+        # Latest-wins orderbook delivery: snapshots arriving while callbacks for the
+        # same slug are still running collapse into the newest one
+        self.coalesce_orderbooks = self.config.get("coalesce_orderbooks", False)
+        # CPU(s) to pin the start() worker thread to (Linux only); ideally the core
+        # that also services the NIC IRQ for this connection (/proc/irq/*/smp_affinity)
+        self.cpu_affinity: Optional[Union[int, List[int]]] = self.config.get("cpu_affinity")
 
         # Socket.IO client
         self.sio = socketio.AsyncClient(
@@ -115,23 +210,33 @@ class LimitlessWebSocket:
             reconnection_delay_max=30,
             logger=False,
             engineio_logger=False,
+            serializer=_packet_class(self.use_orjson),
         )
 
         # State
         self.state = WebSocketState.DISCONNECTED
-        self._subscribed_slugs: List[str] = []
-        self._subscribed_addresses: List[str] = []
-
-        # Callbacks
-        self._orderbook_callbacks: List[Callable[[OrderbookUpdate], None]] = []
-        self._price_callbacks: List[Callable[[PriceUpdate], None]] = []
-        self._position_callbacks: List[Callable[[PositionUpdate], None]] = []
+        # Insertion-ordered sets (dict keys): O(1) add/remove, stable payload order
+        self._subscribed_slugs: Dict[str, None] = {}
+        self._subscribed_addresses: Dict[str, None] = {}
+        # Subscription changes are coalesced into one emit per event-loop tick
+        self._subscription_dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # Per-slug latest snapshot, wake-up event and dispatcher (coalesce_orderbooks)
+        self._latest_by_slug: Dict[str, Any] = {}
+        self._orderbook_ready: Dict[str, asyncio.Event] = {}
+        self._orderbook_dispatchers: Dict[str, asyncio.Task] = {}
+
+        # Callbacks as (callback, is_coroutine_function), classified once at registration
+        self._orderbook_callbacks: List[Tuple[Callable[[OrderbookUpdate], Any], bool]] = []
+        self._price_callbacks: List[Tuple[Callable[[PriceUpdate], Any], bool]] = []
+        self._position_callbacks: List[Tuple[Callable[[PositionUpdate], Any], bool]] = []
         self._error_callbacks: List[Callable[[str], None]] = []
 
         # Event loop (public for compatibility with exchange_client)
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
-        self._ready = threading.Event()  # Signals when connection is ready
+        # Set by disconnect(); created per connection on the loop that awaits it
+        self._closed: Optional[asyncio.Event] = None
 
         # Orderbook manager for compatibility with exchange_client
         self.orderbook_manager = OrderbookManager()
@@ -144,6 +249,15 @@ class LimitlessWebSocket:
 
     def _setup_handlers(self):
         """Setup Socket.IO event handlers"""
+        # Bound once and closed over: the hot handlers below skip per-message
+        # attribute lookups (callback lists are only ever mutated in place)
+        run_callbacks = self._run_callbacks
+        orderbook_callbacks = self._orderbook_callbacks
+        price_callbacks = self._price_callbacks
+        position_callbacks = self._position_callbacks
+        parse_orderbook = self._parse_orderbook_update
+        parse_price = self._parse_price_update
+        parse_positions = self._parse_position_updates
 
         @self.sio.on("connect", namespace=self.NAMESPACE)
         async def on_connect():
@@ -160,66 +274,51 @@ class LimitlessWebSocket:
             if self.verbose:
                 logger.info("Disconnected from Limitless WebSocket")
 
-        @self.sio.on("orderbookUpdate", namespace=self.NAMESPACE)
         async def on_orderbook_update(data):
             try:
-                update = self._parse_orderbook_update(data)
+                if self.bypass_parsing:
+                    if self.coalesce_orderbooks:
+                        self._post_orderbook(data.get("marketSlug", data.get("slug", "")), data)
+                        return
+                    await run_callbacks(orderbook_callbacks, data, "Orderbook")
+                    return
+                update = parse_orderbook(data)
                 if update:
-                    for callback in self._orderbook_callbacks:
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(update)
-                            else:
-                                callback(update)
-                        except Exception as e:
-                            if self.verbose:
-                                logger.error(f"Orderbook callback error: {e}")
+                    if self.coalesce_orderbooks:
+                        self._post_orderbook(update.slug, update)
+                        return
+                    await run_callbacks(orderbook_callbacks, update, "Orderbook")
             except Exception as e:
                 if self.verbose:
                     logger.error(f"Error parsing orderbook update: {e}")
 
-        @self.sio.on("newPriceData", namespace=self.NAMESPACE)
         async def on_price_update(data):
             try:
-                update = self._parse_price_update(data)
+                if self.bypass_parsing:
+                    await run_callbacks(price_callbacks, data, "Price")
+                    return
+                update = parse_price(data)
                 if update:
-                    for callback in self._price_callbacks:
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(update)
-                            else:
-                                callback(update)
-                        except Exception as e:
-                            if self.verbose:
-                                logger.error(f"Price callback error: {e}")
+                    await run_callbacks(price_callbacks, update, "Price")
             except Exception as e:
                 if self.verbose:
                     logger.error(f"Error parsing price update: {e}")
 
-        @self.sio.on("positions", namespace=self.NAMESPACE)
         async def on_position_update(data):
             try:
-                updates = self._parse_position_updates(data)
-                for update in updates:
-                    for callback in self._position_callbacks:
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(update)
-                            else:
-                                callback(update)
-                        except Exception as e:
-                            if self.verbose:
-                                logger.error(f"Position callback error: {e}")
+                if self.bypass_parsing:
+                    await run_callbacks(position_callbacks, data, "Position")
+                    return
+                for update in parse_positions(data):
+                    await run_callbacks(position_callbacks, update, "Position")
             except Exception as e:
                 if self.verbose:
                     logger.error(f"Error parsing position update: {e}")
 
-        @self.sio.on("authenticated", namespace=self.NAMESPACE)
         async def on_authenticated(data):
             if self.verbose:
                 logger.info("Authenticated with Limitless WebSocket")
 
-        @self.sio.on("exception", namespace=self.NAMESPACE)
         async def on_exception(data):
             error_msg = str(data)
             if self.verbose:
@@ -230,11 +329,97 @@ class LimitlessWebSocket:
                 except Exception:
                     pass
 
-        @self.sio.on("system", namespace=self.NAMESPACE)
         async def on_system(data):
             if self.verbose:
                 logger.debug(f"System message: {data}")
 
+        # Server event -> handler; shared by Socket.IO registration and _dispatch
+        self._event_handlers: Dict[str, Callable[[Any], Any]] = {
+            "orderbookUpdate": on_orderbook_update,
+            "newPriceData": on_price_update,
+            "positions": on_position_update,
+            "authenticated": on_authenticated,
+            "exception": on_exception,
+            "system": on_system,
+        }
+        for event, handler in self._event_handlers.items():
+            self.sio.on(event, handler, namespace=self.NAMESPACE)
+
+    async def _dispatch(self, event: str, data: Any):
+        """Route a server event to its handler (used by transports other than python-socketio)"""
+        handler = self._event_handlers.get(event)
+        if handler is not None:
+            await handler(data)
+
+    async def _run_callbacks(
+        self, callbacks: List[Tuple[Callable[[Any], Any], bool]], update: Any, kind: str
+    ):
+        """Invoke callbacks in registration order, awaiting the async ones"""
+        for callback, is_async in callbacks:
+            try:
+                if is_async:
+                    await callback(update)
+                else:
+                    callback(update)
+            except Exception as e:
+                if self.verbose:
+                    logger.error(f"{kind} callback error: {e}")
+
+    def _post_orderbook(self, slug: str, update: Any):
+        """Store the newest snapshot for a slug and wake its dispatcher"""
+        self._latest_by_slug[slug] = update
+        ready = self._orderbook_ready.get(slug)
+        if ready is None:
+            ready = self._orderbook_ready[slug] = asyncio.Event()
+            self._orderbook_dispatchers[slug] = asyncio.get_running_loop().create_task(
+                self._orderbook_dispatcher(slug, ready)
+            )
+        ready.set()
+
+    async def _orderbook_dispatcher(self, slug: str, ready: asyncio.Event):
+        """Deliver only the latest snapshot for a slug each time callbacks are free"""
+        latest = self._latest_by_slug
+        while True:
+            await ready.wait()
+            ready.clear()
+            update = latest.pop(slug, None)
+            if update is not None:
+                await self._run_callbacks(self._orderbook_callbacks, update, "Orderbook")
+
+    def _cancel_orderbook_dispatchers(self):
+        """Stop per-slug dispatchers and drop undelivered snapshots"""
+        for task in self._orderbook_dispatchers.values():
+            task.cancel()
+        self._orderbook_dispatchers.clear()
+        self._orderbook_ready.clear()
+        self._latest_by_slug.clear()
+
+    @staticmethod
+    def _parse_levels(levels: Any) -> List[tuple]:
+        """Parse [{"price", "size"}, ...] into (price, size) tuples, dropping price <= 0"""
+        # Fast path trusts the server schema: subscripts instead of .get(), and a
+        # single exception frame for the whole book rather than one per level
+        try:
+            return [
+                (price, float(level["size"]))
+                for level in levels
+                if (price := float(level["price"])) > 0
+            ]
+        except (KeyError, ValueError, TypeError, AttributeError):
+            pass
+
+        # Missing field or malformed level somewhere: parse one by one with defaults
+        parsed = []
+        for level in levels:
+            try:
+                price = float(level.get("price", 0))
+                size = float(level.get("size", 0))
+            except (ValueError, TypeError, AttributeError):
+                continue
+            if price > 0:
+                parsed.append((price, size))
+        return parsed
+
     def _parse_orderbook_update(self, data: Dict[str, Any]) -> Optional[OrderbookUpdate]:
         """Parse orderbook update from WebSocket"""
         try:
@@ -245,46 +430,22 @@ class LimitlessWebSocket:
             # Handle nested orderbook structure
             orderbook_data = data.get("orderbook", data)
 
-            # Parse bids
-            bids = []
-            for bid in orderbook_data.get("bids", []):
-                try:
-                    price = float(bid.get("price", 0))
-                    size = float(bid.get("size", 0))
-                    if price > 0:
-                        bids.append((price, size))
-                except (ValueError, TypeError):
-                    continue
-
-            # Parse asks
-            asks = []
-            for ask in orderbook_data.get("asks", []):
-                try:
-                    price = float(ask.get("price", 0))
-                    size = float(ask.get("size", 0))
-                    if price > 0:
-                        asks.append((price, size))
-                except (ValueError, TypeError):
-                    continue
+            bids = self._parse_levels(orderbook_data.get("bids", ()))
+            asks = self._parse_levels(orderbook_data.get("asks", ()))
 
             # Sort bids descending, asks ascending
             bids.sort(reverse=True)
             asks.sort()
 
-            # Parse timestamp
-            ts = data.get("timestamp")
-            if isinstance(ts, str):
-                timestamp = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            elif isinstance(ts, (int, float)):
-                timestamp = datetime.fromtimestamp(ts / 1000 if ts > 1e12 else ts, tz=timezone.utc)
-            else:
-                timestamp = datetime.now(timezone.utc)
+            raw_ts = data.get("timestamp")
+            timestamp = _parse_timestamp(raw_ts)
 
             return OrderbookUpdate(
                 slug=market_slug,
                 bids=bids,
                 asks=asks,
                 timestamp=timestamp,
+                timestamp_ms=_timestamp_ms(raw_ts, timestamp),
             )
         except Exception as e:
             if self.verbose:
@@ -298,17 +459,19 @@ class LimitlessWebSocket:
             if not market_address:
                 return None
 
-            prices = data.get("updatedPrices", {})
-            yes_price = float(prices.get("yes", 0))
-            no_price = float(prices.get("no", 0))
+            # Fast path: AMM feeds always carry both prices
+            try:
+                prices = data["updatedPrices"]
+                yes_price = float(prices["yes"])
+                no_price = float(prices["no"])
+            except KeyError:
+                prices = data.get("updatedPrices", {})
+                yes_price = float(prices.get("yes", 0))
+                no_price = float(prices.get("no", 0))
 
             block_number = int(data.get("blockNumber", 0))
 
-            ts = data.get("timestamp")
-            if isinstance(ts, str):
-                timestamp = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            else:
-                timestamp = datetime.now(timezone.utc)
+            timestamp = _parse_timestamp(data.get("timestamp"))
 
             return PriceUpdate(
                 market_address=market_address,
@@ -354,25 +517,51 @@ class LimitlessWebSocket:
         if self._subscribed_slugs or self._subscribed_addresses:
             await self._send_subscription()
 
+    def _schedule_subscription_flush(self):
+        """Mark subscriptions dirty and schedule a single flush on the running loop"""
+        self._subscription_dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_subscriptions())
+
+    async def _flush_subscriptions(self):
+        """Send the current subscription set once for all changes since the last flush"""
+        # Loop: changes made while an emit is in flight are picked up by this same task
+        while self._subscription_dirty and self.state == WebSocketState.CONNECTED:
+            self._subscription_dirty = False
+            try:
+                await self._send_subscription()
+            except Exception as e:
+                if self.verbose:
+                    logger.error(f"Failed to send subscription: {e}")
+
     async def _send_subscription(self):
         """Send subscription message to server"""
         payload = {}
         if self._subscribed_addresses:
-            payload["marketAddresses"] = self._subscribed_addresses
+            payload["marketAddresses"] = list(self._subscribed_addresses)
         if self._subscribed_slugs:
-            payload["marketSlugs"] = self._subscribed_slugs
+            payload["marketSlugs"] = list(self._subscribed_slugs)
 
         if payload:
-            await self.sio.emit("subscribe_market_prices", payload, namespace=self.NAMESPACE)
+            await self._emit("subscribe_market_prices", payload)
             if self.verbose:
                 logger.debug(f"Subscribed to markets: {payload}")
 
+    async def _emit(self, event: str, payload: Any):
+        """Send an event to the markets namespace"""
+        await self.sio.emit(event, payload, namespace=self.NAMESPACE)
+
+    def _is_open(self) -> bool:
+        """Whether the underlying transport is open"""
+        return self.sio.connected
+
     async def connect(self):
         """Connect to Limitless WebSocket"""
         if self.state == WebSocketState.CONNECTED:
             return
 
         self.state = WebSocketState.CONNECTING
+        self._closed = asyncio.Event()
 
         headers = {}
         if self.session_cookie:
@@ -385,7 +574,6 @@ class LimitlessWebSocket:
                 transports=["websocket"],
                 headers=headers,
             )
-            self._ready.set()  # Signal that connection is ready
         except Exception as e:
             self.state = WebSocketState.DISCONNECTED
             raise ConnectionError(f"Failed to connect to Limitless WebSocket: {e}")
@@ -393,6 +581,9 @@ class LimitlessWebSocket:
     async def disconnect(self):
         """Disconnect from Limitless WebSocket"""
         self.state = WebSocketState.CLOSED
+        if self._closed is not None:
+            self._closed.set()
+        self._cancel_orderbook_dispatchers()
         if self.sio.connected:
             await self.sio.disconnect()
 
@@ -401,9 +592,18 @@ class LimitlessWebSocket:
         await self.disconnect()
 
     async def _receive_loop(self):
-        """Wait for Socket.IO events (Socket.IO handles receiving internally)"""
-        while self.state == WebSocketState.CONNECTED and self.sio.connected:
-            await asyncio.sleep(0.1)
+        """
+        Wait until disconnect() is called.
+
+        Socket.IO receives events and reconnects internally, so there is nothing
+        to poll; this just parks the caller without periodic wake-ups.
+
+        Unlike the old polling loop, a transport drop does not end the wait:
+        Socket.IO reconnects and resubscribes on its own, and callers awaiting
+        this (exchange_client's market WebSocket) keep running until disconnect().
+        """
+        if self._closed is not None:
+            await self._closed.wait()
 
     async def subscribe_market(self, market_slug: str):
         """
@@ -412,11 +612,10 @@ class LimitlessWebSocket:
         Args:
             market_slug: Market slug (e.g., "btc-above-100k")
         """
-        if market_slug not in self._subscribed_slugs:
-            self._subscribed_slugs.append(market_slug)
+        self._subscribed_slugs[market_slug] = None
 
         if self.state == WebSocketState.CONNECTED:
-            await self._send_subscription()
+            self._schedule_subscription_flush()
 
     async def subscribe_market_address(self, market_address: str):
         """
@@ -425,41 +624,38 @@ class LimitlessWebSocket:
         Args:
             market_address: Market contract address
         """
-        if market_address not in self._subscribed_addresses:
-            self._subscribed_addresses.append(market_address)
+        self._subscribed_addresses[market_address] = None
 
         if self.state == WebSocketState.CONNECTED:
-            await self._send_subscription()
+            self._schedule_subscription_flush()
 
     async def unsubscribe_market(self, market_slug: str):
         """Unsubscribe from a CLOB market"""
-        if market_slug in self._subscribed_slugs:
-            self._subscribed_slugs.remove(market_slug)
+        self._subscribed_slugs.pop(market_slug, None)
 
         if self.state == WebSocketState.CONNECTED:
-            await self._send_subscription()
+            self._schedule_subscription_flush()
 
     async def unsubscribe_market_address(self, market_address: str):
         """Unsubscribe from an AMM market"""
-        if market_address in self._subscribed_addresses:
-            self._subscribed_addresses.remove(market_address)
+        self._subscribed_addresses.pop(market_address, None)
 
         if self.state == WebSocketState.CONNECTED:
-            await self._send_subscription()
+            self._schedule_subscription_flush()
 
     def on_orderbook(self, callback: Callable[[OrderbookUpdate], None]) -> "LimitlessWebSocket":
         """Register callback for orderbook updates"""
-        self._orderbook_callbacks.append(callback)
+        self._orderbook_callbacks.append((callback, asyncio.iscoroutinefunction(callback)))
         return self
 
     def on_price(self, callback: Callable[[PriceUpdate], None]) -> "LimitlessWebSocket":
         """Register callback for price updates (AMM)"""
-        self._price_callbacks.append(callback)
+        self._price_callbacks.append((callback, asyncio.iscoroutinefunction(callback)))
         return self
 
     def on_position(self, callback: Callable[[PositionUpdate], None]) -> "LimitlessWebSocket":
         """Register callback for position updates"""
-        self._position_callbacks.append(callback)
+        self._position_callbacks.append((callback, asyncio.iscoroutinefunction(callback)))
         return self
 
     def on_error(self, callback: Callable[[str], None]) -> "LimitlessWebSocket":
@@ -467,6 +663,17 @@ class LimitlessWebSocket:
         self._error_callbacks.append(callback)
         return self
 
+    def _new_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Create the background event loop, preferring uvloop if available."""
+        if self.use_uvloop:
+            try:
+                import uvloop
+            except ImportError:
+                pass
+            else:
+                return uvloop.new_event_loop()
+        return asyncio.new_event_loop()
+
     def start(self, timeout: float = 5.0) -> threading.Thread:
         """
         Start WebSocket connection in background thread.
@@ -480,34 +687,61 @@ class LimitlessWebSocket:
         Raises:
             ConnectionError: If connection is not established within timeout
         """
-        self.loop = asyncio.new_event_loop()
-        self._ready.clear()
-
-        async def _run():
-            await self.connect()
-            # Keep running until disconnected
-            while self.state != WebSocketState.CLOSED:
-                await asyncio.sleep(1)
+        loop = self._new_event_loop()
+        self.loop = loop
 
         def _thread_target():
-            asyncio.set_event_loop(self.loop)
+            self._apply_cpu_affinity()
+            asyncio.set_event_loop(loop)
             try:
-                self.loop.run_until_complete(_run())
+                loop.run_forever()
             except Exception as e:
                 if self.verbose:
                     logger.error(f"WebSocket thread error: {e}")
             finally:
-                self.loop.close()
+                loop.close()
 
         self._thread = threading.Thread(target=_thread_target, daemon=True)
         self._thread.start()
 
-        # Wait for connection to be ready
-        if not self._ready.wait(timeout=timeout):
-            raise ConnectionError(f"WebSocket connection not established within {timeout}s")
+        # Connect from this thread so connect() errors propagate to the caller as-is
+        future = asyncio.run_coroutine_threadsafe(self.connect(), loop)
+        try:
+            future.result(timeout=timeout)
+        except BaseException as e:
+            future.cancel()
+            self._stop_loop()
+            if isinstance(e, concurrent.futures.TimeoutError):
+                raise ConnectionError(
+                    f"WebSocket connection not established within {timeout}s"
+                ) from e
+            raise
 
         return self._thread
 
+    def _apply_cpu_affinity(self):
+        """Pin the calling thread to config["cpu_affinity"] where the OS supports it"""
+        if self.cpu_affinity is None:
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            if self.verbose:
+                logger.warning("cpu_affinity is only supported on Linux; ignoring")
+            return
+        cpus = {self.cpu_affinity} if isinstance(self.cpu_affinity, int) else set(self.cpu_affinity)
+        try:
+            # pid 0 applies to the calling thread only
+            os.sched_setaffinity(0, cpus)
+        except OSError as e:
+            logger.warning(f"Failed to set CPU affinity {sorted(cpus)}: {e}")
+
+    def _stop_loop(self):
+        """Stop the background event loop (its thread closes it on exit)"""
+        if self.loop and not self.loop.is_closed():
+            try:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+            except RuntimeError:
+                pass  # Loop closed concurrently
+
     def get_orderbook_manager(self) -> OrderbookManager:
         """
         Get the orderbook manager for compatibility with exchange_client.
@@ -538,35 +772,34 @@ class LimitlessWebSocket:
         yes_token = asset_ids[0] if asset_ids else None
         no_token = asset_ids[1] if len(asset_ids) > 1 else None
 
+        update_levels = self.orderbook_manager.update_levels
+
         # Create callback that updates orderbook_manager
         def on_orderbook_update(update: OrderbookUpdate):
-            ts = int(update.timestamp.timestamp() * 1000)
+            if isinstance(update, dict):
+                # bypass_parsing delivers raw payloads; the manager needs parsed levels
+                update = self._parse_orderbook_update(update)
+                if update is None:
+                    return
+            ts = update.timestamp_ms
+            if ts is None:
+                ts = int(update.timestamp.timestamp() * 1000)
 
             # Yes token gets original orderbook
             if yes_token:
-                yes_orderbook = {
-                    "bids": update.bids,
-                    "asks": update.asks,
-                    "timestamp": ts,
-                    "market_id": update.slug,
-                }
-                self.orderbook_manager.update(yes_token, yes_orderbook)
+                update_levels(yes_token, update.bids, update.asks, ts, update.slug)
 
             # No token gets inverted orderbook
             # No bids = 1 - Yes asks, No asks = 1 - Yes bids
             if no_token:
-                no_bids = [(round(1 - price, 3), size) for price, size in update.asks]
-                no_asks = [(round(1 - price, 3), size) for price, size in update.bids]
-                # Re-sort after inversion
-                no_bids.sort(reverse=True)
-                no_asks.sort()
-                no_orderbook = {
-                    "bids": no_bids,
-                    "asks": no_asks,
-                    "timestamp": ts,
-                    "market_id": update.slug,
-                }
-                self.orderbook_manager.update(no_token, no_orderbook)
+                # update.asks/bids arrive sorted from _parse_orderbook_update
+                update_levels(
+                    no_token,
+                    _invert_levels(update.asks),
+                    _invert_levels(update.bids),
+                    ts,
+                    update.slug,
+                )
 
             if callback:
                 callback(market_id, {"bids": update.bids, "asks": update.asks})
@@ -581,7 +814,7 @@ class LimitlessWebSocket:
         Args:
             timeout: Seconds to wait for disconnect and thread cleanup
         """
-        if self.loop and self.sio.connected:
+        if self.loop and self._is_open():
             future = asyncio.run_coroutine_threadsafe(self.disconnect(), self.loop)
             try:
                 future.result(timeout=timeout)
@@ -589,12 +822,184 @@ class LimitlessWebSocket:
                 pass  # Ignore timeout/errors during shutdown
 
         if self._thread and self._thread.is_alive():
+            self._stop_loop()
             self._thread.join(timeout=timeout)
 
     @property
     def connected(self) -> bool:
         """Check if connected"""
-        return self.state == WebSocketState.CONNECTED and self.sio.connected
+        return self.state == WebSocketState.CONNECTED and self._is_open()
+
+
+class RawLimitlessWebSocket(LimitlessWebSocket):
+    """
+    Limitless market-data WebSocket speaking Socket.IO frames directly over aiohttp.
+
+    Skips python-socketio's client state machine: text frames are matched by
+    prefix (e.g. '42/markets,["orderbookUpdate",{...}]') and the payload is
+    decoded once before dispatch. Covers the Engine.IO v4 open/ping/close
+    packets and Socket.IO v5 namespace connect/event packets used by this
+    client; binary packets and acks are not supported.
+
+    There is no automatic reconnection: when the socket drops the client goes to
+    DISCONNECTED and the caller must call connect() again (subscriptions are
+    restored on reconnect).
+
+    Requires aiohttp (pip install "dr-manhattan[aiohttp]"). Otherwise usage is the
+    same as LimitlessWebSocket.
+    """
+
+    ENGINEIO_PATH = "/socket.io/?EIO=4&transport=websocket"
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "RawLimitlessWebSocket requires aiohttp; "
+                'install it with pip install "dr-manhattan[aiohttp]".'
+            ) from exc
+
+        super().__init__(config)
+        self._http: Any = None  # aiohttp.ClientSession
+        self._raw_ws: Any = None  # aiohttp.ClientWebSocketResponse
+        self._reader_task: Optional[asyncio.Task] = None
+        self._event_prefix = f"42{self.NAMESPACE},"
+        self._loads = self._json_loads()
+
+    def _json_loads(self) -> Callable[[str], Any]:
+        """Frame payload decoder (orjson when use_orjson is set and installed)"""
+        if self.use_orjson:
+            try:
+                import orjson
+            except ImportError:
+                pass
+            else:
+                return orjson.loads
+        return json.loads
+
+    def _is_open(self) -> bool:
+        return self._raw_ws is not None and not self._raw_ws.closed
+
+    async def _emit(self, event: str, payload: Any):
+        frame = json.dumps([event, payload], separators=(",", ":"))
+        await self._raw_ws.send_str(self._event_prefix + frame)
+
+    async def connect(self):
+        """Open the WebSocket and complete the Engine.IO / namespace handshake"""
+        if self.state == WebSocketState.CONNECTED:
+            return
+
+        import aiohttp
+
+        self.state = WebSocketState.CONNECTING
+        self._closed = asyncio.Event()
+
+        headers = {}
+        if self.session_cookie:
+            headers["Cookie"] = f"limitless_session={self.session_cookie}"
+
+        try:
+            self._http = aiohttp.ClientSession(headers=headers)
+            self._raw_ws = await self._http.ws_connect(self.WS_URL + self.ENGINEIO_PATH)
+
+            # Engine.IO open packet: 0{"sid": ..., "pingInterval": ...}
+            frame = await self._raw_ws.receive_str()
+            if not frame.startswith("0"):
+                raise ConnectionError(f"Unexpected Engine.IO open packet: {frame[:100]}")
+
+            # Socket.IO namespace connect, answered by 40/markets,{...} or 44/markets,{error}
+            await self._raw_ws.send_str(f"40{self.NAMESPACE},")
+            while True:
+                frame = await self._raw_ws.receive_str()
+                if frame == "2":
+                    await self._raw_ws.send_str("3")
+                elif frame.startswith(f"40{self.NAMESPACE}"):
+                    break
+                elif frame.startswith(f"44{self.NAMESPACE}"):
+                    raise ConnectionError(
+                        f"Namespace connect refused: {frame[len(self.NAMESPACE) + 3 :]}"
+                    )
+        except Exception as e:
+            await self._close_transport()
+            self.state = WebSocketState.DISCONNECTED
+            raise ConnectionError(f"Failed to connect to Limitless WebSocket: {e}") from e
+
+        self.state = WebSocketState.CONNECTED
+        if self.verbose:
+            logger.info("Connected to Limitless WebSocket (raw transport)")
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_frames())
+        await self._resubscribe()
+
+    async def _read_frames(self):
+        """Receive text frames until the socket closes"""
+        from aiohttp import WSMsgType
+
+        handle = self._handle_frame
+        stop_types = (WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED, WSMsgType.ERROR)
+        try:
+            while True:
+                msg = await self._raw_ws.receive()
+                if msg.type == WSMsgType.TEXT:
+                    await handle(msg.data)
+                elif msg.type in stop_types:
+                    break
+        finally:
+            if self.state != WebSocketState.CLOSED:
+                self.state = WebSocketState.DISCONNECTED
+                if self.verbose:
+                    logger.info("Disconnected from Limitless WebSocket")
+
+    async def _handle_frame(self, frame: str):
+        """Decode one Engine.IO text frame and dispatch Socket.IO events"""
+        if frame.startswith(self._event_prefix):
+            body = frame[len(self._event_prefix) :]
+            # Skip an optional ack id between the namespace and the JSON array
+            if body[:1] != "[":
+                body = body[body.find("[") :]
+            try:
+                packet = self._loads(body)
+            except ValueError as e:
+                if self.verbose:
+                    logger.error(f"Malformed event frame: {e}")
+                return
+            if packet:
+                await self._dispatch(packet[0], packet[1] if len(packet) > 1 else None)
+        elif frame == "2":
+            await self._raw_ws.send_str("3")
+        elif frame == "1" or frame.startswith(f"41{self.NAMESPACE}"):
+            self.state = WebSocketState.DISCONNECTED
+
+    async def _close_transport(self):
+        """Close the WebSocket and HTTP session, ignoring shutdown errors"""
+        if self._raw_ws is not None:
+            try:
+                await self._raw_ws.close()
+            except Exception:
+                pass
+            self._raw_ws = None
+        if self._http is not None:
+            try:
+                await self._http.close()
+            except Exception:
+                pass
+            self._http = None
+
+    async def disconnect(self):
+        """Leave the namespace and close the socket"""
+        self.state = WebSocketState.CLOSED
+        if self._closed is not None:
+            self._closed.set()
+        self._cancel_orderbook_dispatchers()
+        if self._is_open():
+            try:
+                await self._raw_ws.send_str(f"41{self.NAMESPACE},")
+            except Exception:
+                pass
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        await self._close_transport()
 
 
 class LimitlessUserWebSocket(LimitlessWebSocket):
@@ -654,6 +1059,6 @@ class LimitlessUserWebSocket(LimitlessWebSocket):
         if market_addresses:
             payload["marketAddresses"] = market_addresses
 
-        await self.sio.emit("subscribe_positions", payload, namespace=self.NAMESPACE)
+        await self._emit("subscribe_positions", payload)
         if self.verbose:
             logger.debug(f"Subscribed to position updates: {payload}")
@@ -1,7 +1,26 @@
 import json
-from dataclasses import dataclass
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence
+from functools import partial
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import requests
 from opinion_clob_sdk import Client as OpinionClient
@@ -9,6 +28,7 @@ from opinion_clob_sdk import TopicStatus, TopicStatusFilter, TopicType
 from opinion_clob_sdk.chain.py_order_utils.model.order import PlaceOrderDataInput
 from opinion_clob_sdk.chain.py_order_utils.model.order_type import LIMIT_ORDER, MARKET_ORDER
 from opinion_clob_sdk.chain.py_order_utils.model.sides import BUY, SELL
+from requests.adapters import HTTPAdapter
 
 from ..base.errors import (
     AuthenticationError,
@@ -22,9 +42,26 @@ from ..base.exchange import Exchange
 from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus
 from ..models.position import Position
-
-
-@dataclass
+from ..utils.decoding import orjson_loads
+from ..utils.market_cache import cached_on_market, freeze
+
+_UTC = timezone.utc
+_MISSING = object()  # getattr default that None-valued attributes cannot collide with
+# Unix seconds that fit datetime64[ns] (1677-2262), the DataFrame timestamp dtype
+_EPOCH_MIN = -(2**63 // 10**9)
+_EPOCH_MAX = (2**63 - 1) // 10**9
+
+_from_epoch = partial(datetime.fromtimestamp, tz=_UTC)
+# type(timestamp) -> parser for Opinion._parse_datetime
+_DATETIME_PARSERS: Dict[type, Callable[[Any], datetime]] = {
+    str: datetime.fromisoformat,
+    int: _from_epoch,
+    float: _from_epoch,
+    datetime: lambda value: value,
+}
+
+
+@dataclass(slots=True)
 class PricePoint:
     """Represents a single price history point"""
 
@@ -33,7 +70,7 @@ class PricePoint:
     raw: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class PublicTrade:
     """Represents a public trade from Opinion"""
 
@@ -50,7 +87,7 @@ class PublicTrade:
     transaction_hash: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NAV:
     """Net Asset Value calculation result"""
 
@@ -71,6 +108,39 @@ class Opinion(Exchange):
     MULTISEND_ADDR = "0x998739BFdAAdde7C933B942a68053933098f9EDa"
 
     SUPPORTED_INTERVALS: Sequence[str] = ("1m", "1h", "1d", "1w", "max")
+    # Hashed view for validation; the tuple keeps its order for error messages
+    _INTERVAL_SET: frozenset[str] = frozenset(SUPPORTED_INTERVALS)
+    HTTP_POOL_SIZE = 32  # Keep-alive connections per host
+    MARKETS_PAGE_SIZE = 20  # API maximum for get_markets
+    IO_WORKERS = 8  # Threads overlapping independent SDK round-trips (orderbooks, NAV)
+    CACHE_MAX_ENTRIES = 512  # Orderbook/market TTL cache size (oldest evicted first)
+    _TICK_SCALE = 1000.0  # Prices per unit at Opinion's fixed 0.001 tick
+
+    _INT_STATUS_MAP: Dict[int, OrderStatus] = {
+        0: OrderStatus.PENDING,
+        1: OrderStatus.OPEN,
+        2: OrderStatus.FILLED,
+        3: OrderStatus.PARTIALLY_FILLED,
+        4: OrderStatus.CANCELLED,
+    }
+
+    _STR_STATUS_MAP: Dict[str, OrderStatus] = {
+        "pending": OrderStatus.PENDING,
+        "open": OrderStatus.OPEN,
+        "live": OrderStatus.OPEN,
+        "filled": OrderStatus.FILLED,
+        "matched": OrderStatus.FILLED,
+        "partially_filled": OrderStatus.PARTIALLY_FILLED,
+        "cancelled": OrderStatus.CANCELLED,
+        "canceled": OrderStatus.CANCELLED,
+        "rejected": OrderStatus.REJECTED,
+    }
+
+    # Metadata keys appended to the search text after the question and description
+    _SEARCH_EXTRA_KEYS = ("category", "tags", "topics", "categories")
+
+    # Topic status values, resolved once instead of per parsed market
+    _STATUS_RESOLVED = TopicStatus.RESOLVED.value
 
     @property
     def id(self) -> str:
@@ -92,6 +162,12 @@ class Opinion(Exchange):
                 - rpc_url: RPC endpoint (optional, defaults to public BSC RPC)
                 - host: API host URL (optional)
                 - chain_id: Chain ID (optional, defaults to 56 for BSC)
+                - http2: Send direct REST calls over one multiplexed HTTP/2
+                  connection (optional, requires httpx[http2])
+                - use_orjson: Decode REST responses with orjson when installed
+                  (optional; integers wider than 64 bits decode as floats)
+                - cache_ttl: Seconds to reuse get_orderbook/fetch_market results
+                  (optional, defaults to 0 = no caching)
         """
         super().__init__(config)
 
@@ -102,12 +178,67 @@ class Opinion(Exchange):
         self.host = self.config.get("host", self.BASE_URL)
         self.chain_id = self.config.get("chain_id", self.CHAIN_ID)
 
+        # Computed once and shared by every direct REST call (never mutated)
+        self._auth_headers: Dict[str, str] = (
+            {"Authorization": f"Bearer {self.api_key}", "X-API-Key": self.api_key}
+            if self.api_key
+            else {}
+        )
+        self._base_url = self.host.rstrip("/")
+
         self._client: Optional[OpinionClient] = None
+        self._session = self._create_session()
+        self.http2 = self.config.get("http2", False)
+        self._http = None  # httpx.Client, created on first request when http2 is set
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._balance_schema: Optional[str] = None  # key into _BALANCE_SCHEMAS, once seen
+        # (kind, key) -> (expiry, value); collapses bursts of identical reads
+        self.cache_ttl = float(self.config.get("cache_ttl", 0.0))
+        self._cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        # Response body decoder; None keeps the HTTP client's own .json()
+        self._loads: Optional[Callable[[bytes], Any]] = (
+            orjson_loads() if self.config.get("use_orjson", False) else None
+        )
 
         # Initialize client if credentials provided
         if self.api_key and self.private_key and self.multi_sig_addr:
             self._initialize_client()
 
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive session for direct REST calls, with auth headers set once."""
+        session = requests.Session()
+        # Retries are handled by _call_with_retry, not urllib3
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.HTTP_POOL_SIZE, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self._auth_headers)
+        return session
+
+    def _create_http2_client(self):
+        """Create an HTTP/2 httpx client for direct REST calls."""
+        try:
+            import httpx
+        except ImportError as exc:
+            raise RuntimeError("httpx[http2] is required when http2=True.") from exc
+
+        return httpx.Client(
+            base_url=self._base_url,
+            http2=True,
+            timeout=self.timeout,
+            headers=self._auth_headers,
+        )
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
+
     def _initialize_client(self):
         """Initialize Opinion CLOB client with authentication."""
         try:
@@ -131,6 +262,8 @@ class Opinion(Exchange):
 
     def _parse_market_id(self, market_id: str) -> int:
         """Safely parse market_id string to int."""
+        if type(market_id) is int:
+            return market_id
         try:
             return int(market_id)
         except (ValueError, TypeError):
@@ -138,65 +271,122 @@ class Opinion(Exchange):
 
     def _request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Any:
         """Make HTTP request to Opinion API with retry logic"""
+        if self.http2 and self._http is None:
+            self._http = self._create_http2_client()
 
-        @self._retry_on_failure
-        def _make_request():
-            url = f"{self.host}{endpoint}"
-            headers = {}
+        return self._call_with_retry(self._send_request, method, endpoint, params)
 
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                headers["X-API-Key"] = self.api_key
+    def _send_request(self, method: str, endpoint: str, params: Optional[Dict]) -> Any:
+        """Send one HTTP request (no retries), mapping transport errors to exchange errors."""
+        if self._http is not None:
+            return self._send_http2(method, endpoint, params)
 
-            try:
-                response = requests.request(
-                    method, url, params=params, headers=headers, timeout=self.timeout
-                )
+        try:
+            response = self._session.request(
+                method, self._base_url + endpoint, params=params, timeout=self.timeout
+            )
 
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
-
-                response.raise_for_status()
-                return response.json()
-            except requests.Timeout as e:
-                raise NetworkError(f"Request timeout: {e}")
-            except requests.ConnectionError as e:
-                raise NetworkError(f"Connection error: {e}")
-            except requests.HTTPError as e:
-                if response.status_code == 404:
-                    raise ExchangeError(f"Resource not found: {endpoint}")
-                elif response.status_code == 401:
-                    raise ExchangeError(f"Authentication failed: {e}")
-                elif response.status_code == 403:
-                    raise ExchangeError(f"Access forbidden: {e}")
-                else:
-                    raise ExchangeError(f"HTTP error: {e}")
-            except requests.RequestException as e:
-                raise ExchangeError(f"Request failed: {e}")
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 1))
+                raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+
+            response.raise_for_status()
+            return self._loads(response.content) if self._loads else response.json()
+        except requests.Timeout as e:
+            raise NetworkError(f"Request timeout: {e}")
+        except requests.ConnectionError as e:
+            raise NetworkError(f"Connection error: {e}")
+        except requests.HTTPError as e:
+            raise self._http_error(response.status_code, endpoint, e)
+        except requests.RequestException as e:
+            raise ExchangeError(f"Request failed: {e}")
+
+    def _send_http2(self, method: str, endpoint: str, params: Optional[Dict]) -> Any:
+        """Send one request over the httpx HTTP/2 client, mapping errors like _request."""
+        import httpx
 
-        return _make_request()
+        try:
+            response = self._http.request(method, endpoint, params=params)
+
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("Retry-After", 1))
+                raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
+
+            response.raise_for_status()
+            return self._loads(response.content) if self._loads else response.json()
+        except httpx.TimeoutException as e:
+            raise NetworkError(f"Request timeout: {e}")
+        except httpx.TransportError as e:
+            raise NetworkError(f"Connection error: {e}")
+        except httpx.HTTPStatusError as e:
+            raise self._http_error(e.response.status_code, endpoint, e)
+        except httpx.HTTPError as e:
+            raise ExchangeError(f"Request failed: {e}")
+
+    @staticmethod
+    def _http_error(status_code: int, endpoint: str, e: Exception) -> ExchangeError:
+        """Map an HTTP error status to an ExchangeError."""
+        if status_code == 404:
+            return ExchangeError(f"Resource not found: {endpoint}")
+        elif status_code == 401:
+            return ExchangeError(f"Authentication failed: {e}")
+        elif status_code == 403:
+            return ExchangeError(f"Access forbidden: {e}")
+        return ExchangeError(f"HTTP error: {e}")
 
     def _parse_market_response(self, response: Any, operation: str = "operation") -> Any:
         """Parse and validate market API response."""
-        if hasattr(response, "errno") and response.errno != 0:
+        if getattr(response, "errno", 0) != 0:
             raise ExchangeError(f"Failed to {operation}: {response}")
 
-        if hasattr(response, "result") and hasattr(response.result, "data"):
-            return response.result.data
+        data = getattr(getattr(response, "result", None), "data", _MISSING)
+        if data is not _MISSING:
+            return data
 
         raise ExchangeError(f"Invalid response format for {operation}")
 
     def _parse_list_response(self, response: Any, operation: str = "operation") -> List[Any]:
         """Parse response containing a list."""
-        if hasattr(response, "errno") and response.errno != 0:
+        if getattr(response, "errno", 0) != 0:
             raise ExchangeError(f"Failed to {operation}: {response}")
 
-        if hasattr(response, "result") and hasattr(response.result, "list"):
-            return response.result.list or []
+        items = getattr(getattr(response, "result", None), "list", _MISSING)
+        if items is not _MISSING:
+            return items or []
 
         raise ExchangeError(f"Invalid list response format for {operation}")
 
+    def _cache_get(self, kind: str, key: str) -> Any:
+        """Cached value for (kind, key), or None if caching is off, missing or expired."""
+        if self.cache_ttl <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get((kind, key))
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._cache[(kind, key)]
+                return None
+            return entry[1]
+
+    def _cache_put(self, kind: str, key: str, value: Any):
+        """Store value for cache_ttl seconds, evicting the oldest entry when full."""
+        if self.cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            self._cache.pop((kind, key), None)
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[(kind, key)] = (time.monotonic() + self.cache_ttl, value)
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for overlapping independent SDK calls, created on first use."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=self.IO_WORKERS, thread_name_prefix="opinion-io"
+            )
+        return self._io_pool
+
     def _parse_market(self, data: Any, fetch_prices: bool = True) -> Market:
         """Parse market data from Opinion API response."""
         # API uses market_id, not topic_id
@@ -274,23 +464,25 @@ class Opinion(Exchange):
 
         # Fetch prices from orderbook if we have token IDs and client
         if fetch_prices and token_ids and self._client:
-            for i, token_id in enumerate(token_ids):
-                if i < len(outcomes):
-                    try:
-                        orderbook = self.get_orderbook(token_id)
-                        bids = orderbook.get("bids", [])
-                        asks = orderbook.get("asks", [])
-                        best_bid = float(bids[0]["price"]) if bids else 0.0
-                        best_ask = float(asks[0]["price"]) if asks else 0.0
-                        # Use mid-price if both bid and ask exist, otherwise use whichever exists
-                        if best_bid > 0 and best_ask > 0:
-                            prices[outcomes[i]] = (best_bid + best_ask) / 2
-                        elif best_ask > 0:
-                            prices[outcomes[i]] = best_ask
-                        elif best_bid > 0:
-                            prices[outcomes[i]] = best_bid
-                    except Exception:
-                        pass
+            priced = token_ids[: len(outcomes)]
+            books = self.get_orderbooks(priced)
+
+            for i, token_id in enumerate(priced):
+                try:
+                    orderbook = books[token_id]
+                    bids = orderbook.get("bids", [])
+                    asks = orderbook.get("asks", [])
+                    best_bid = bids[0]["price"] if bids else 0.0
+                    best_ask = asks[0]["price"] if asks else 0.0
+                    # Use mid-price if both bid and ask exist, otherwise use whichever exists
+                    if best_bid > 0 and best_ask > 0:
+                        prices[outcomes[i]] = (best_bid + best_ask) / 2
+                    elif best_ask > 0:
+                        prices[outcomes[i]] = best_ask
+                    elif best_bid > 0:
+                        prices[outcomes[i]] = best_bid
+                except Exception:
+                    pass
 
         close_time = None
         # API uses cutoff_at, not cutoff_time
@@ -302,9 +494,10 @@ class Opinion(Exchange):
         if cutoff_time:
             try:
                 if isinstance(cutoff_time, (int, float)) and cutoff_time > 0:
-                    close_time = datetime.fromtimestamp(cutoff_time, tz=timezone.utc)
+                    close_time = datetime.fromtimestamp(cutoff_time, tz=_UTC)
                 elif isinstance(cutoff_time, str):
-                    close_time = datetime.fromisoformat(cutoff_time.replace("Z", "+00:00"))
+                    # fromisoformat accepts a trailing "Z" natively on 3.11+
+                    close_time = datetime.fromisoformat(cutoff_time)
             except (ValueError, TypeError):
                 pass
 
@@ -328,9 +521,7 @@ class Opinion(Exchange):
             "quote_token": getattr(data, "quote_token", ""),
             "token_ids": token_ids,
             "clobTokenIds": token_ids,  # Compatibility with Polymarket pattern
-            "tokens": {
-                outcomes[i]: token_ids[i] for i in range(min(len(outcomes), len(token_ids)))
-            },
+            "tokens": dict(zip(outcomes, token_ids)),
             "child_markets": child_markets_data if child_markets_data else None,
             "is_multi_outcome": bool(child_markets_data),
             "description": getattr(data, "description", "") or getattr(data, "rules", ""),
@@ -339,13 +530,8 @@ class Opinion(Exchange):
             "minimum_tick_size": tick_size,
         }
 
-        status = getattr(data, "status", None)
-        if status == TopicStatus.RESOLVED.value:
-            metadata["closed"] = True
-        elif status == TopicStatus.ACTIVATED.value:
-            metadata["closed"] = False
-        else:
-            metadata["closed"] = False  # Default to open for unknown status
+        # Only resolved topics are closed; activated and unknown statuses count as open
+        metadata["closed"] = getattr(data, "status", None) == self._STATUS_RESOLVED
 
         # Extract description from metadata (already stored there)
         description = metadata.get("description", "")
@@ -378,37 +564,35 @@ class Opinion(Exchange):
         """
         self._ensure_client()
 
-        @self._retry_on_failure
-        def _fetch():
-            query_params = params or {}
-            topic_type = query_params.get("topic_type", TopicType.ALL)
-            status = query_params.get("status", TopicStatusFilter.ACTIVATED)
+        return self._call_with_retry(self._fetch_markets_page, params)
 
-            # Handle active/closed filters like Polymarket
-            if query_params.get("active") or (not query_params.get("closed", True)):
-                status = TopicStatusFilter.ACTIVATED
+    def _fetch_markets_page(self, params: Optional[Dict[str, Any]]) -> List[Market]:
+        """Fetch and parse one page of markets (no retries)."""
+        query_params = params or {}
+        topic_type = query_params.get("topic_type", TopicType.ALL)
+        status = query_params.get("status", TopicStatusFilter.ACTIVATED)
 
-            page = query_params.get("page", 1)
-            limit = min(query_params.get("limit", 20), 20)
+        # Handle active/closed filters like Polymarket
+        if query_params.get("active") or (not query_params.get("closed", True)):
+            status = TopicStatusFilter.ACTIVATED
 
-            response = self._client.get_markets(
-                topic_type=topic_type,
-                status=status,
-                page=page,
-                limit=limit,
-            )
-
-            markets_data = self._parse_list_response(response, "fetch markets")
-            # Don't fetch prices from orderbook for bulk market listing (performance)
-            markets = [self._parse_market(m, fetch_prices=False) for m in markets_data]
+        page = query_params.get("page", 1)
+        limit = min(query_params.get("limit", self.MARKETS_PAGE_SIZE), self.MARKETS_PAGE_SIZE)
 
-            # Apply limit if provided
-            if query_params.get("limit"):
-                markets = markets[: query_params["limit"]]
+        response = self._client.get_markets(
+            topic_type=topic_type,
+            status=status,
+            page=page,
+            limit=limit,
+        )
 
-            return markets
+        markets_data = self._parse_list_response(response, "fetch markets")
+        # Apply limit if provided, before parsing rather than after
+        if query_params.get("limit"):
+            markets_data = markets_data[: query_params["limit"]]
 
-        return _fetch()
+        # Don't fetch prices from orderbook for bulk market listing (performance)
+        return [self._parse_market(m, fetch_prices=False) for m in markets_data]
 
     def fetch_market(self, market_id: str) -> Market:
         """
@@ -419,31 +603,54 @@ class Opinion(Exchange):
         """
         self._ensure_client()
 
-        @self._retry_on_failure
-        def _fetch():
-            # First try get_market (for binary markets)
-            try:
-                response = self._client.get_market(self._parse_market_id(market_id))
-                if hasattr(response, "errno") and response.errno == 0:
-                    market_data = self._parse_market_response(response, f"fetch market {market_id}")
-                    return self._parse_market(market_data)
-            except Exception:
-                pass
+        cached = self._cache_get("market", market_id)
+        if cached is not None:
+            return self._copy_market(cached)
 
-            # If get_market fails, try get_categorical_market (for multi-outcome markets)
-            try:
-                response = self._client.get_categorical_market(self._parse_market_id(market_id))
-                if hasattr(response, "errno") and response.errno == 0:
-                    market_data = self._parse_market_response(
-                        response, f"fetch categorical market {market_id}"
-                    )
-                    return self._parse_market(market_data)
-            except Exception:
-                pass
+        market = self._call_with_retry(self._fetch_market_once, market_id)
+        if self.cache_ttl > 0:
+            # Keep the fetched instance private so callers can't mutate the cached market
+            self._cache_put("market", market_id, market)
+            market = self._copy_market(market)
+        return market
+
+    @staticmethod
+    def _copy_market(market: Market) -> Market:
+        """
+        Copy a cached Market with its own outcomes, prices and metadata dict.
 
-            raise MarketNotFound(f"Market {market_id} not found")
+        Nested metadata values (e.g. the token lists) are still shared.
+        """
+        return replace(
+            market,
+            outcomes=list(market.outcomes),
+            prices=dict(market.prices),
+            metadata=dict(market.metadata),
+        )
 
-        return _fetch()
+    def _fetch_market_once(self, market_id: str) -> Market:
+        """Fetch a binary or categorical market by ID (no retries)."""
+        # First try get_market (for binary markets)
+        try:
+            response = self._client.get_market(self._parse_market_id(market_id))
+            if getattr(response, "errno", None) == 0:
+                market_data = self._parse_market_response(response, f"fetch market {market_id}")
+                return self._parse_market(market_data)
+        except Exception:
+            pass
+
+        # If get_market fails, try get_categorical_market (for multi-outcome markets)
+        try:
+            response = self._client.get_categorical_market(self._parse_market_id(market_id))
+            if getattr(response, "errno", None) == 0:
+                market_data = self._parse_market_response(
+                    response, f"fetch categorical market {market_id}"
+                )
+                return self._parse_market(market_data)
+        except Exception:
+            pass
+
+        raise MarketNotFound(f"Market {market_id} not found")
 
     def fetch_market_by_id(self, market_id: str) -> Optional[Market]:
         """
@@ -460,53 +667,46 @@ class Opinion(Exchange):
         except MarketNotFound:
             return None
 
-    def get_orderbook(self, token_id: str) -> Dict[str, Any]:
+    def get_orderbook(self, token_id: str, stringify: bool = False) -> Dict[str, Any]:
         """
         Fetch orderbook for a specific token via REST API.
 
         Args:
             token_id: Token ID to fetch orderbook for
+            stringify: Return price/size as str (the Polymarket REST shape)
+                instead of float
 
         Returns:
             Dictionary with 'bids' and 'asks' arrays
+            Each entry: {'price': float, 'size': float}
         """
         self._ensure_client()
 
         try:
-            response = self._client.get_orderbook(token_id)
+            cached = self._cache_get("orderbook", token_id)
+            if cached is not None:
+                bids, asks = cached
+            else:
+                response = self._client.get_orderbook(token_id)
 
-            if hasattr(response, "errno") and response.errno != 0:
-                return {"bids": [], "asks": []}
+                if getattr(response, "errno", 0) != 0:
+                    return {"bids": [], "asks": []}
 
-            result = getattr(response, "result", None)
-            if not result:
-                return {"bids": [], "asks": []}
+                result = getattr(response, "result", None)
+                if not result:
+                    return {"bids": [], "asks": []}
 
-            bids = []
-            asks = []
-
-            raw_bids = getattr(result, "bids", []) or []
-            for bid in raw_bids:
-                try:
-                    price = float(getattr(bid, "price", 0))
-                    size = float(getattr(bid, "size", 0))
-                    if price > 0 and size > 0:
-                        bids.append({"price": str(price), "size": str(size)})
-                except (ValueError, TypeError):
-                    continue
-
-            raw_asks = getattr(result, "asks", []) or []
-            for ask in raw_asks:
-                try:
-                    price = float(getattr(ask, "price", 0))
-                    size = float(getattr(ask, "size", 0))
-                    if price > 0 and size > 0:
-                        asks.append({"price": str(price), "size": str(size)})
-                except (ValueError, TypeError):
-                    continue
+                bids = self._parse_book_side(getattr(result, "bids", []) or [], descending=True)
+                asks = self._parse_book_side(getattr(result, "asks", []) or [], descending=False)
+                self._cache_put("orderbook", token_id, (bids, asks))
 
-            bids.sort(key=lambda x: float(x["price"]), reverse=True)
-            asks.sort(key=lambda x: float(x["price"]))
+            # Fresh lists (and level dicts) per call so callers cannot mutate the cached book
+            if stringify:
+                bids = [{"price": str(lv["price"]), "size": str(lv["size"])} for lv in bids]
+                asks = [{"price": str(lv["price"]), "size": str(lv["size"])} for lv in asks]
+            elif self.cache_ttl > 0:
+                bids = [dict(lv) for lv in bids]
+                asks = [dict(lv) for lv in asks]
 
             return {"bids": bids, "asks": asks}
 
@@ -515,6 +715,53 @@ class Opinion(Exchange):
                 print(f"Failed to fetch orderbook: {e}")
             return {"bids": [], "asks": []}
 
+    def get_orderbooks(self, token_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch orderbooks for several tokens at once.
+
+        Opinion has no batch orderbook endpoint, so the per-token requests are
+        dispatched concurrently and the total wait is roughly the slowest one.
+
+        Args:
+            token_ids: Token IDs to fetch orderbooks for
+
+        Returns:
+            Dictionary of token ID to get_orderbook() result; a token whose
+            fetch failed maps to an empty book
+        """
+        if len(token_ids) > 1:
+            pool = self._get_io_pool()
+            fetches = [pool.submit(self.get_orderbook, token_id).result for token_id in token_ids]
+        else:
+            fetches = [partial(self.get_orderbook, token_id) for token_id in token_ids]
+
+        books = {}
+        for token_id, fetch in zip(token_ids, fetches):
+            try:
+                books[token_id] = fetch()
+            except Exception as e:
+                if self.verbose:
+                    print(f"Failed to fetch orderbook for {token_id}: {e}")
+                books[token_id] = {"bids": [], "asks": []}
+        return books
+
+    @staticmethod
+    def _parse_book_side(raw_levels: Iterable[Any], descending: bool) -> List[Dict[str, float]]:
+        """Parse SDK levels into sorted {"price", "size"} dicts, dropping empty or bad levels."""
+        # Sort numeric (price, size) tuples, then build the dicts once in final order
+        levels = []
+        for level in raw_levels:
+            try:
+                price = float(getattr(level, "price", 0))
+                size = float(getattr(level, "size", 0))
+            except (ValueError, TypeError):
+                continue
+            if price > 0 and size > 0:
+                levels.append((price, size))
+
+        levels.sort(key=itemgetter(0), reverse=descending)
+        return [{"price": price, "size": size} for price, size in levels]
+
     def fetch_token_ids(self, market_id: str) -> List[str]:
         """
         Fetch token IDs for a specific market.
@@ -574,6 +821,14 @@ class Opinion(Exchange):
         if price <= 0 or price >= 1:
             raise InvalidOrder(f"Price must be between 0 and 1, got: {price}")
 
+        # Check tick alignment in tick units; the tolerance absorbs float error such
+        # as 0.1 + 0.2, and the aligned price is sent without that error
+        scaled = price * self._TICK_SCALE
+        ticks = round(scaled)
+        if abs(scaled - ticks) > 1e-4:
+            raise InvalidOrder(f"Price must be a multiple of tick size 0.001, got: {price}")
+        price = ticks / self._TICK_SCALE
+
         opinion_side = BUY if side == OrderSide.BUY else SELL
 
         order_type_str = extra_params.get("order_type", "limit").lower()
@@ -600,17 +855,18 @@ class Opinion(Exchange):
             order_id = ""
             status = OrderStatus.OPEN
 
-            if hasattr(result, "errno") and result.errno != 0:
+            if getattr(result, "errno", 0) != 0:
                 raise InvalidOrder(f"Order placement failed: {result}")
 
             # Parse order_id from response (result.result.order_data.order_id)
-            if hasattr(result, "result"):
-                res = result.result
-                if hasattr(res, "order_data"):
-                    order_id = str(getattr(res.order_data, "order_id", ""))
-                elif hasattr(res, "data"):
-                    order_id = str(getattr(res.data, "order_id", ""))
-
+            res = getattr(result, "result", None)
+            order_data = getattr(res, "order_data", _MISSING)
+            if order_data is _MISSING:
+                order_data = getattr(res, "data", _MISSING)
+            if order_data is not _MISSING:
+                order_id = str(getattr(order_data, "order_id", ""))
+
+            now = datetime.now(_UTC)
             return Order(
                 id=order_id,
                 market_id=market_id,
@@ -620,8 +876,8 @@ class Opinion(Exchange):
                 size=size,
                 filled=0,
                 status=status,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=now,
+                updated_at=now,
             )
 
         except InvalidOrder:
@@ -645,9 +901,10 @@ class Opinion(Exchange):
         try:
             result = self._client.cancel_order(order_id)
 
-            if hasattr(result, "errno") and result.errno != 0:
+            if getattr(result, "errno", 0) != 0:
                 raise ExchangeError(f"Failed to cancel order: {result}")
 
+            now = datetime.now(_UTC)
             return Order(
                 id=order_id,
                 market_id=market_id or "",
@@ -657,8 +914,8 @@ class Opinion(Exchange):
                 size=0,
                 filled=0,
                 status=OrderStatus.CANCELLED,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=now,
+                updated_at=now,
             )
 
         except Exception as e:
@@ -680,7 +937,7 @@ class Opinion(Exchange):
         try:
             response = self._client.get_order_by_id(order_id)
 
-            if hasattr(response, "errno") and response.errno != 0:
+            if getattr(response, "errno", 0) != 0:
                 raise ExchangeError(f"Order {order_id} not found")
 
             data = self._parse_market_response(response, f"fetch order {order_id}")
@@ -772,7 +1029,7 @@ class Opinion(Exchange):
         updated_at = self._parse_datetime(getattr(data, "updated_at", None))
 
         if not created_at:
-            created_at = datetime.now(timezone.utc)
+            created_at = datetime.now(_UTC)
         if not updated_at:
             updated_at = created_at
 
@@ -792,41 +1049,24 @@ class Opinion(Exchange):
     def _parse_order_status(self, status: Any) -> OrderStatus:
         """Convert string/int status to OrderStatus enum"""
         if isinstance(status, int):
-            status_map = {
-                0: OrderStatus.PENDING,
-                1: OrderStatus.OPEN,
-                2: OrderStatus.FILLED,
-                3: OrderStatus.PARTIALLY_FILLED,
-                4: OrderStatus.CANCELLED,
-            }
-            return status_map.get(status, OrderStatus.OPEN)
-
-        status_str = str(status).lower()
-        status_map = {
-            "pending": OrderStatus.PENDING,
-            "open": OrderStatus.OPEN,
-            "live": OrderStatus.OPEN,
-            "filled": OrderStatus.FILLED,
-            "matched": OrderStatus.FILLED,
-            "partially_filled": OrderStatus.PARTIALLY_FILLED,
-            "cancelled": OrderStatus.CANCELLED,
-            "canceled": OrderStatus.CANCELLED,
-            "rejected": OrderStatus.REJECTED,
-        }
-        return status_map.get(status_str, OrderStatus.OPEN)
+            return self._INT_STATUS_MAP.get(status, OrderStatus.OPEN)
+        return self._STR_STATUS_MAP.get(str(status).lower(), OrderStatus.OPEN)
 
     def _parse_datetime(self, timestamp: Optional[Any]) -> Optional[datetime]:
         """Parse datetime from various formats"""
         if not timestamp:
             return None
 
-        if isinstance(timestamp, datetime):
-            return timestamp
-
+        # Exact-type dispatch for the common cases; subclasses take the generic path
+        parse = _DATETIME_PARSERS.get(type(timestamp))
         try:
+            if parse is not None:
+                return parse(timestamp)
+            if isinstance(timestamp, datetime):
+                return timestamp
             if isinstance(timestamp, (int, float)):
-                return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            return datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+                return datetime.fromtimestamp(timestamp, tz=_UTC)
+            return datetime.fromisoformat(str(timestamp))
         except (ValueError, TypeError):
             return None
 
@@ -918,39 +1158,64 @@ class Opinion(Exchange):
         try:
             response = self._client.get_my_balances()
 
-            if hasattr(response, "errno") and response.errno != 0:
+            if getattr(response, "errno", 0) != 0:
                 raise ExchangeError(f"Failed to fetch balance: {response}")
 
-            balances = {}
-
-            if hasattr(response, "result"):
-                result = response.result
-                # Opinion API returns result.balances array
-                if hasattr(result, "balances"):
-                    for item in result.balances or []:
-                        # Use available_balance field
-                        balance = float(getattr(item, "available_balance", 0) or 0)
-                        # Opinion uses USDT on BSC (quote_token is USDT contract)
-                        balances["USDC"] = balance
-                        break  # Only one balance expected
-                elif hasattr(result, "list"):
-                    for item in result.list or []:
-                        symbol = getattr(item, "symbol", "") or getattr(item, "currency", "")
-                        balance = float(
-                            getattr(item, "balance", 0) or getattr(item, "available", 0) or 0
-                        )
-                        if symbol:
-                            balances[symbol] = balance
-                elif hasattr(result, "data"):
-                    data = result.data
-                    if hasattr(data, "balance"):
-                        balances["USDC"] = float(data.balance)
-
-            return balances
+            result = getattr(response, "result", None)
+            if result is None:
+                return {}
+
+            # The response shape is stable; probe the candidates only until one matches
+            schema = self._balance_schema
+            value = getattr(result, schema, _MISSING) if schema else _MISSING
+            if value is _MISSING:
+                for schema in self._BALANCE_SCHEMAS:
+                    value = getattr(result, schema, _MISSING)
+                    if value is not _MISSING:
+                        self._balance_schema = schema
+                        break
+                else:
+                    return {}
+
+            return self._BALANCE_SCHEMAS[schema](value)
 
         except Exception as e:
             raise ExchangeError(f"Failed to fetch balance: {e}")
 
+    @staticmethod
+    def _balances_from_balances(items: Any) -> Dict[str, float]:
+        """Opinion API returns result.balances array"""
+        for item in items or []:
+            # Use available_balance field; Opinion uses USDT on BSC (quote_token is USDT contract)
+            return {"USDC": float(getattr(item, "available_balance", 0) or 0)}
+        return {}
+
+    @staticmethod
+    def _balances_from_list(items: Any) -> Dict[str, float]:
+        """result.list of per-symbol balances"""
+        balances = {}
+        for item in items or []:
+            symbol = getattr(item, "symbol", "") or getattr(item, "currency", "")
+            balance = float(getattr(item, "balance", 0) or getattr(item, "available", 0) or 0)
+            if symbol:
+                balances[symbol] = balance
+        return balances
+
+    @staticmethod
+    def _balances_from_data(data: Any) -> Dict[str, float]:
+        """result.data with a single balance"""
+        balance = getattr(data, "balance", _MISSING)
+        if balance is _MISSING:
+            return {}
+        return {"USDC": float(balance)}
+
+    # Balance response attribute -> extractor, in probe order
+    _BALANCE_SCHEMAS: Dict[str, Callable[[Any], Dict[str, float]]] = {
+        "balances": _balances_from_balances,
+        "list": _balances_from_list,
+        "data": _balances_from_data,
+    }
+
     def calculate_nav(self, market: Market) -> NAV:
         """
         Calculate Net Asset Value for a specific market.
@@ -963,24 +1228,21 @@ class Opinion(Exchange):
         Returns:
             NAV object with nav, cash, positions_value, and positions breakdown
         """
-        balances = self.fetch_balance()
-        cash = balances.get("USDC", 0.0)
-
+        # Overlap the two round-trips: balance on the pool, positions on this thread
+        balance_future = self._get_io_pool().submit(self.fetch_balance)
         positions = self.fetch_positions_for_market(market)
-        positions_value = 0.0
-        positions_breakdown = []
-
-        for pos in positions:
-            value = pos.size * pos.current_price
-            positions_value += value
-            positions_breakdown.append(
-                {
-                    "outcome": pos.outcome,
-                    "size": pos.size,
-                    "current_price": pos.current_price,
-                    "value": value,
-                }
-            )
+        cash = balance_future.result().get("USDC", 0.0)
+
+        positions_breakdown = [
+            {
+                "outcome": pos.outcome,
+                "size": pos.size,
+                "current_price": pos.current_price,
+                "value": pos.size * pos.current_price,
+            }
+            for pos in positions
+        ]
+        positions_value = sum((item["value"] for item in positions_breakdown), 0.0)
 
         nav = cash + positions_value
 
@@ -1131,16 +1393,44 @@ class Opinion(Exchange):
             raise MarketNotFound(f"Market {market} not found")
         return fetched
 
-    @staticmethod
-    def _extract_token_ids(market: Market) -> List[str]:
-        """Extract token IDs from market metadata"""
+    @classmethod
+    def _extract_token_ids(cls, market: Market) -> Tuple[str, ...]:
+        """
+        Extract token IDs from market metadata.
+
+        Cached on the Market until clobTokenIds/token_ids change, so repeated
+        lookups skip re-decoding.
+        """
         raw_ids = market.metadata.get("clobTokenIds", []) or market.metadata.get("token_ids", [])
+        return cached_on_market(
+            market, "_token_ids", freeze(raw_ids), partial(cls._decode_token_ids, raw_ids)
+        )
+
+    @staticmethod
+    def _decode_token_ids(raw_ids: Any) -> Tuple[str, ...]:
+        """Decode a clobTokenIds value (JSON string, bare ID or list) into token IDs"""
         if isinstance(raw_ids, str):
-            try:
-                raw_ids = json.loads(raw_ids)
-            except json.JSONDecodeError:
+            # Only JSON containers need decoding; a bare ID skips the raise/catch
+            if raw_ids.lstrip().startswith(("[", "{")):
+                try:
+                    raw_ids = json.loads(raw_ids)
+                except json.JSONDecodeError:
+                    raw_ids = [raw_ids]
+            else:
                 raw_ids = [raw_ids]
-        return [str(token_id) for token_id in raw_ids if token_id]
+        return tuple(str(token_id) for token_id in raw_ids if token_id)
+
+    @staticmethod
+    def _outcome_index(market: Market) -> Mapping[str, int]:
+        """Outcome name -> first index in market.outcomes, cached until outcomes change"""
+
+        def build() -> Mapping[str, int]:
+            index: Dict[str, int] = {}
+            for position, name in enumerate(market.outcomes):
+                index.setdefault(name, position)
+            return MappingProxyType(index)
+
+        return cached_on_market(market, "_outcome_index", freeze(market.outcomes), build)
 
     def _lookup_token_id(self, market: Market, outcome: int | str | None) -> str:
         """Look up token ID for a specific outcome"""
@@ -1154,8 +1444,8 @@ class Opinion(Exchange):
             outcome_index = outcome
         else:
             try:
-                outcome_index = market.outcomes.index(outcome)
-            except ValueError as err:
+                outcome_index = self._outcome_index(market)[outcome]
+            except KeyError as err:
                 raise ExchangeError(f"Outcome {outcome} not found in market {market.id}") from err
 
         if outcome_index < 0 or outcome_index >= len(token_ids):
@@ -1192,7 +1482,7 @@ class Opinion(Exchange):
         """
         self._ensure_client()
 
-        if interval not in self.SUPPORTED_INTERVALS:
+        if interval not in self._INTERVAL_SET:
             raise ValueError(
                 f"Unsupported interval '{interval}'. Pick from {self.SUPPORTED_INTERVALS}."
             )
@@ -1200,69 +1490,101 @@ class Opinion(Exchange):
         market_obj = self._ensure_market(market)
         token_id = self._lookup_token_id(market_obj, outcome)
 
-        @self._retry_on_failure
-        def _fetch() -> List[Any]:
-            response = self._client.get_price_history(
-                token_id=token_id,
-                interval=interval,
-                start_at=start_at,
-                end_at=end_at,
-            )
-
-            if hasattr(response, "errno") and response.errno != 0:
-                return []
-
-            result = getattr(response, "result", None)
-            if not result:
-                return []
-
-            return getattr(result, "list", []) or getattr(result, "data", []) or []
-
-        history = _fetch()
-        points = self._parse_history(history)
+        history = self._call_with_retry(
+            self._fetch_price_history_once, token_id, interval, start_at, end_at
+        )
 
         if as_dataframe:
             try:
+                import numpy as np
                 import pandas as pd
             except ImportError as exc:
                 raise RuntimeError("pandas is required when as_dataframe=True.") from exc
 
+            # Columns straight from the rows: no PricePoint/datetime object per point
+            seconds: List[int] = []
+            prices: List[float] = []
+            for t, p, *_ in self._iter_history(history):
+                seconds.append(t)
+                prices.append(p)
+
+            stamps = np.array(seconds, dtype="datetime64[s]")
+            timestamps = pd.DatetimeIndex(stamps).tz_localize("UTC").as_unit("ns")
             data = {
-                "timestamp": [p.timestamp for p in points],
-                "price": [p.price for p in points],
+                "timestamp": timestamps,
+                "price": np.array(prices, dtype=np.float64),
             }
-            return pd.DataFrame(data).sort_values("timestamp").reset_index(drop=True)
+            df = pd.DataFrame(data)
+            # Time-series responses are normally in order already; only sort when not
+            if not timestamps.is_monotonic_increasing:
+                df = df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+            return df
+
+        return self._parse_history(history)
+
+    def _fetch_price_history_once(
+        self, token_id: str, interval: str, start_at: Optional[int], end_at: Optional[int]
+    ) -> List[Any]:
+        """Fetch raw price history rows for a token (no retries)."""
+        response = self._client.get_price_history(
+            token_id=token_id,
+            interval=interval,
+            start_at=start_at,
+            end_at=end_at,
+        )
+
+        if getattr(response, "errno", 0) != 0:
+            return []
+
+        result = getattr(response, "result", None)
+        if not result:
+            return []
 
-        return points
+        return getattr(result, "list", []) or getattr(result, "data", []) or []
 
     @staticmethod
-    def _parse_history(history: Iterable[Any]) -> List[PricePoint]:
-        """Parse price history data"""
-        parsed: List[PricePoint] = []
+    def _iter_history(history: Iterable[Any]) -> Iterator[Tuple[int, float, Any, Any, Any]]:
+        """Yield (unix seconds, price, row, raw t, raw p) for each well-formed, in-range row"""
         for row in history:
-            t = getattr(row, "timestamp", None) or getattr(row, "t", None)
-            p = getattr(row, "price", None) or getattr(row, "p", None)
-
             # Handle dict format
             if isinstance(row, dict):
                 t = row.get("timestamp") or row.get("t")
                 p = row.get("price") or row.get("p")
+            else:
+                t = getattr(row, "timestamp", None) or getattr(row, "t", None)
+                p = getattr(row, "price", None) or getattr(row, "p", None)
 
             if t is None or p is None:
                 continue
 
             try:
-                parsed.append(
-                    PricePoint(
-                        timestamp=datetime.fromtimestamp(int(t), tz=timezone.utc),
-                        price=float(p),
-                        raw=row if isinstance(row, dict) else {"timestamp": t, "price": p},
-                    )
-                )
+                seconds = int(t)
+                price = float(p)
             except (ValueError, TypeError):
                 continue
+            # Out-of-range epochs (e.g. milliseconds) are dropped on both output paths
+            if _EPOCH_MIN <= seconds <= _EPOCH_MAX:
+                yield seconds, price, row, t, p
+
+    @classmethod
+    def _parse_history(cls, history: Iterable[Any]) -> List[PricePoint]:
+        """Parse price history data"""
+        parsed: List[PricePoint] = []
+        for seconds, price, row, t, p in cls._iter_history(history):
+            try:
+                timestamp = datetime.fromtimestamp(seconds, tz=_UTC)
+            except ValueError:
+                continue
+            parsed.append(
+                PricePoint(
+                    timestamp=timestamp,
+                    price=price,
+                    raw=row if isinstance(row, dict) else {"timestamp": t, "price": p},
+                )
+            )
 
-        return sorted(parsed, key=lambda item: item.timestamp)
+        parsed.sort(key=attrgetter("timestamp"))
+        return parsed
 
     # Search markets
     def search_markets(
@@ -1309,8 +1631,11 @@ class Opinion(Exchange):
             return [v.lower() for v in values] if values else []
 
         query_lower = query.lower() if query else None
-        keyword_lowers = _lower_list(keywords)
-        category_lowers = _lower_list(categories)
+        # The query is just one more required substring; dedupe so each is scanned once
+        needles = tuple(
+            dict.fromkeys(([query_lower] if query_lower else []) + _lower_list(keywords))
+        )
+        category_set = frozenset(map(sys.intern, _lower_list(categories)))
         outcome_lowers = _lower_list(outcomes)
 
         # Fetch markets
@@ -1319,31 +1644,28 @@ class Opinion(Exchange):
                 "topic_type": topic_type,
                 "status": status,
                 "page": page,
-                "limit": min(limit, 20),  # API limit
+                "limit": min(limit, self.MARKETS_PAGE_SIZE),  # API limit
             }
         )
 
+        # Cheap numeric prefilter first so only survivors reach the string checks
+        candidates = [m for m in all_markets if m.liquidity >= min_liquidity]
+        if binary is not None:
+            candidates = [m for m in candidates if m.is_binary == binary]
+
         # Client-side filtering
         filtered: List[Market] = []
 
-        for m in all_markets:
-            if binary is not None and m.is_binary != binary:
-                continue
-            if m.liquidity < min_liquidity:
-                continue
+        for m in candidates:
             if outcome_lowers:
                 outs = [o.lower() for o in m.outcomes]
                 if not all(x in outs for x in outcome_lowers):
                     continue
-            if category_lowers:
-                cats = self._extract_categories(m)
-                if not cats or not any(c in cats for c in category_lowers):
-                    continue
-            if query_lower or keyword_lowers:
+            if category_set and category_set.isdisjoint(self._category_set(m)):
+                continue
+            if needles:
                 text = self._build_search_text(m)
-                if query_lower and query_lower not in text:
-                    continue
-                if any(k not in text for k in keyword_lowers):
+                if any(n not in text for n in needles):
                     continue
             if predicate and not predicate(m):
                 continue
@@ -1373,9 +1695,39 @@ class Opinion(Exchange):
 
         return buckets
 
-    @staticmethod
-    def _build_search_text(market: Market) -> str:
-        """Build searchable text from market"""
+    @classmethod
+    def _category_set(cls, market: Market) -> frozenset:
+        """Lowercased categories of a market as a frozenset, cached until they change"""
+        meta = market.metadata
+        source = freeze([meta.get(key) for key in ("category", "categories", "topics")])
+        # Interned: markets share a few category names, so equal strings are one object
+        return cached_on_market(
+            market,
+            "_category_set",
+            source,
+            lambda: frozenset(map(sys.intern, cls._extract_categories(market))),
+        )
+
+    @classmethod
+    def _build_search_text(cls, market: Market) -> str:
+        """
+        Build searchable text from market.
+
+        Cached on the Market until the question or searched metadata change, so
+        repeated searches over the same objects skip the rebuild.
+        """
+        meta = market.metadata
+        source = freeze(
+            [market.question, meta.get("description")]
+            + [meta.get(key) for key in cls._SEARCH_EXTRA_KEYS]
+        )
+        return cached_on_market(
+            market, "_search_text", source, partial(cls._search_text_of, market)
+        )
+
+    @classmethod
+    def _search_text_of(cls, market: Market) -> str:
+        """Lowercased question, description and category/tag metadata of a market"""
         meta = market.metadata
 
         base_fields = [
@@ -1383,10 +1735,8 @@ class Opinion(Exchange):
             meta.get("description", ""),
         ]
 
-        extra_keys = ["category", "tags", "topics", "categories"]
-
         extras: List[str] = []
-        for key in extra_keys:
+        for key in cls._SEARCH_EXTRA_KEYS:
             value = meta.get(key)
             if value is None:
                 continue
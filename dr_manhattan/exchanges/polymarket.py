@@ -1,15 +1,20 @@
+import io
 import json
 import logging
 import re
+import threading
+import time
 import traceback
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
 
 import pandas as pd
 import requests
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import AssetType, BalanceAllowanceParams, OrderArgs, OrderType
+from requests.adapters import HTTPAdapter
 
 from ..base.errors import (
     AuthenticationError,
@@ -25,10 +30,14 @@ from ..models.market import Market
 from ..models.order import Order, OrderSide, OrderStatus
 from ..models.position import Position
 from ..utils import setup_logger
+from ..utils.decoding import ijson_items, orjson_loads
 from .polymarket_ws import PolymarketUserWebSocket, PolymarketWebSocket
 
+# Slug path component following an "/event/" component in a Polymarket URL
+_EVENT_SLUG_RE = re.compile(r"/event/([^/]+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class PublicTrade:
     proxy_wallet: str
     side: str
@@ -51,14 +60,14 @@ class PublicTrade:
     transaction_hash: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class PricePoint:
     timestamp: datetime
     price: float
     raw: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     id: str
     label: str | None
@@ -83,6 +92,11 @@ class Polymarket(Exchange):
     PRICES_HISTORY_URL = f"{CLOB_URL}/prices-history"
     DATA_API_URL = "https://data-api.polymarket.com"
     SUPPORTED_INTERVALS: Sequence[str] = ("1m", "1h", "6h", "1d", "1w", "max")
+    HTTP_POOL_SIZE = 32  # Keep-alive connections per host
+    CACHE_MAX_ENTRIES = 512  # Market-list/orderbook TTL cache size (oldest evicted first)
+
+    # CLOB market lists searched by fetch_token_ids, in priority order
+    TOKEN_ID_ENDPOINTS = ("/simplified-markets", "/sampling-simplified-markets", "/markets")
 
     # Market type tags (Polymarket-specific)
     TAG_1H = "102175"  # 1-hour crypto price markets
@@ -95,12 +109,14 @@ class Polymarket(Exchange):
     }
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def normalize_token(token: str) -> str:
         """Normalize token symbol to standard format (e.g., BITCOIN -> BTC)"""
         token_upper = token.upper()
         return Polymarket.TOKEN_ALIASES.get(token_upper, token_upper)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def parse_market_identifier(identifier: str) -> str:
         """
         Parse market slug from URL or return slug as-is.
@@ -128,16 +144,13 @@ class Polymarket(Exchange):
         # If it's a URL, extract the slug
         if identifier.startswith("http"):
             # Remove query parameters
-            identifier = identifier.split("?")[0]
-            # Extract slug from URL
+            identifier = identifier.split("?", 1)[0]
             # Format: https://polymarket.com/event/SLUG
-            parts = identifier.rstrip("/").split("/")
-            if "event" in parts:
-                idx = parts.index("event")
-                if idx + 1 < len(parts):
-                    return parts[idx + 1]
+            match = _EVENT_SLUG_RE.search(identifier)
+            if match:
+                return match.group(1)
             # Fallback: return last part
-            return parts[-1]
+            return identifier.rstrip("/").rpartition("/")[2]
 
         return identifier
 
@@ -158,11 +171,65 @@ class Polymarket(Exchange):
         self.funder = self.config.get("funder")
         self._clob_client = None
         self._address = None
+        # Gamma API auth, built once; only _request sends it (not CLOB or data-api calls)
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        self._session = self._create_session()
+        # (kind, key) -> (expiry, value); collapses bursts of identical reads
+        self.cache_ttl = float(self.config.get("cache_ttl", 0.0))
+        self._cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        # Response body decoder; None keeps requests' own .json()
+        self._loads: Optional[Callable[[bytes], Any]] = (
+            orjson_loads() if self.config.get("use_orjson", False) else None
+        )
+        # Streams market lists in fetch_token_ids when ijson is installed
+        self._stream_items = ijson_items()
 
         # Initialize CLOB client if private key is provided
         if self.private_key:
             self._initialize_clob_client()
 
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive session shared by the Gamma, CLOB and data APIs."""
+        session = requests.Session()
+        # Retries are handled by _retry_on_failure, not urllib3
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.HTTP_POOL_SIZE, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept"] = "application/json"
+        return session
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self._session.close()
+
+    def _cache_get(self, kind: str, key: str) -> Any:
+        """Cached value for (kind, key), or None if caching is off, missing or expired."""
+        if self.cache_ttl <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get((kind, key))
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._cache[(kind, key)]
+                return None
+            return entry[1]
+
+    def _cache_put(self, kind: str, key: str, value: Any):
+        """Store value for cache_ttl seconds, evicting the oldest entry when full."""
+        if self.cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            self._cache.pop((kind, key), None)
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[(kind, key)] = (time.monotonic() + self.cache_ttl, value)
+
+    def _json(self, response: requests.Response) -> Any:
+        """Decode a response body, with orjson when enabled."""
+        return self._loads(response.content) if self._loads else response.json()
+
     def _initialize_clob_client(self):
         """Initialize CLOB client with authentication."""
         try:
@@ -208,14 +275,10 @@ class Polymarket(Exchange):
         @self._retry_on_failure
         def _make_request():
             url = f"{self.BASE_URL}{endpoint}"
-            headers = {}
-
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
 
             try:
-                response = requests.request(
-                    method, url, params=params, headers=headers, timeout=self.timeout
+                response = self._session.request(
+                    method, url, params=params, headers=self._auth_headers, timeout=self.timeout
                 )
 
                 # Handle rate limiting
@@ -224,7 +287,7 @@ class Polymarket(Exchange):
                     raise RateLimitError(f"Rate limited. Retry after {retry_after}s")
 
                 response.raise_for_status()
-                return response.json()
+                return self._json(response)
             except requests.Timeout as e:
                 raise NetworkError(f"Request timeout: {e}")
             except requests.ConnectionError as e:
@@ -255,17 +318,28 @@ class Polymarket(Exchange):
         def _fetch():
             # Fetch from CLOB API /sampling-markets (includes token IDs and live markets)
             try:
-                response = requests.get(f"{self.CLOB_URL}/sampling-markets", timeout=self.timeout)
+                markets = self._cache_get("markets", "sampling-markets")
+                if markets is None:
+                    response = self._session.get(
+                        f"{self.CLOB_URL}/sampling-markets", timeout=self.timeout
+                    )
 
-                if response.status_code == 200:
-                    result = response.json()
-                    markets_data = result.get("data", result if isinstance(result, list) else [])
+                    if response.status_code == 200:
+                        result = self._json(response)
+                        markets_data = result.get(
+                            "data", result if isinstance(result, list) else []
+                        )
 
-                    markets = []
-                    for item in markets_data:
-                        market = self._parse_sampling_market(item)
-                        if market:
-                            markets.append(market)
+                        markets = []
+                        for item in markets_data:
+                            market = self._parse_sampling_market(item)
+                            if market:
+                                markets.append(market)
+                        self._cache_put("markets", "sampling-markets", markets)
+
+                if markets is not None:
+                    # Filter into a new list; the cached one is shared
+                    markets = list(markets)
 
                     # Apply filters if provided
                     query_params = params or {}
@@ -277,6 +351,10 @@ class Polymarket(Exchange):
                     if limit:
                         markets = markets[:limit]
 
+                    if self.cache_ttl > 0:
+                        # Copies so callers can't mutate the cached markets
+                        markets = [self._copy_market(m) for m in markets]
+
                     if self.verbose:
                         print(f"✓ Fetched {len(markets)} markets from CLOB API (sampling-markets)")
 
@@ -332,7 +410,9 @@ class Polymarket(Exchange):
             raise ValueError("Empty slug provided")
 
         try:
-            response = requests.get(f"{self.BASE_URL}/events?slug={slug}", timeout=self.timeout)
+            response = self._session.get(
+                f"{self.BASE_URL}/events?slug={slug}", timeout=self.timeout
+            )
         except requests.Timeout as e:
             raise NetworkError(f"Request timeout: {e}")
         except requests.ConnectionError as e:
@@ -345,7 +425,7 @@ class Polymarket(Exchange):
         elif response.status_code != 200:
             raise ExchangeError(f"Failed to fetch event: HTTP {response.status_code}")
 
-        event_data = response.json()
+        event_data = self._json(response)
         if not event_data or len(event_data) == 0:
             raise MarketNotFound(f"Event not found: {slug}")
 
@@ -390,13 +470,21 @@ class Polymarket(Exchange):
             >>> best_bid = float(orderbook['bids'][0]['price'])
             >>> best_ask = float(orderbook['asks'][0]['price'])
         """
+        cached = self._cache_get("orderbook", token_id)
+        if cached is not None:
+            return self._copy_book(cached)
+
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.CLOB_URL}/book", params={"token_id": token_id}, timeout=self.timeout
             )
 
             if response.status_code == 200:
-                return response.json()
+                book = self._json(response)
+                if self.cache_ttl > 0 and "bids" in book and "asks" in book:
+                    self._cache_put("orderbook", token_id, book)
+                    return self._copy_book(book)
+                return book
 
             return {"bids": [], "asks": []}
 
@@ -405,6 +493,62 @@ class Polymarket(Exchange):
                 print(f"Failed to fetch orderbook: {e}")
             return {"bids": [], "asks": []}
 
+    @staticmethod
+    def _copy_book(book: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached orderbook down to the level dicts so callers can't mutate it."""
+        return {
+            **book,
+            "bids": [dict(level) for level in book["bids"]],
+            "asks": [dict(level) for level in book["asks"]],
+        }
+
+    @staticmethod
+    def _copy_market(market: Market) -> Market:
+        """
+        Copy a cached Market with its own outcomes, prices and metadata dict.
+
+        Nested metadata values (e.g. the token lists) are still shared.
+        """
+        return replace(
+            market,
+            outcomes=list(market.outcomes),
+            prices=dict(market.prices),
+            metadata=dict(market.metadata),
+        )
+
+    @staticmethod
+    def _parse_clob_tokens(
+        tokens: Iterable[Any],
+    ) -> Tuple[List[str], List[str], Dict[str, float]]:
+        """Split a CLOB "tokens" array into token IDs, outcomes and outcome prices."""
+        token_ids: List[str] = []
+        outcomes: List[str] = []
+        prices: Dict[str, float] = {}
+
+        for token in tokens:
+            if not isinstance(token, dict):
+                continue
+            token_id = token.get("token_id")
+            outcome = token.get("outcome", "")
+            price = token.get("price")
+
+            if token_id:
+                token_ids.append(str(token_id))
+            if not outcome:
+                continue
+            outcomes.append(outcome)
+            if price is None:
+                continue
+            # JSON numbers arrive as float already; only convert other types
+            if type(price) is not float:
+                try:
+                    price = float(price)
+                except (ValueError, TypeError):
+                    continue
+            prices[outcome] = price
+
+        return token_ids, outcomes, prices
+
     def _parse_sampling_market(self, data: Dict[str, Any]) -> Optional[Market]:
         """Parse market data from CLOB sampling-markets API response"""
         try:
@@ -423,28 +567,9 @@ class Polymarket(Exchange):
             minimum_tick_size = data.get("minimum_tick_size", 0.01)
 
             # Extract tokens - sampling-markets has them in "tokens" array
-            tokens_data = data.get("tokens", [])
-            token_ids = []
-            outcomes = []
-            prices = {}
-
-            for token in tokens_data:
-                if isinstance(token, dict):
-                    token_id = token.get("token_id")
-                    outcome = token.get("outcome", "")
-                    price = token.get("price")
-
-                    if token_id:
-                        token_ids.append(str(token_id))
-                    if outcome:
-                        outcomes.append(outcome)
-                    if outcome and price is not None:
-                        try:
-                            prices[outcome] = float(price)
-                        except (ValueError, TypeError):
-                            pass
-
-            # Build metadata with token IDs
+            token_ids, outcomes, prices = self._parse_clob_tokens(data.get("tokens", []))
+
+            # Build metadata with token IDs already included
             metadata = {
                 **data,
                 "clobTokenIds": token_ids,
@@ -478,26 +603,7 @@ class Polymarket(Exchange):
                 return None
 
             # Extract tokens (already have token_id, outcome, price, winner)
-            tokens = data.get("tokens", [])
-            token_ids = []
-            outcomes = []
-            prices = {}
-
-            for token in tokens:
-                if isinstance(token, dict):
-                    token_id = token.get("token_id")
-                    outcome = token.get("outcome", "")
-                    price = token.get("price")
-
-                    if token_id:
-                        token_ids.append(str(token_id))
-                    if outcome:
-                        outcomes.append(outcome)
-                    if outcome and price is not None:
-                        try:
-                            prices[outcome] = float(price)
-                        except (ValueError, TypeError):
-                            pass
+            token_ids, outcomes, prices = self._parse_clob_tokens(data.get("tokens", []))
 
             # Build metadata with token IDs already included
             # Default to 0.01 (standard Polymarket tick size) if not provided
@@ -638,132 +744,106 @@ class Polymarket(Exchange):
         Raises:
             ExchangeError: If token IDs cannot be fetched
         """
+        cached = self._cache_get("token_ids", condition_id)
+        if cached is not None:
+            return list(cached)
+
+        # Probe endpoints in priority order; fallbacks are only fetched on a miss
+        for endpoint in self.TOKEN_ID_ENDPOINTS:
+            token_ids = self._probe_token_ids(endpoint, condition_id)
+            if token_ids:
+                self._cache_put("token_ids", condition_id, tuple(token_ids))
+                return token_ids
+
+        raise ExchangeError(
+            f"Could not fetch token IDs for market {condition_id} from any CLOB endpoint"
+        )
+
+    def _probe_token_ids(self, endpoint: str, condition_id: str) -> Optional[List[str]]:
+        """
+        Look up token IDs for condition_id in one CLOB market-list endpoint.
+
+        Response structure: {"data": [{"condition_id": ..., "tokens": [{"token_id": ...,
+        "outcome": ...}]}]} or a bare list. Returns None on a miss or any failure.
+        """
         try:
-            # Try simplified-markets endpoint
-            # Response structure: {"data": [{"condition_id": ..., "tokens": [{"token_id": ..., "outcome": ...}]}]}
+            response = self._session.get(
+                f"{self.CLOB_URL}{endpoint}",
+                timeout=self.timeout,
+                stream=self._stream_items is not None,
+            )
             try:
-                response = requests.get(f"{self.CLOB_URL}/simplified-markets", timeout=self.timeout)
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    # Check if response has "data" key
-                    markets_list = result.get("data", result if isinstance(result, list) else [])
-
-                    # Find the market with matching condition_id
-                    for market in markets_list:
-                        market_id = market.get("condition_id") or market.get("id")
-                        if market_id == condition_id:
-                            # Extract token IDs from tokens array
-                            # Each token is an object: {"token_id": "...", "outcome": "...", "price": ...}
-                            tokens = market.get("tokens", [])
-                            if tokens and isinstance(tokens, list):
-                                # Extract just the token_id strings
-                                token_ids = []
-                                for token in tokens:
-                                    if isinstance(token, dict) and "token_id" in token:
-                                        token_ids.append(str(token["token_id"]))
-                                    elif isinstance(token, str):
-                                        # In case it's already a string
-                                        token_ids.append(token)
-
-                                if token_ids:
-                                    if self.verbose:
-                                        print(
-                                            f"✓ Found {len(token_ids)} token IDs via simplified-markets"
-                                        )
-                                        for i, tid in enumerate(token_ids):
-                                            outcome = (
-                                                tokens[i].get("outcome", f"outcome_{i}")
-                                                if isinstance(tokens[i], dict)
-                                                else f"outcome_{i}"
-                                            )
-                                            print(f"  [{i}] {outcome}: {tid}")
-                                    return token_ids
-
-                            # Fallback: check for clobTokenIds
-                            clob_tokens = market.get("clobTokenIds")
-                            if clob_tokens and isinstance(clob_tokens, list):
-                                token_ids = [str(t) for t in clob_tokens]
-                                if self.verbose:
-                                    print(f"✓ Found token IDs via clobTokenIds: {token_ids}")
-                                return token_ids
-            except Exception as e:
-                if self.verbose:
-                    print(f"simplified-markets failed: {e}")
+                if response.status_code != 200:
+                    return None
 
-            # Try sampling-simplified-markets endpoint
-            try:
-                response = requests.get(
-                    f"{self.CLOB_URL}/sampling-simplified-markets", timeout=self.timeout
-                )
+                # Stop at the first market with matching condition_id
+                for market in self._iter_market_list(response):
+                    market_id = market.get("condition_id") or market.get("id")
+                    if market_id != condition_id:
+                        continue
 
-                if response.status_code == 200:
-                    markets_list = response.json()
-                    if not isinstance(markets_list, list):
-                        markets_list = markets_list.get("data", [])
-
-                    for market in markets_list:
-                        market_id = market.get("condition_id") or market.get("id")
-                        if market_id == condition_id:
-                            # Extract from tokens array
-                            tokens = market.get("tokens", [])
-                            if tokens and isinstance(tokens, list):
-                                token_ids = []
-                                for token in tokens:
-                                    if isinstance(token, dict) and "token_id" in token:
-                                        token_ids.append(str(token["token_id"]))
-                                    elif isinstance(token, str):
-                                        token_ids.append(token)
-
-                                if token_ids:
-                                    if self.verbose:
-                                        print(
-                                            f"✓ Found token IDs via sampling-simplified-markets: {len(token_ids)} tokens"
-                                        )
-                                    return token_ids
-            except Exception as e:
-                if self.verbose:
-                    print(f"sampling-simplified-markets failed: {e}")
+                    token_ids = self._market_token_ids(market, endpoint)
+                    if token_ids:
+                        return token_ids
+            finally:
+                response.close()
+        except Exception as e:
+            if self.verbose:
+                print(f"{endpoint} failed: {e}")
+        return None
 
-            # Try markets endpoint
-            try:
-                response = requests.get(f"{self.CLOB_URL}/markets", timeout=self.timeout)
-
-                if response.status_code == 200:
-                    markets_list = response.json()
-                    if not isinstance(markets_list, list):
-                        markets_list = markets_list.get("data", [])
-
-                    for market in markets_list:
-                        market_id = market.get("condition_id") or market.get("id")
-                        if market_id == condition_id:
-                            # Extract from tokens array
-                            tokens = market.get("tokens", [])
-                            if tokens and isinstance(tokens, list):
-                                token_ids = []
-                                for token in tokens:
-                                    if isinstance(token, dict) and "token_id" in token:
-                                        token_ids.append(str(token["token_id"]))
-                                    elif isinstance(token, str):
-                                        token_ids.append(token)
-
-                                if token_ids:
-                                    if self.verbose:
-                                        print(
-                                            f"✓ Found token IDs via markets endpoint: {len(token_ids)} tokens"
-                                        )
-                                    return token_ids
-            except Exception as e:
-                if self.verbose:
-                    print(f"markets endpoint failed: {e}")
+    def _iter_market_list(self, response) -> Iterable[Dict[str, Any]]:
+        """
+        Iterate the markets of a CLOB market-list response.
 
-            raise ExchangeError(
-                f"Could not fetch token IDs for market {condition_id} from any CLOB endpoint"
-            )
+        With ijson installed the body is streamed from the "data" array (or the
+        top-level array for bare-list responses), so markets after a match are
+        never decoded; otherwise it is parsed whole.
+        """
+        if self._stream_items is not None:
+            response.raw.decode_content = True
+            body = io.BufferedReader(response.raw)
+            # Peek at the first byte to tell a bare list from a {"data": [...]} page
+            prefix = "item" if body.peek(64).lstrip()[:1] == b"[" else "data.item"
+            return self._stream_items(body, prefix)
+
+        result = self._json(response)
+        return result if isinstance(result, list) else result.get("data", [])
+
+    def _market_token_ids(self, market: Dict[str, Any], endpoint: str) -> Optional[List[str]]:
+        """Extract token IDs from a CLOB market entry, or None if it has none"""
+        # Extract token IDs from tokens array
+        # Each token is an object: {"token_id": "...", "outcome": "...", "price": ...}
+        tokens = market.get("tokens", [])
+        if tokens and isinstance(tokens, list):
+            token_ids = []
+            for token in tokens:
+                if isinstance(token, dict) and "token_id" in token:
+                    token_ids.append(str(token["token_id"]))
+                elif isinstance(token, str):
+                    # In case it's already a string
+                    token_ids.append(token)
 
-        except requests.RequestException as e:
-            raise ExchangeError(f"Network error fetching token IDs: {e}")
+            if token_ids:
+                if self.verbose:
+                    print(f"✓ Found {len(token_ids)} token IDs via {endpoint}")
+                    for i, tid in enumerate(token_ids):
+                        outcome = (
+                            tokens[i].get("outcome", f"outcome_{i}")
+                            if isinstance(tokens[i], dict)
+                            else f"outcome_{i}"
+                        )
+                        print(f"  [{i}] {outcome}: {tid}")
+                return token_ids
+
+        # Fallback: check for clobTokenIds
+        clob_tokens = market.get("clobTokenIds")
+        if clob_tokens and isinstance(clob_tokens, list):
+            token_ids = [str(t) for t in clob_tokens]
+            if self.verbose:
+                print(f"✓ Found token IDs via clobTokenIds: {token_ids}")
+            return token_ids
+        return None
 
     def create_order(
         self,
@@ -1045,9 +1125,9 @@ class Polymarket(Exchange):
                 query_params["tag_id"] = tag_id
 
             try:
-                response = requests.get(url, params=query_params, timeout=10)
+                response = self._session.get(url, params=query_params, timeout=10)
                 response.raise_for_status()
-                data = response.json()
+                data = self._json(response)
 
                 markets_data = data if isinstance(data, list) else []
                 if not markets_data:
@@ -1266,10 +1346,18 @@ class Polymarket(Exchange):
         try:
             if isinstance(timestamp, (int, float)):
                 return datetime.fromtimestamp(timestamp)
+            if type(timestamp) is str:
+                return self._parse_iso_datetime(timestamp)
             return datetime.fromisoformat(str(timestamp))
         except (ValueError, TypeError):
             return None
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_iso_datetime(ts: str) -> datetime:
+        """Parse an ISO 8601 string (cached, markets share a small set of end dates)."""
+        return datetime.fromisoformat(ts)
+
     def get_websocket(self) -> PolymarketWebSocket:
         """
         Get WebSocket instance for real-time orderbook updates.
@@ -1393,9 +1481,9 @@ class Polymarket(Exchange):
 
         @self._retry_on_failure
         def _fetch() -> List[Dict[str, Any]]:
-            resp = requests.get(self.PRICES_HISTORY_URL, params=params, timeout=self.timeout)
+            resp = self._session.get(self.PRICES_HISTORY_URL, params=params, timeout=self.timeout)
             resp.raise_for_status()
-            payload = resp.json()
+            payload = self._json(resp)
             history = payload.get("history", [])
             if not isinstance(history, list):
                 raise ExchangeError("Invalid response: 'history' must be a list.")
@@ -1608,13 +1696,13 @@ class Polymarket(Exchange):
                 "limit": limit_,
                 "offset": offset_,
             }
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.BASE_URL}/markets",
                 params=params,
                 timeout=self.timeout,
             )
             resp.raise_for_status()
-            raw = resp.json()
+            raw = self._json(resp)
             if not isinstance(raw, list):
                 raise ExchangeError("Gamma /markets response must be a list.")
             return [self._parse_market(m) for m in raw]
@@ -1721,13 +1809,13 @@ class Polymarket(Exchange):
                 "offset": offset_,
             }
 
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.DATA_API_URL}/trades",
                 params=params,
                 timeout=self.timeout,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = self._json(resp)
             if not isinstance(data, list):
                 raise ExchangeError("Data-API /trades response must be a list.")
             return data
@@ -1893,9 +1981,9 @@ class Polymarket(Exchange):
 
         @self._retry_on_failure
         def _fetch() -> dict:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = self._session.get(url, timeout=self.timeout)
             resp.raise_for_status()
-            data = resp.json()
+            data = self._json(resp)
             if not isinstance(data, dict):
                 raise ExchangeError("Gamma get_tag_by_slug response must be an object.")
             return data
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionBreakdown:
     """Position breakdown for NAV calculation"""
 
@@ -12,7 +12,7 @@ class PositionBreakdown:
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class NAV:
     """Net Asset Value breakdown"""
 
@@ -18,7 +18,7 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Represents an order on a prediction market"""
 
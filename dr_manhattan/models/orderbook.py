@@ -97,6 +97,24 @@ class OrderbookManager:
         """Update orderbook for a token."""
         self.orderbooks[token_id] = orderbook
 
+    def update_levels(
+        self,
+        token_id: str,
+        bids: List[PriceLevel],
+        asks: List[PriceLevel],
+        timestamp: int,
+        market_id: str,
+    ):
+        """Update orderbook for a token from its parts (no intermediate dict at the call site)."""
+        # A fresh dict per update (never mutated in place) so readers on other
+        # threads always see bids and asks from the same tick
+        self.orderbooks[token_id] = {
+            "bids": bids,
+            "asks": asks,
+            "timestamp": timestamp,
+            "market_id": market_id,
+        }
+
     def get(self, token_id: str) -> Optional[Dict[str, List[PriceLevel]]]:
         """Get orderbook for a token."""
         return self.orderbooks.get(token_id)
@@ -0,0 +1,29 @@
+from typing import Any, Callable, Iterator, Optional
+
+
+def orjson_loads() -> Optional[Callable[[bytes], Any]]:
+    """
+    Return orjson.loads if orjson is installed, else None.
+
+    orjson decodes integers wider than 64 bits as floats, so exchanges only
+    use it when explicitly enabled (``use_orjson`` config).
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+def ijson_items() -> Optional[Callable[..., Iterator[Any]]]:
+    """
+    Return ijson.items if ijson is installed, else None.
+
+    Used to stream large JSON arrays item by item so a scan can stop at the
+    first match instead of decoding the whole body.
+    """
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson.items
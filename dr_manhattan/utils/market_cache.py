@@ -0,0 +1,28 @@
+from typing import Any, Callable
+
+from ..models.market import Market
+
+
+def freeze(value: Any) -> Any:
+    """Immutable snapshot of a market field, so in-place edits register as changes."""
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, freeze(item)) for key, item in value.items())
+    return value
+
+
+def cached_on_market(market: Market, name: str, source: Any, build: Callable[[], Any]) -> Any:
+    """
+    Return build() cached on the Market under name, keyed on source.
+
+    source is the frozen snapshot of the fields the value is derived from; the
+    cached value is rebuilt whenever it no longer matches. Cached values should be
+    immutable (tuples, frozensets, strings) since every caller shares them.
+    """
+    entry = market.__dict__.get(name)
+    if entry is not None and entry[0] == source:
+        return entry[1]
+    value = build()
+    market.__dict__[name] = (source, value)
+    return value
@@ -185,3 +185,137 @@ def test_fetch_positions():
 
     assert isinstance(positions, list)
     assert len(positions) == 0
+
+
+def test_call_with_retry_retries_network_errors():
+    """Test network errors are retried until success"""
+    from unittest.mock import patch
+
+    from dr_manhattan.base.errors import NetworkError
+
+    exchange = MockExchange({"max_retries": 2})
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise NetworkError("connection reset")
+        return "ok"
+
+    with patch("dr_manhattan.base.exchange.time.sleep"):
+        assert exchange._call_with_retry(flaky) == "ok"
+
+    assert len(attempts) == 3
+
+
+def test_call_with_retry_does_not_retry_other_errors():
+    """Test non-network errors propagate without retry"""
+    import pytest
+
+    exchange = MockExchange({"max_retries": 2})
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError):
+        exchange._call_with_retry(broken)
+
+    assert len(attempts) == 1
+
+
+def _open_order(order_id):
+    return Order(
+        id=order_id,
+        market_id="m1",
+        outcome="Yes",
+        side=OrderSide.BUY,
+        price=0.5,
+        size=1,
+        filled=0,
+        status=None,
+        created_at=None,
+        updated_at=None,
+    )
+
+
+class BatchCancelExchange(MockExchange):
+    """Mock exchange that declares the cancel_orders capability"""
+
+    def describe(self):
+        info = super().describe()
+        info["has"]["cancel_orders"] = True
+        return info
+
+
+def test_client_cancel_all_orders_uses_declared_batch_cancel():
+    """Test batch-capable exchanges cancel in one call and report per-order results"""
+    from unittest.mock import Mock
+
+    from dr_manhattan.base.errors import ExchangeError
+    from dr_manhattan.base.exchange_client import ExchangeClient
+
+    exchange = BatchCancelExchange({})
+    exchange.fetch_open_orders = Mock(return_value=[_open_order("a"), _open_order("b")])
+    exchange.cancel_orders = Mock(return_value=([_open_order("a")], {"b": ExchangeError("x")}))
+    exchange.cancel_order = Mock()
+
+    assert ExchangeClient(exchange).cancel_all_orders(market_id="m1") == 1
+    exchange.cancel_orders.assert_called_once_with([("a", "m1"), ("b", "m1")])
+    exchange.cancel_order.assert_not_called()
+    assert exchange.fetch_open_orders.call_count == 1
+
+
+def test_client_cancel_all_orders_without_capability_cancels_individually():
+    """Test exchanges that don't declare cancel_orders get per-order cancels"""
+    from unittest.mock import Mock
+
+    from dr_manhattan.base.exchange_client import ExchangeClient
+
+    exchange = MockExchange({})
+    exchange.fetch_open_orders = Mock(return_value=[_open_order("a"), _open_order("b")])
+    exchange.cancel_all_orders = Mock()
+    exchange.cancel_order = Mock()
+
+    assert ExchangeClient(exchange).cancel_all_orders(market_id="m1") == 2
+    assert exchange.cancel_order.call_count == 2
+    exchange.cancel_all_orders.assert_not_called()
+
+
+def test_client_cancel_all_orders_respects_cancel_order_override():
+    """Test subclasses overriding cancel_order skip the batch cancel"""
+    from unittest.mock import Mock
+
+    from dr_manhattan.base.exchange_client import ExchangeClient
+
+    cancelled = []
+
+    class TrackingClient(ExchangeClient):
+        def cancel_order(self, order_id, market_id=None):
+            cancelled.append(order_id)
+
+    exchange = BatchCancelExchange({})
+    exchange.fetch_open_orders = Mock(return_value=[_open_order("a")])
+    exchange.cancel_orders = Mock()
+
+    assert TrackingClient(exchange).cancel_all_orders(market_id="m1") == 1
+    assert cancelled == ["a"]
+    exchange.cancel_orders.assert_not_called()
+
+
+def test_check_rate_limit_serialises_threads():
+    """Test rate-limit bookkeeping waits for the lock held by another request"""
+    import threading
+
+    exchange = MockExchange({})
+    worker = threading.Thread(target=exchange._check_rate_limit)
+
+    with exchange._rate_limit_lock:
+        worker.start()
+        worker.join(timeout=0.05)
+        assert worker.is_alive()
+        assert exchange.request_times == []
+
+    worker.join(timeout=1)
+    assert len(exchange.request_times) == 1
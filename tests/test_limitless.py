@@ -1,5 +1,6 @@
 """Tests for Limitless exchange implementation."""
 
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -10,6 +11,7 @@ from dr_manhattan.base.errors import (
     ExchangeError,
     InvalidOrder,
     MarketNotFound,
+    NetworkError,
 )
 
 
@@ -48,6 +50,35 @@ class TestLimitlessBasic:
         assert exchange._account is None
         assert exchange._address is None
 
+    def test_verbose_leaves_module_logger_level(self):
+        """Test verbose mode does not change the shared module logger level."""
+        from dr_manhattan.exchanges import limitless
+
+        previous = limitless.logger.level
+        Limitless({"verbose": True})
+        assert limitless.logger.level == previous
+
+    def test_swallowed_fetch_failure_logs_warning(self):
+        """Test a failed orderbook fetch is logged at warning level."""
+        from dr_manhattan.exchanges import limitless
+
+        exchange = Limitless({})
+        with (
+            patch.object(exchange, "_request", side_effect=NetworkError("boom")),
+            patch.object(limitless.logger, "warning") as warning,
+        ):
+            assert exchange.get_orderbook("123") == {"bids": [], "asks": []}
+        warning.assert_called_once()
+
+    def test_session_uses_pooled_adapter(self):
+        """Test the shared session keeps a connection pool without urllib3 retries."""
+        exchange = Limitless({})
+        adapter = exchange._session.get_adapter(exchange.BASE_RPC_URL)
+
+        assert adapter is exchange._session.get_adapter(exchange.BASE_URL)
+        assert adapter._pool_maxsize == Limitless.HTTP_POOL_SIZE
+        assert adapter.max_retries.total == 0
+
     def test_ensure_authenticated_raises_without_credentials(self):
         """Test that operations requiring auth raise AuthenticationError."""
         exchange = Limitless({})
@@ -179,6 +210,16 @@ class TestLimitlessOrderParsing:
         assert order.side == OrderSide.SELL
         assert order.status == OrderStatus.FILLED
 
+    def test_parse_order_side_variants(self):
+        """Test parsing numeric and mixed-case side values."""
+        exchange = Limitless({})
+
+        assert exchange._parse_order({"side": 0}).side == OrderSide.BUY
+        assert exchange._parse_order({"side": 1}).side == OrderSide.SELL
+        assert exchange._parse_order({"side": "Buy"}).side == OrderSide.BUY
+        assert exchange._parse_order({"side": "SELL"}).side == OrderSide.SELL
+        assert exchange._parse_order({"status": "LIVE"}).status == OrderStatus.OPEN
+
     def test_parse_order_status_variants(self):
         """Test parsing various order status values."""
         exchange = Limitless({})
@@ -222,6 +263,24 @@ class TestLimitlessPositionParsing:
         assert position.current_price == 0.65
         assert position.unrealized_pnl == 15.0  # (0.65 - 0.50) * 100
 
+    def test_parse_portfolio_position_both_sides(self):
+        """Test parsing portfolio entry holding both outcomes."""
+        exchange = Limitless({})
+
+        positions = exchange._parse_portfolio_position(
+            {
+                "market": {"slug": "test-market"},
+                "tokensBalance": {"yes": "100000000", "no": "25000000"},
+                "positions": {"yes": {"fillPrice": "600000"}, "no": {"fillPrice": 0.35}},
+                "latestTrade": {"latestYesPrice": 0.70, "latestNoPrice": 0.30},
+            }
+        )
+
+        assert [(p.outcome, p.size) for p in positions] == [("Yes", 100.0), ("No", 25.0)]
+        assert positions[0].average_price == 0.6
+        assert positions[1].average_price == 0.35
+        assert positions[1].current_price == 0.30
+
     def test_parse_position_flat_structure(self):
         """Test parsing position with flat structure."""
         exchange = Limitless({})
@@ -240,6 +299,13 @@ class TestLimitlessPositionParsing:
         assert position.outcome == "No"
         assert position.size == 50.0
 
+    def test_fget_first_present_key_wins(self):
+        """Test _fget uses the first present key and maps falsy values to default."""
+        assert Limitless._fget({"size": "2.5", "balance": 9}, "size", "balance") == 2.5
+        assert Limitless._fget({"balance": 9}, "size", "balance") == 9.0
+        assert Limitless._fget({"size": None, "balance": 9}, "size", "balance") == 0.0
+        assert Limitless._fget({}, "size", default=1.0) == 1.0
+
 
 class TestLimitlessDatetimeParsing:
     """Test datetime parsing logic."""
@@ -275,6 +341,16 @@ class TestLimitlessDatetimeParsing:
         dt = exchange._parse_datetime("invalid")
         assert dt is None
 
+    def test_parse_datetime_passthrough_and_float(self):
+        """Test datetime inputs pass through and float timestamps are UTC."""
+        exchange = Limitless({})
+        now = datetime.now(timezone.utc)
+
+        assert exchange._parse_datetime(now) is now
+        assert exchange._parse_datetime(1735689600.5) == datetime(
+            2025, 1, 1, 0, 0, 0, 500000, tzinfo=timezone.utc
+        )
+
 
 class TestLimitlessWithMockedSession:
     """Tests with mocked HTTP session."""
@@ -319,6 +395,60 @@ class TestLimitlessWithMockedSession:
         assert markets[0].question == "Test Market 1?"
         assert markets[0].prices["Yes"] == 0.60
 
+    def test_iter_markets_paginates(self, exchange_with_mock, mock_session):
+        """Test iter_markets walks pages until a short page is returned."""
+
+        def page_response(slugs):
+            response = Mock()
+            response.json.return_value = {
+                "data": [{"slug": slug, "title": f"{slug}?", "status": "active"} for slug in slugs]
+            }
+            response.raise_for_status = Mock()
+            response.status_code = 200
+            return response
+
+        mock_session.request.side_effect = [
+            page_response(["market-1", "market-2"]),
+            page_response(["market-3"]),
+        ]
+
+        markets = list(exchange_with_mock.iter_markets({"limit": 2}))
+
+        assert [m.id for m in markets] == ["market-1", "market-2", "market-3"]
+        assert mock_session.request.call_count == 2
+        assert mock_session.request.call_args.kwargs["params"]["page"] == 2
+
+    def test_iter_markets_stops_on_empty_page_with_zero_limit(
+        self, exchange_with_mock, mock_session
+    ):
+        """Test iter_markets clamps limit=0 and stops on an empty page."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"data": []}
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_session.request.return_value = mock_response
+
+        assert list(exchange_with_mock.iter_markets({"limit": 0})) == []
+        assert mock_session.request.call_count == 1
+        assert mock_session.request.call_args.kwargs["params"]["limit"] == 1
+
+    def test_iter_markets_filters_closed_like_fetch_markets(self, exchange_with_mock, mock_session):
+        """Test iter_markets applies the same active filter as fetch_markets."""
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "data": [
+                {"slug": "open-market", "title": "Open?", "status": "active"},
+                {"slug": "done-market", "title": "Done?", "status": "resolved"},
+            ]
+        }
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_session.request.return_value = mock_response
+
+        markets = list(exchange_with_mock.iter_markets({"active": True}))
+
+        assert [m.id for m in markets] == ["open-market"]
+
     def test_fetch_market_success(self, exchange_with_mock, mock_session):
         """Test successful fetch_market."""
         mock_response = Mock()
@@ -488,6 +618,66 @@ class TestLimitlessAuthenticated:
         assert order.id == "order_456"
         assert order.side == OrderSide.SELL
 
+    def test_sign_order_matches_typed_data_encoding(self, authenticated_exchange):
+        """Test precomputed EIP-712 signing matches eth_account typed data signing."""
+        from eth_account.messages import encode_typed_data
+
+        exchange_address = "0x05c748E2f4DcDe0ec9Fa8DDc40DE6b867f923fa5"
+        address = authenticated_exchange._address
+        order = {
+            "salt": 1735689600000123,
+            "maker": address,
+            "signer": address,
+            "taker": "0x0000000000000000000000000000000000000000",
+            "tokenId": 987654321,
+            "makerAmount": 650000,
+            "takerAmount": 1000000,
+            "expiration": 0,
+            "nonce": 0,
+            "feeRateBps": 300,
+            "side": 0,
+            "signatureType": 0,
+        }
+        typed_data = {
+            "types": {
+                "EIP712Domain": [
+                    {"name": "name", "type": "string"},
+                    {"name": "version", "type": "string"},
+                    {"name": "chainId", "type": "uint256"},
+                    {"name": "verifyingContract", "type": "address"},
+                ],
+                "Order": [
+                    {"name": "salt", "type": "uint256"},
+                    {"name": "maker", "type": "address"},
+                    {"name": "signer", "type": "address"},
+                    {"name": "taker", "type": "address"},
+                    {"name": "tokenId", "type": "uint256"},
+                    {"name": "makerAmount", "type": "uint256"},
+                    {"name": "takerAmount", "type": "uint256"},
+                    {"name": "expiration", "type": "uint256"},
+                    {"name": "nonce", "type": "uint256"},
+                    {"name": "feeRateBps", "type": "uint256"},
+                    {"name": "side", "type": "uint8"},
+                    {"name": "signatureType", "type": "uint8"},
+                ],
+            },
+            "primaryType": "Order",
+            "domain": {
+                "name": "Limitless CTF Exchange",
+                "version": "1",
+                "chainId": 8453,
+                "verifyingContract": exchange_address,
+            },
+            "message": order,
+        }
+
+        expected = authenticated_exchange._account.sign_message(
+            encode_typed_data(full_message=typed_data)
+        ).signature.hex()
+        signature = authenticated_exchange._sign_order_eip712(order, exchange_address)
+
+        assert signature == "0x" + expected.removeprefix("0x")
+
     def test_create_order_invalid_price(self, authenticated_exchange):
         """Test order creation with invalid price."""
         with pytest.raises(InvalidOrder, match="Price must be between 0 and 1"):
@@ -523,12 +713,70 @@ class TestLimitlessAuthenticated:
         assert order.id == "order_123"
         assert order.status == OrderStatus.CANCELLED
 
+    def test_cancel_orders_success(self, authenticated_exchange):
+        """Test cancelling a few orders individually across markets."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"success": True}
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        authenticated_exchange._session.request.return_value = mock_response
+
+        orders, failed = authenticated_exchange.cancel_orders(
+            [("order_1", "market-a"), ("order_2", "market-a"), ("order_3", "market-b")]
+        )
+
+        assert [o.id for o in orders] == ["order_1", "order_2", "order_3"]
+        assert [o.market_id for o in orders] == ["market-a", "market-a", "market-b"]
+        assert all(o.status == OrderStatus.CANCELLED for o in orders)
+        assert failed == {}
+        assert authenticated_exchange._session.request.call_count == 3
+
+    def test_cancel_orders_bulk_when_group_covers_market(self, authenticated_exchange):
+        """Test a market group covering every open order uses one bulk cancel."""
+        ids = ["order_1", "order_2", "order_3"]
+        open_orders = [Limitless._cancelled_order(oid, "market-a") for oid in ids]
+
+        with (
+            patch.object(authenticated_exchange, "fetch_open_orders", return_value=open_orders),
+            patch.object(authenticated_exchange, "cancel_all_orders") as bulk,
+            patch.object(authenticated_exchange, "cancel_order") as single,
+        ):
+            orders, failed = authenticated_exchange.cancel_orders(
+                [(oid, "market-a") for oid in ids]
+            )
+
+        bulk.assert_called_once_with(market_id="market-a")
+        single.assert_not_called()
+        assert sorted(o.id for o in orders) == ids
+        assert failed == {}
+
+    def test_cancel_orders_skips_bulk_when_other_orders_open(self, authenticated_exchange):
+        """Test the bulk endpoint is not used when it would cancel unlisted orders."""
+        ids = ["order_1", "order_2", "order_3"]
+        open_orders = [Limitless._cancelled_order(oid, "market-a") for oid in ids + ["keep"]]
+
+        def cancel(order_id, market_id=None):
+            if order_id == "order_2":
+                raise ExchangeError("boom")
+            return Limitless._cancelled_order(order_id, market_id)
+
+        with (
+            patch.object(authenticated_exchange, "fetch_open_orders", return_value=open_orders),
+            patch.object(authenticated_exchange, "cancel_all_orders") as bulk,
+            patch.object(authenticated_exchange, "cancel_order", side_effect=cancel),
+        ):
+            orders, failed = authenticated_exchange.cancel_orders(
+                [(oid, "market-a") for oid in ids]
+            )
+
+        bulk.assert_not_called()
+        assert [o.id for o in orders] == ["order_1", "order_3"]
+        assert list(failed) == ["order_2"]
+
     def test_fetch_balance_success(self, authenticated_exchange):
         """Test successful balance fetch via on-chain RPC."""
-        import requests
-
-        # Balance uses RPC, not session. Mock requests.post
-        with patch.object(requests, "post") as mock_post:
+        # Balance uses the Base RPC through the shared session
+        with patch.object(authenticated_exchange._session, "post") as mock_post:
             mock_response = Mock()
             # 1000.5 USDC = 1000500000 in 6 decimals = 0x3B9ACA00 + ~500k
             # Let's use 1000000000 = 1000 USDC = 0x3B9ACA00
@@ -539,6 +787,21 @@ class TestLimitlessAuthenticated:
 
             assert "USDC" in balance
             assert balance["USDC"] == 1000.0
+            call_data = mock_post.call_args.kwargs["json"]["params"][0]["data"]
+            assert call_data == (
+                "0x70a08231" + "0" * 24 + authenticated_exchange._address[2:].lower()
+            )
+
+    def test_fetch_balance_empty_rpc_result_falls_back_to_api(self, authenticated_exchange):
+        """Test an empty 0x eth_call result is not read as a zero balance."""
+        with patch.object(authenticated_exchange, "_eth_call", return_value="0x"):
+            with patch.object(
+                authenticated_exchange, "_request", return_value={"balance": "12.5"}
+            ) as mock_request:
+                balance = authenticated_exchange.fetch_balance()
+
+        assert balance == {"USDC": 12.5}
+        assert mock_request.call_args.args[1] == "/portfolio/trading/allowance"
 
     def test_fetch_positions_success(self, authenticated_exchange):
         """Test successful positions fetch."""
@@ -563,6 +826,68 @@ class TestLimitlessAuthenticated:
         assert positions[0].outcome == "Yes"
         assert positions[0].size == 100.0
 
+    def test_fetch_positions_filters_market_before_parsing(self, authenticated_exchange):
+        """Test positions for other markets are skipped without being parsed."""
+        mock_api_response = {
+            "clob": [
+                {"market": {"slug": "other-market"}, "tokensBalance": {"yes": "5000000"}},
+                {"market": {"slug": "test-market"}, "tokensBalance": {"no": "2000000"}},
+            ]
+        }
+        with patch.object(authenticated_exchange, "_request", return_value=mock_api_response):
+            with patch.object(
+                authenticated_exchange,
+                "_parse_portfolio_position",
+                wraps=authenticated_exchange._parse_portfolio_position,
+            ) as mock_parse:
+                positions = authenticated_exchange.fetch_positions(market_id="test-market")
+
+        assert mock_parse.call_count == 1
+        assert [(p.market_id, p.outcome, p.size) for p in positions] == [("test-market", "No", 2.0)]
+
+    def test_calculate_nav(self, authenticated_exchange):
+        """Test NAV combines cash and position values."""
+        from dr_manhattan.models.market import Market
+        from dr_manhattan.models.position import Position
+
+        market = Market(
+            id="test-market",
+            question="Test?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={},
+            tick_size=0.001,
+        )
+        positions = [
+            Position("test-market", "Yes", 100.0, 0.5, 0.6),
+            Position("test-market", "No", 50.0, 0.4, 0.4),
+        ]
+
+        with (
+            patch.object(authenticated_exchange, "fetch_balance", return_value={"USDC": 250.0}),
+            patch.object(
+                authenticated_exchange, "fetch_positions_for_market", return_value=positions
+            ),
+        ):
+            nav = authenticated_exchange.calculate_nav(market)
+
+        assert nav.cash == 250.0
+        assert nav.positions_value == pytest.approx(80.0)
+        assert nav.nav == pytest.approx(330.0)
+        assert [p["outcome"] for p in nav.positions] == ["Yes", "No"]
+
+    def test_close_shuts_down_worker_pool(self, authenticated_exchange):
+        """Test close releases the session and the lazily created worker pool."""
+        executor = authenticated_exchange._get_executor()
+
+        authenticated_exchange.close()
+
+        assert executor._shutdown
+        assert authenticated_exchange._executor is None
+
     def test_fetch_open_orders_success(self, authenticated_exchange):
         """Test successful open orders fetch."""
         mock_response = Mock()
@@ -616,6 +941,33 @@ class TestLimitlessHelperMethods:
         token_ids = Limitless._extract_token_ids(market)
         assert token_ids == ["token_yes", "token_no"]
 
+    def test_token_outcome_map_and_order_labeling(self):
+        """Test token -> outcome mapping falls back to clobTokenIds and labels orders."""
+        from dr_manhattan.models.market import Market
+
+        market = Market(
+            id="test",
+            question="Test?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={"clobTokenIds": ["111", "222"]},
+            tick_size=0.01,
+        )
+
+        mapping = Limitless._token_outcome_map(market)
+        assert mapping == {"111": "Yes", "222": "No"}
+        assert Limitless._token_outcome_map(market) is mapping
+
+        market.metadata["tokens"] = {"Yes": "333", "No": "444"}
+        assert Limitless._token_outcome_map(market) == {"333": "Yes", "444": "No"}
+        market.metadata.pop("tokens")
+
+        order = Limitless({})._parse_order({"id": "o1", "tokenId": 222}, mapping)
+        assert order.outcome == "No"
+
     def test_extract_token_ids_from_json_string(self):
         """Test extracting token IDs from JSON string."""
         from dr_manhattan.models.market import Market
@@ -704,6 +1056,11 @@ class TestLimitlessHelperMethods:
         assert "btc-100k" in text
         assert "crypto" in text
 
+        # Unchanged fields reuse the cached text; edited fields rebuild it
+        assert Limitless._build_search_text(market) is text
+        market.metadata["description"] = "Halving cycle"
+        assert "halving cycle" in Limitless._build_search_text(market)
+
 
 class TestLimitlessPriceHistory:
     """Test price history functionality."""
@@ -725,6 +1082,48 @@ class TestLimitlessPriceHistory:
         # Should be sorted by timestamp
         assert points[0].timestamp < points[1].timestamp < points[2].timestamp
 
+    def test_parse_history_skips_millisecond_timestamps(self):
+        """Test out-of-range epoch rows are skipped instead of raising."""
+        history = [
+            {"timestamp": 1700000000, "price": 0.5},
+            {"timestamp": 1700000000000, "price": 0.6},
+        ]
+
+        points = Limitless._parse_history(history)
+
+        assert [p.price for p in points] == [0.5]
+
+    def test_fetch_price_history_as_dataframe(self):
+        """Test fetch_price_history returns a sorted DataFrame."""
+        from dr_manhattan.models.market import Market
+
+        exchange = Limitless({})
+        market = Market(
+            id="test-market",
+            question="Test?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={},
+            tick_size=0.001,
+        )
+        history = {
+            "data": [
+                {"timestamp": 1735693200, "price": 0.55},
+                {"timestamp": "2025-01-01T00:00:00Z", "price": "0.50"},
+                {"timestamp": None, "price": 0.99},
+            ]
+        }
+
+        with patch.object(exchange, "_request", return_value=history):
+            df = exchange.fetch_price_history(market, as_dataframe=True)
+
+        assert list(df.columns) == ["timestamp", "price"]
+        assert df["price"].tolist() == [0.50, 0.55]
+        assert df["timestamp"].is_monotonic_increasing
+
     def test_fetch_price_history_invalid_interval(self):
         """Test fetch_price_history with invalid interval."""
         exchange = Limitless({})
@@ -790,6 +1189,14 @@ class TestLimitlessSearchMarkets:
         assert len(results) == 1
         assert results[0].id == "btc-100k"
 
+    def test_search_markets_with_keywords_and_limit(self, exchange_with_markets):
+        """Test keyword filtering and limit truncation."""
+        results = exchange_with_markets.search_markets(keywords=["WILL", "reach"])
+        assert [m.id for m in results] == ["btc-100k", "eth-5k"]
+
+        results = exchange_with_markets.search_markets(keywords=["will"], limit=1)
+        assert [m.id for m in results] == ["btc-100k"]
+
     def test_search_markets_empty_result(self, exchange_with_markets):
         """Test searching with no matches."""
         results = exchange_with_markets.search_markets(query="nonexistent")
@@ -866,6 +1273,7 @@ class TestLimitlessWebSocket:
         assert len(update.bids) == 2
         assert len(update.asks) == 2
         assert update.bids[0] == (0.50, 100)
+        assert not hasattr(update, "__dict__")  # slots dataclass
 
     def test_price_update_dataclass(self):
         """Test PriceUpdate dataclass."""
@@ -927,6 +1335,172 @@ class TestLimitlessWebSocket:
         assert len(ws._price_callbacks) == 1
         assert len(ws._error_callbacks) == 1
 
+    def test_websocket_event_loop_falls_back_without_uvloop(self):
+        """Test the background loop falls back to asyncio when uvloop is unavailable."""
+        import asyncio
+        import sys
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        with patch.dict(sys.modules, {"uvloop": None}):
+            loop = LimitlessWebSocket()._new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.BaseEventLoop)
+        finally:
+            loop.close()
+
+        loop = LimitlessWebSocket({"use_uvloop": False})._new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.BaseEventLoop)
+        finally:
+            loop.close()
+
+    def test_websocket_dispatches_sync_and_async_callbacks(self):
+        """Test callbacks are classified at registration and run in order."""
+        import asyncio
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket()
+        seen = []
+
+        def sync_cb(update):
+            seen.append(("sync", update))
+
+        async def async_cb(update):
+            seen.append(("async", update))
+
+        ws.on_price(async_cb).on_price(sync_cb)
+        assert [is_async for _, is_async in ws._price_callbacks] == [True, False]
+
+        asyncio.run(ws._run_callbacks(ws._price_callbacks, "tick", "Price"))
+        assert seen == [("async", "tick"), ("sync", "tick")]
+
+    def test_websocket_bypass_parsing_delivers_raw_payload(self):
+        """Test bypass_parsing hands raw dicts to callbacks and still feeds the manager."""
+        import asyncio
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket({"bypass_parsing": True})
+        received = []
+        ws.on_orderbook(received.append)
+        payload = {
+            "marketSlug": "test-market",
+            "orderbook": {"bids": [{"price": 0.4, "size": 10}], "asks": []},
+            "timestamp": "2024-01-01T00:00:00Z",
+        }
+
+        async def _test():
+            await ws.watch_orderbook_by_market("test-market", ["yes_token"])
+            handler = ws.sio.handlers[ws.NAMESPACE]["orderbookUpdate"]
+            await handler(payload)
+
+        asyncio.run(_test())
+
+        assert received == [payload]
+        assert ws.orderbook_manager.get("yes_token")["bids"] == [(0.4, 10.0)]
+
+    def test_websocket_parse_levels_skips_malformed(self):
+        """Test level parsing drops bad entries and non-positive prices."""
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        levels = [
+            {"price": "0.5", "size": "10"},
+            {"price": "bad", "size": 1},
+            {"price": 0, "size": 5},
+            {"price": 0.4},
+        ]
+
+        assert LimitlessWebSocket._parse_levels(levels) == [(0.5, 10.0), (0.4, 0.0)]
+
+    def test_websocket_orjson_packet_roundtrip(self):
+        """Test the opt-in orjson packet class encodes and decodes Socket.IO packets."""
+        pytest.importorskip("orjson")
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket({"use_orjson": True})
+        packet_class = ws.sio.packet_class
+        assert packet_class is not LimitlessWebSocket().sio.packet_class
+
+        encoded = packet_class(
+            packet_type=2, data=["orderbookUpdate", {"bids": [1.5]}], namespace="/markets"
+        ).encode()
+        assert encoded == '2/markets,["orderbookUpdate",{"bids":[1.5]}]'
+        assert packet_class(encoded_packet=encoded).data == ["orderbookUpdate", {"bids": [1.5]}]
+
+    def test_websocket_parse_timestamp(self):
+        """Test WS timestamps accept ISO strings, seconds and milliseconds."""
+        from dr_manhattan.exchanges.limitless_ws import _parse_timestamp
+
+        expected = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert _parse_timestamp("2024-01-01T00:00:00Z") == expected
+        assert _parse_timestamp("2024-01-01T00:00:00+00:00") == expected
+        assert _parse_timestamp(1704067200) == expected
+        assert _parse_timestamp(1704067200000) == expected
+        assert _parse_timestamp(None).tzinfo is timezone.utc
+
+    def test_websocket_orderbook_timestamp_ms(self):
+        """Test orderbook updates carry epoch millis taken from the raw payload."""
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket()
+        base = {"marketSlug": "m", "orderbook": {"bids": [], "asks": []}}
+
+        millis = ws._parse_orderbook_update({**base, "timestamp": 1704067200123})
+        iso = ws._parse_orderbook_update({**base, "timestamp": "2024-01-01T00:00:00.5Z"})
+
+        assert millis.timestamp_ms == 1704067200123
+        assert iso.timestamp_ms == 1704067200500
+
+    def test_websocket_invert_levels(self):
+        """Test No-side levels are 1 - price, rounded, with order flipped by inversion."""
+        from dr_manhattan.exchanges.limitless_ws import _invert_levels
+
+        asks = [(0.52, 150.0), (0.6, 10.0), (0.999, 1.0)]
+
+        assert _invert_levels(asks) == [(0.48, 150.0), (0.4, 10.0), (0.001, 1.0)]
+        assert _invert_levels([(0.5, 1.0), (0.49, 2.0)]) == [
+            (0.5, 1.0),
+            (0.51, 2.0),
+        ]
+
+    def test_websocket_invert_levels_matches_round(self):
+        """Test the tick-grid table and the round() fallback agree with round(1 - p, 3)."""
+        from dr_manhattan.exchanges.limitless_ws import _invert_levels
+
+        on_grid = [(float(f"{i / 1000}"), 1.0) for i in range(1001)]
+        off_grid = [(i / 10000, 1.0) for i in range(10001)]
+
+        for levels in (on_grid, off_grid, on_grid[:5] + [(0.0635, 2.0)]):
+            assert _invert_levels(levels) == [(round(1 - p, 3), s) for p, s in levels]
+
+    def test_watch_orderbook_by_market_inverts_no_book(self):
+        """Test the No token book is the sorted inversion of the Yes book."""
+        import asyncio
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket()
+        payload = {
+            "marketSlug": "m",
+            "orderbook": {
+                "bids": [{"price": 0.45, "size": 1}, {"price": 0.48, "size": 2}],
+                "asks": [{"price": 0.55, "size": 3}, {"price": 0.52, "size": 4}],
+            },
+        }
+
+        async def _test():
+            await ws.watch_orderbook_by_market("m", ["yes", "no"])
+            await ws.sio.handlers[ws.NAMESPACE]["orderbookUpdate"](payload)
+
+        asyncio.run(_test())
+
+        no_book = ws.orderbook_manager.get("no")
+        assert no_book["bids"] == [(0.48, 4.0), (0.45, 3.0)]
+        assert no_book["asks"] == [(0.52, 2.0), (0.55, 1.0)]
+
     def test_websocket_subscribe_market(self):
         """Test subscribing to a market."""
         import asyncio
@@ -940,6 +1514,270 @@ class TestLimitlessWebSocket:
 
         asyncio.run(_test())
 
+    def test_websocket_subscriptions_coalesced(self):
+        """Test several subscription changes in one tick produce a single emit."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket, WebSocketState
+
+        async def _test():
+            ws = LimitlessWebSocket()
+            ws.state = WebSocketState.CONNECTED
+            ws.sio.emit = AsyncMock()
+
+            for slug in ("a", "b", "c"):
+                await ws.subscribe_market(slug)
+            await ws.unsubscribe_market("b")
+            await ws._flush_task
+
+            ws.sio.emit.assert_awaited_once()
+            assert ws.sio.emit.call_args.args[1] == {"marketSlugs": ["a", "c"]}
+
+        asyncio.run(_test())
+
+    def test_websocket_coalesce_orderbooks_latest_wins(self):
+        """Test snapshots arriving during a slow callback collapse to the newest one."""
+        import asyncio
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        async def _test():
+            ws = LimitlessWebSocket({"coalesce_orderbooks": True})
+            seen = []
+            release = asyncio.Event()
+
+            async def slow(update):
+                seen.append(update.bids[0][0])
+                await release.wait()
+
+            ws.on_orderbook(slow)
+
+            def book(price):
+                return {
+                    "marketSlug": "m",
+                    "orderbook": {"bids": [{"price": price, "size": 1}], "asks": []},
+                }
+
+            handler = ws._event_handlers["orderbookUpdate"]
+            await handler(book(0.1))
+            await asyncio.sleep(0)
+            assert seen == [0.1]
+
+            for price in (0.2, 0.3, 0.4):
+                await handler(book(price))
+            release.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert seen == [0.1, 0.4]
+
+            await ws.disconnect()
+            assert not ws._orderbook_dispatchers
+
+        asyncio.run(_test())
+
+    def test_websocket_receive_loop_waits_for_disconnect(self):
+        """Test _receive_loop parks until disconnect() instead of polling."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket, WebSocketState
+
+        async def _test():
+            ws = LimitlessWebSocket()
+            ws.sio.connect = AsyncMock()
+            await ws.connect()
+
+            waiter = asyncio.create_task(ws._receive_loop())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+            await ws.disconnect()
+            await asyncio.wait_for(waiter, timeout=1)
+            assert ws.state == WebSocketState.CLOSED
+
+        asyncio.run(_test())
+
+    def test_websocket_receive_loop_survives_transport_drop(self):
+        """Test a transport drop leaves _receive_loop waiting for Socket.IO to reconnect."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket, WebSocketState
+
+        async def _test():
+            ws = LimitlessWebSocket()
+            ws.sio.connect = AsyncMock()
+            await ws.connect()
+
+            waiter = asyncio.create_task(ws._receive_loop())
+            await ws.sio.handlers[ws.NAMESPACE]["disconnect"]()
+            await asyncio.sleep(0)
+
+            assert ws.state == WebSocketState.DISCONNECTED
+            assert not waiter.done()
+
+            await ws.disconnect()
+            await asyncio.wait_for(waiter, timeout=1)
+
+        asyncio.run(_test())
+
+    def test_websocket_start_and_stop_background_loop(self):
+        """Test start() connects on the background loop and stop() ends the thread."""
+        from unittest.mock import AsyncMock
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket({"use_uvloop": False})
+        ws.sio.connect = AsyncMock()
+
+        thread = ws.start(timeout=2)
+        assert thread.is_alive()
+        ws.sio.connect.assert_awaited_once()
+
+        ws.stop(timeout=2)
+        assert not thread.is_alive()
+        assert ws.loop.is_closed()
+
+    def test_websocket_start_pins_worker_thread(self):
+        """Test cpu_affinity is applied from inside the start() worker thread."""
+        import os
+        import threading
+        from unittest.mock import AsyncMock, patch
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        calls = []
+
+        def fake_setaffinity(pid, cpus):
+            calls.append((pid, cpus, threading.current_thread()))
+
+        ws = LimitlessWebSocket({"use_uvloop": False, "cpu_affinity": [2, 3]})
+        ws.sio.connect = AsyncMock()
+
+        with patch.object(os, "sched_setaffinity", fake_setaffinity, create=True):
+            thread = ws.start(timeout=2)
+            ws.stop(timeout=2)
+
+        assert calls == [(0, {2, 3}, thread)]
+
+        single = LimitlessWebSocket({"cpu_affinity": 1})
+        with patch.object(os, "sched_setaffinity", fake_setaffinity, create=True):
+            single._apply_cpu_affinity()
+        assert calls[-1][1] == {1}
+
+    def test_websocket_start_propagates_connect_error(self):
+        """Test start() surfaces the underlying connect error and stops the loop."""
+        from unittest.mock import AsyncMock
+
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket({"use_uvloop": False})
+        ws.sio.connect = AsyncMock(side_effect=OSError("handshake refused"))
+
+        with pytest.raises(ConnectionError, match="handshake refused"):
+            ws.start(timeout=2)
+
+        ws._thread.join(timeout=2)
+        assert not ws._thread.is_alive()
+
+    def test_raw_websocket_requires_aiohttp(self):
+        """Test the raw transport fails early with an install hint without aiohttp."""
+        from dr_manhattan.exchanges.limitless_ws import RawLimitlessWebSocket
+
+        with patch.dict("sys.modules", {"aiohttp": None}):
+            with pytest.raises(ImportError, match=r"dr-manhattan\[aiohttp\]"):
+                RawLimitlessWebSocket()
+
+    def test_raw_websocket_handle_frame_dispatches_events(self):
+        """Test raw transport decodes event frames and answers pings."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from dr_manhattan.exchanges.limitless_ws import RawLimitlessWebSocket
+
+        ws = RawLimitlessWebSocket()
+        ws._raw_ws = Mock(closed=False, send_str=AsyncMock())
+        received = []
+        ws.on_price(received.append)
+
+        frame = (
+            '42/markets,["newPriceData",{"marketAddress":"0xabc",'
+            '"updatedPrices":{"yes":0.6,"no":0.4},"blockNumber":7}]'
+        )
+
+        async def _test():
+            await ws._handle_frame(frame)
+            await ws._handle_frame('42/markets,5["newPriceData",{"marketAddress":"0xdef"}]')
+            await ws._handle_frame("2")
+
+        asyncio.run(_test())
+
+        assert [u.market_address for u in received] == ["0xabc", "0xdef"]
+        assert received[0].yes_price == 0.6
+        ws._raw_ws.send_str.assert_awaited_once_with("3")
+
+    def test_raw_websocket_handshake_against_local_server(self):
+        """Test the raw transport handshake, subscription emit and event delivery."""
+        import asyncio
+
+        from aiohttp import web
+
+        from dr_manhattan.exchanges.limitless_ws import RawLimitlessWebSocket
+
+        frames_from_client = []
+
+        async def socketio_endpoint(request):
+            server_ws = web.WebSocketResponse()
+            await server_ws.prepare(request)
+            await server_ws.send_str('0{"sid":"abc","pingInterval":25000,"pingTimeout":20000}')
+            frames_from_client.append(await server_ws.receive_str())
+            await server_ws.send_str('40/markets,{"sid":"ns"}')
+            frames_from_client.append(await server_ws.receive_str())
+            await server_ws.send_str(
+                '42/markets,["orderbookUpdate",{"marketSlug":"m",'
+                '"orderbook":{"bids":[{"price":0.5,"size":1}],"asks":[]}}]'
+            )
+            await server_ws.receive()  # wait for the client to close
+            return server_ws
+
+        async def _test():
+            app = web.Application()
+            app.router.add_get("/socket.io/", socketio_endpoint)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = runner.addresses[0][1]
+
+            ws = RawLimitlessWebSocket()
+            ws.WS_URL = f"http://127.0.0.1:{port}"
+            got_update = asyncio.Event()
+            updates = []
+
+            def on_orderbook(update):
+                updates.append(update)
+                got_update.set()
+
+            ws.on_orderbook(on_orderbook)
+            await ws.subscribe_market("m")
+            try:
+                await ws.connect()
+                assert ws.connected
+                await asyncio.wait_for(got_update.wait(), timeout=2)
+            finally:
+                await ws.disconnect()
+                await runner.cleanup()
+
+            assert frames_from_client == [
+                "40/markets,",
+                '42/markets,["subscribe_market_prices",{"marketSlugs":["m"]}]',
+            ]
+            assert updates[0].slug == "m"
+            assert updates[0].bids == [(0.5, 1.0)]
+
+        asyncio.run(_test())
+
     def test_websocket_unsubscribe_market(self):
         """Test unsubscribing from a market."""
         import asyncio
@@ -998,6 +1836,21 @@ class TestLimitlessWebSocket:
         assert update.no_price == 0.35
         assert update.block_number == 12345678
 
+    def test_websocket_parse_price_update_missing_prices(self):
+        """Missing price fields still default to 0 off the fast path."""
+        from dr_manhattan.exchanges.limitless_ws import LimitlessWebSocket
+
+        ws = LimitlessWebSocket()
+
+        update = ws._parse_price_update({"marketAddress": "0xabc", "updatedPrices": {"yes": "0.7"}})
+        assert update.yes_price == 0.7
+        assert update.no_price == 0.0
+
+        update = ws._parse_price_update({"marketAddress": "0xabc"})
+        assert (update.yes_price, update.no_price) == (0.0, 0.0)
+
+        assert ws._parse_price_update({"marketAddress": "0xabc", "updatedPrices": None}) is None
+
     def test_user_websocket_init(self):
         """Test LimitlessUserWebSocket initialization."""
         from dr_manhattan.exchanges.limitless_ws import LimitlessUserWebSocket
@@ -2,8 +2,11 @@
 
 from datetime import datetime
 
+import pytest
+
 from dr_manhattan.models.market import Market
 from dr_manhattan.models.order import Order, OrderSide, OrderStatus
+from dr_manhattan.models.orderbook import OrderbookManager
 from dr_manhattan.models.position import Position
 
 
@@ -340,6 +343,15 @@ class TestPosition:
         # ((0.60 - 0.70) / 0.70) * 100 ≈ -14.29
         assert abs(position.unrealized_pnl_percent - (-14.285)) < 0.01
 
+    def test_position_uses_slots(self):
+        """Test position instances carry no per-instance __dict__"""
+        position = Position(
+            market_id="m1", outcome="Yes", size=1, average_price=0.5, current_price=0.5
+        )
+        assert not hasattr(position, "__dict__")
+        with pytest.raises(AttributeError):
+            position.extra = 1
+
 
 class TestOrderEnums:
     """Tests for Order enums"""
@@ -357,3 +369,25 @@ class TestOrderEnums:
         assert OrderStatus.PARTIALLY_FILLED.value == "partially_filled"
         assert OrderStatus.CANCELLED.value == "cancelled"
         assert OrderStatus.REJECTED.value == "rejected"
+
+
+class TestOrderbookManager:
+    """Tests for OrderbookManager"""
+
+    def test_update_levels_matches_update(self):
+        """update_levels stores the same shape as update and replaces the book"""
+        manager = OrderbookManager()
+        old = {"bids": [(0.4, 1.0)], "asks": [(0.6, 1.0)], "timestamp": 1, "market_id": "m"}
+        manager.update("t", old)
+
+        manager.update_levels("t", [(0.5, 2.0)], [(0.55, 3.0)], 2, "m")
+
+        book = manager.get("t")
+        assert book == {
+            "bids": [(0.5, 2.0)],
+            "asks": [(0.55, 3.0)],
+            "timestamp": 2,
+            "market_id": "m",
+        }
+        assert book is not old
+        assert manager.get_best_bid_ask("t") == (0.5, 0.55)
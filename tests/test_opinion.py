@@ -1,6 +1,6 @@
 """Tests for Opinion exchange implementation."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -50,6 +50,91 @@ class TestOpinionBasic:
         with pytest.raises(AuthenticationError):
             exchange.fetch_balance()
 
+    def test_session_uses_pooled_adapter(self):
+        """Test REST calls share a pooled session carrying the auth headers."""
+        exchange = Opinion({"api_key": "key"})
+        adapter = exchange._session.get_adapter(exchange.BASE_URL)
+
+        assert adapter._pool_maxsize == Opinion.HTTP_POOL_SIZE
+        assert adapter.max_retries.total == 0
+        assert exchange._session.headers["Authorization"] == "Bearer key"
+        assert exchange._session.headers["X-API-Key"] == "key"
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"ok": True}
+        exchange._session.request = MagicMock(return_value=response)
+
+        assert exchange._request("GET", "/markets", {"page": 1}) == {"ok": True}
+        exchange._session.request.assert_called_once_with(
+            "GET", f"{exchange.host}/markets", params={"page": 1}, timeout=exchange.timeout
+        )
+
+    def test_request_url_strips_trailing_slash(self):
+        """Test a host configured with a trailing slash does not yield '//' URLs."""
+        exchange = Opinion({"host": "https://example.com/"})
+        assert exchange._auth_headers == {}
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = []
+        exchange._session.request = MagicMock(return_value=response)
+        exchange._request("GET", "/orderbook")
+
+        assert exchange._session.request.call_args.args[1] == "https://example.com/orderbook"
+
+    def test_http2_client_maps_errors(self):
+        """Test the opt-in HTTP/2 transport shares _request's error mapping."""
+        httpx = pytest.importorskip("httpx")
+        from dr_manhattan.base.errors import ExchangeError, NetworkError
+
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            if request.url.path == "/down":
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"key": request.headers["X-API-Key"]})
+
+        exchange = Opinion({"api_key": "key", "http2": True, "max_retries": 0})
+        exchange._http = httpx.Client(
+            base_url=exchange.host,
+            headers=exchange._auth_headers,
+            transport=httpx.MockTransport(handler),
+        )
+
+        assert exchange._request("GET", "/markets") == {"key": "key"}
+        with pytest.raises(ExchangeError, match="Resource not found"):
+            exchange._request("GET", "/missing")
+        with pytest.raises(NetworkError):
+            exchange._request("GET", "/down")
+
+        exchange.close()
+        assert exchange._http is None
+
+    def test_orjson_decoding_is_opt_in(self):
+        """Test use_orjson decodes the raw body; default keeps response.json()."""
+        orjson = pytest.importorskip("orjson")
+
+        response = MagicMock(status_code=200, content=b'{"bids": [{"price": "0.5"}]}')
+        response.json.return_value = {"from": "json"}
+
+        exchange = Opinion({})
+        exchange._session.request = MagicMock(return_value=response)
+        assert exchange._request("GET", "/orderbook") == {"from": "json"}
+
+        exchange = Opinion({"use_orjson": True})
+        assert exchange._loads is orjson.loads
+        exchange._session.request = MagicMock(return_value=response)
+        assert exchange._request("GET", "/orderbook") == {"bids": [{"price": "0.5"}]}
+
+    def test_http2_client_created_lazily(self):
+        """Test the httpx client is only built on the first request."""
+        pytest.importorskip("h2")
+        exchange = Opinion({"api_key": "key", "http2": True})
+        assert exchange._http is None
+
+        client = exchange._create_http2_client()
+        assert client.headers["X-API-Key"] == "key"
+        client.close()
+
 
 class TestOpinionMarketParsing:
     """Test market parsing logic."""
@@ -118,6 +203,73 @@ class TestOpinionMarketParsing:
         assert market.metadata["tokens"]["Yes"] == "token_yes_123"
         assert market.metadata["tokens"]["No"] == "token_no_456"
 
+    def test_parse_market_fetches_orderbooks_concurrently(self):
+        """Test per-outcome orderbooks are fetched in parallel and mapped back in order."""
+        import threading
+
+        exchange = Opinion({})
+        exchange._client = MagicMock()
+        # Every fetch must be in flight at once to pass the barrier
+        barrier = threading.Barrier(3, timeout=5)
+        books = {
+            "t1": {"bids": [{"price": 0.2}], "asks": [{"price": 0.4}]},
+            "t2": {"bids": [], "asks": [{"price": 0.5}]},
+            "t3": {"bids": [{"price": 0.1}], "asks": []},
+        }
+
+        def get_orderbook(token_id):
+            barrier.wait()
+            return books[token_id]
+
+        exchange.get_orderbook = get_orderbook
+
+        children = []
+        for i in (1, 2, 3):
+            child = MagicMock(spec=[])
+            child.market_title = f"Outcome {i}"
+            child.yes_token_id = f"t{i}"
+            child.no_token_id = f"n{i}"
+            child.market_id = i
+            child.volume = "0"
+            children.append(child)
+
+        mock_data = MagicMock(spec=[])
+        mock_data.market_id = 789
+        mock_data.market_title = "Categorical"
+        mock_data.child_markets = children
+
+        market = exchange._parse_market(mock_data)
+        exchange.close()
+
+        assert market.prices == pytest.approx(
+            {"Outcome 1": 0.3, "Outcome 2": 0.5, "Outcome 3": 0.1}
+        )
+        assert market.metadata["tokens"] == {
+            "Outcome 1": "t1",
+            "Outcome 2": "t2",
+            "Outcome 3": "t3",
+        }
+        assert [c["no_token_id"] for c in market.metadata["child_markets"]] == ["n1", "n2", "n3"]
+
+    def test_get_orderbooks_maps_failures_to_empty_books(self):
+        """Test get_orderbooks keys results by token and isolates per-token failures."""
+        exchange = Opinion({})
+
+        def get_orderbook(token_id):
+            if token_id == "bad":
+                raise RuntimeError("boom")
+            return {"bids": [{"price": 0.4, "size": 1.0}], "asks": []}
+
+        exchange.get_orderbook = get_orderbook
+
+        books = exchange.get_orderbooks(["good", "bad"])
+        exchange.close()
+
+        assert list(books) == ["good", "bad"]
+        assert books["good"]["bids"][0]["price"] == 0.4
+        assert books["bad"] == {"bids": [], "asks": []}
+        assert exchange.get_orderbooks(["bad"]) == {"bad": {"bids": [], "asks": []}}
+
 
 class TestOpinionOrderParsing:
     """Test order parsing logic."""
@@ -170,6 +322,94 @@ class TestOpinionOrderParsing:
         assert order.side == OrderSide.SELL
         assert order.status == OrderStatus.FILLED
 
+    def test_parse_datetime_accepts_z_suffix(self):
+        """Test ISO strings with a trailing Z parse as UTC; junk parses to None."""
+        from datetime import datetime, timezone
+
+        exchange = Opinion({})
+
+        expected = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        assert exchange._parse_datetime("2024-01-01T12:30:00Z") == expected
+        assert exchange._parse_datetime("2024-01-01T12:30:00+00:00") == expected
+        assert exchange._parse_datetime(1704112200) == expected
+        assert exchange._parse_datetime(1704112200.0) == expected
+        assert exchange._parse_datetime(expected) is expected
+        assert exchange._parse_datetime("not a date") is None
+        assert exchange._parse_datetime(None) is None
+
+    def test_parse_history_returns_slotted_points(self):
+        """Test history rows parse into sorted slots PricePoints."""
+        from dr_manhattan.exchanges.opinion import NAV, PricePoint, PublicTrade
+
+        points = Opinion._parse_history([{"t": 20, "p": "0.6"}, {"timestamp": 10, "price": 0.5}])
+
+        assert [p.price for p in points] == [0.5, 0.6]
+        assert isinstance(points[0], PricePoint)
+        for cls in (PricePoint, PublicTrade, NAV):
+            assert "__dict__" not in dir(cls) and cls.__slots__
+
+    def test_parse_market_id(self):
+        """Test ints pass through, numeric strings convert and junk raises."""
+        from dr_manhattan.base.errors import ExchangeError
+
+        exchange = Opinion({})
+
+        assert exchange._parse_market_id(42) == 42
+        assert exchange._parse_market_id("42") == 42
+        assert exchange._parse_market_id(" 7 ") == 7
+        with pytest.raises(ExchangeError, match="Invalid market_id"):
+            exchange._parse_market_id("abc")
+        with pytest.raises(ExchangeError, match="Invalid market_id"):
+            exchange._parse_market_id(None)
+
+    def test_parse_response_envelopes(self):
+        """Test errno/result probing for list and single-item responses."""
+        from types import SimpleNamespace
+
+        from dr_manhattan.base.errors import ExchangeError
+
+        exchange = Opinion({})
+        ok = SimpleNamespace(errno=0, result=SimpleNamespace(list=None, data=None))
+
+        assert exchange._parse_list_response(ok) == []
+        assert exchange._parse_market_response(ok) is None
+        no_errno = SimpleNamespace(result=SimpleNamespace(list=[1]))
+        assert exchange._parse_list_response(no_errno) == [1]
+
+        with pytest.raises(ExchangeError, match="Failed to load"):
+            exchange._parse_list_response(SimpleNamespace(errno=5), "load")
+        with pytest.raises(ExchangeError, match="Invalid list response"):
+            exchange._parse_list_response(SimpleNamespace(errno=0, result=None))
+        with pytest.raises(ExchangeError, match="Invalid response format"):
+            exchange._parse_market_response(SimpleNamespace(errno=0))
+
+    def test_parse_order_status(self):
+        """Test int and string statuses map through the class-level tables."""
+        exchange = Opinion({})
+
+        assert exchange._parse_order_status(0) == OrderStatus.PENDING
+        assert exchange._parse_order_status(4) == OrderStatus.CANCELLED
+        assert exchange._parse_order_status(99) == OrderStatus.OPEN
+        assert exchange._parse_order_status("Canceled") == OrderStatus.CANCELLED
+        assert exchange._parse_order_status("matched") == OrderStatus.FILLED
+        assert exchange._parse_order_status(None) == OrderStatus.OPEN
+
+    def test_parse_market_closed_only_when_resolved(self):
+        """Test metadata['closed'] is set for resolved topics only."""
+        from opinion_clob_sdk import TopicStatus
+
+        exchange = Opinion({})
+        for status, closed in (
+            (TopicStatus.RESOLVED.value, True),
+            (TopicStatus.ACTIVATED.value, False),
+            (TopicStatus.RESOLVING.value, False),
+        ):
+            data = MagicMock(spec=[])
+            data.market_id = 1
+            data.status = status
+            market = exchange._parse_market(data, fetch_prices=False)
+            assert market.metadata["closed"] is closed
+
 
 class TestOpinionPositionParsing:
     """Test position parsing logic."""
@@ -194,6 +434,29 @@ class TestOpinionPositionParsing:
         assert position.current_price == 0.65
         assert position.unrealized_pnl == 15.0  # (0.65 - 0.50) * 100
 
+    def test_parse_position_falls_back_across_field_names(self):
+        """Test fetch_positions falls back to alternate and falsy-skipped field names."""
+        exchange = Opinion({})
+        exchange._client = MagicMock()
+
+        rows = []
+        for i, size in enumerate((10.0, 0)):
+            row = MagicMock(spec=["market_id", "token_name", "size", "balance", "avg_price"])
+            row.market_id = i + 1
+            row.token_name = "No"
+            row.size = size
+            row.balance = 7.0
+            row.avg_price = 0.25
+            rows.append(row)
+
+        exchange._parse_list_response = MagicMock(return_value=rows)
+        positions = exchange.fetch_positions()
+
+        assert [p.market_id for p in positions] == ["1", "2"]
+        assert [p.size for p in positions] == [10.0, 7.0]  # falsy size falls back to balance
+        assert positions[0].average_price == 0.25
+        assert positions[0].current_price == 0.0
+
 
 class TestOpinionWithMockedClient:
     """Tests with mocked Opinion client."""
@@ -210,6 +473,25 @@ class TestOpinionWithMockedClient:
         exchange._client = mock_client
         return exchange
 
+    def test_exchange_client_cancel_all_orders_cancels_individually(
+        self, exchange_with_mock, mock_client
+    ):
+        """Test ExchangeClient doesn't route Opinion through the SDK bulk cancel."""
+        from dr_manhattan.base.exchange_client import ExchangeClient
+        from dr_manhattan.models.order import Order
+
+        orders = [
+            Order(oid, "123", "Yes", OrderSide.BUY, 0.5, 1, 0, OrderStatus.OPEN, None, None)
+            for oid in ("o1", "o2")
+        ]
+        mock_client.cancel_order.return_value = MagicMock(errno=0)
+
+        with patch.object(exchange_with_mock, "fetch_open_orders", return_value=orders):
+            assert ExchangeClient(exchange_with_mock).cancel_all_orders(market_id="123") == 2
+
+        assert [c.args[0] for c in mock_client.cancel_order.call_args_list] == ["o1", "o2"]
+        mock_client.cancel_all_orders.assert_not_called()
+
     def test_fetch_markets_success(self, exchange_with_mock, mock_client):
         """Test successful fetch_markets."""
         # Setup mock response matching actual API structure
@@ -245,6 +527,28 @@ class TestOpinionWithMockedClient:
         assert markets[0].id == "1"
         assert markets[0].question == "Test Market"
 
+    def test_fetch_markets_limit_parses_only_needed(self, exchange_with_mock, mock_client):
+        """Test the limit is passed to the SDK and applied before parsing."""
+        rows = []
+        for i in range(1, 6):
+            row = MagicMock(spec=[])
+            row.market_id = i
+            rows.append(row)
+
+        mock_response = MagicMock()
+        mock_response.errno = 0
+        mock_response.result.list = rows
+        mock_client.get_markets.return_value = mock_response
+
+        parse_market = exchange_with_mock._parse_market
+        exchange_with_mock._parse_market = MagicMock(side_effect=parse_market)
+
+        markets = exchange_with_mock.fetch_markets({"limit": 2})
+
+        assert [m.id for m in markets] == ["1", "2"]
+        assert exchange_with_mock._parse_market.call_count == 2
+        assert mock_client.get_markets.call_args.kwargs["limit"] == 2
+
     def test_fetch_market_not_found(self, exchange_with_mock, mock_client):
         """Test fetch_market when market not found."""
         mock_response = MagicMock()
@@ -279,6 +583,368 @@ class TestOpinionWithMockedClient:
         assert len(orderbook["asks"]) == 1
         assert float(orderbook["bids"][0]["price"]) == 0.50
         assert float(orderbook["asks"][0]["price"]) == 0.52
+        assert orderbook["bids"][0] == {"price": 0.5, "size": 100.0}
+
+        orderbook = exchange_with_mock.get_orderbook("token_123", stringify=True)
+        assert orderbook["asks"][0] == {"price": "0.52", "size": "150.0"}
+
+    def test_parse_book_side_sorts_and_filters(self):
+        """Test levels are sorted by price (ties keep order) and bad levels dropped."""
+        from types import SimpleNamespace as Level
+
+        raw = [
+            Level(price="0.4", size="10"),
+            Level(price="0.6", size="5"),
+            Level(price="bad", size="1"),
+            Level(price="0.5", size="0"),
+            Level(price="0.4", size="3"),
+        ]
+
+        bids = Opinion._parse_book_side(raw, descending=True)
+        asks = Opinion._parse_book_side(raw, descending=False)
+
+        assert [(b["price"], b["size"]) for b in bids] == [(0.6, 5.0), (0.4, 10.0), (0.4, 3.0)]
+        assert [a["price"] for a in asks] == [0.4, 0.4, 0.6]
+
+    def test_orderbook_cache_ttl(self, mock_client):
+        """Test cache_ttl reuses a fresh book, hands out copies and expires."""
+        from types import SimpleNamespace as Level
+
+        mock_response = MagicMock()
+        mock_response.errno = 0
+        mock_response.result.bids = [Level(price=0.5, size=10)]
+        mock_response.result.asks = [Level(price=0.6, size=5)]
+        mock_client.get_orderbook.return_value = mock_response
+
+        exchange = Opinion({"cache_ttl": 60})
+        exchange._client = mock_client
+
+        first = exchange.get_orderbook("tok")
+        first["bids"][0]["price"] = 0.0
+        second = exchange.get_orderbook("tok")
+
+        assert mock_client.get_orderbook.call_count == 1
+        assert second["bids"][0] == {"price": 0.5, "size": 10.0}
+
+        exchange.cache_ttl = 0
+        exchange.get_orderbook("tok")
+        assert mock_client.get_orderbook.call_count == 2
+
+    def test_fetch_market_cache_hands_out_copies(self, mock_client):
+        """Test cached markets are copied so caller edits do not leak into the cache."""
+        from dr_manhattan.models.market import Market
+
+        exchange = Opinion({"cache_ttl": 60})
+        exchange._client = mock_client
+        market = Market(
+            id="1",
+            question="Q?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0.0,
+            liquidity=0.0,
+            prices={"Yes": 0.5, "No": 0.5},
+            metadata={"topic_id": "1"},
+            tick_size=0.01,
+            description="",
+        )
+
+        with patch.object(exchange, "_fetch_market_once", return_value=market) as fetch:
+            first = exchange.fetch_market("1")
+            first.prices["Yes"] = 0.9
+            first.metadata["topic_id"] = "x"
+            second = exchange.fetch_market("1")
+
+        assert fetch.call_count == 1
+        assert second is not first
+        assert second.prices == {"Yes": 0.5, "No": 0.5}
+        assert second.metadata["topic_id"] == "1"
+
+    def test_cache_evicts_expired_and_oldest(self):
+        """Test expired entries miss and the oldest entry is evicted when full."""
+        exchange = Opinion({"cache_ttl": 60})
+        exchange.CACHE_MAX_ENTRIES = 2
+
+        exchange._cache_put("market", "a", 1)
+        exchange._cache_put("market", "b", 2)
+        exchange._cache_put("market", "c", 3)
+        assert exchange._cache_get("market", "a") is None
+        assert exchange._cache_get("market", "c") == 3
+
+        exchange._cache[("market", "c")] = (0.0, 3)
+        assert exchange._cache_get("market", "c") is None
+
+    def test_create_order_checks_tick_alignment(self, exchange_with_mock, mock_client):
+        """Test off-tick prices are rejected and float noise is aligned away."""
+        from dr_manhattan.base.errors import InvalidOrder
+
+        mock_client.place_order.return_value = MagicMock(errno=0, spec=["errno"])
+        params = {"token_id": "tok"}
+
+        with pytest.raises(InvalidOrder, match="tick size"):
+            exchange_with_mock.create_order("1", "Yes", OrderSide.BUY, 0.5555, 10, params)
+        mock_client.place_order.assert_not_called()
+
+        order = exchange_with_mock.create_order("1", "Yes", OrderSide.BUY, 0.1 + 0.2, 10, params)
+
+        order_input = mock_client.place_order.call_args.args[0]
+        assert order_input.price == "0.3"
+        assert order.price == 0.3
+        assert order.updated_at == order.created_at
+
+    def test_calculate_nav_overlaps_balance_and_positions(self):
+        """Test balance and positions are fetched concurrently and combined."""
+        import threading
+
+        from dr_manhattan.models.market import Market
+        from dr_manhattan.models.position import Position
+
+        exchange = Opinion({})
+        # Both fetches must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_balance():
+            barrier.wait()
+            return {"USDC": 100.0}
+
+        def fetch_positions_for_market(market):
+            barrier.wait()
+            return [Position("1", "Yes", size=10, average_price=0.4, current_price=0.5)]
+
+        exchange.fetch_balance = fetch_balance
+        exchange.fetch_positions_for_market = fetch_positions_for_market
+
+        market = Market(
+            id="1",
+            question="Q?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={},
+            tick_size=0.001,
+        )
+        nav = exchange.calculate_nav(market)
+        exchange.close()
+
+        assert nav.cash == 100.0
+        assert nav.positions_value == 5.0
+        assert nav.nav == 105.0
+        assert nav.positions == [{"outcome": "Yes", "size": 10, "current_price": 0.5, "value": 5.0}]
+
+    def test_fetch_price_history_dataframe_matches_points(self, exchange_with_mock, mock_client):
+        """Test the DataFrame path builds the same sorted rows as the PricePoint path."""
+        from dr_manhattan.models.market import Market
+
+        rows = [
+            {"t": 30, "p": "0.7"},
+            {"t": None, "p": 0.1},
+            {"t": 10, "p": 0.5},
+            {"t": 20, "p": "x"},
+            {"t": 1700000000000, "p": 0.9},  # milliseconds: out of range for seconds
+            {"t": -(10**10), "p": 0.2},  # before 1677: outside datetime64[ns]
+        ]
+        mock_response = MagicMock()
+        mock_response.errno = 0
+        mock_response.result.list = rows
+        mock_client.get_price_history.return_value = mock_response
+
+        market = Market(
+            id="1",
+            question="Q?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={"tokens": {"Yes": "t1", "No": "t2"}, "clobTokenIds": ["t1", "t2"]},
+            tick_size=0.001,
+        )
+        points = exchange_with_mock.fetch_price_history(market)
+        df = exchange_with_mock.fetch_price_history(market, as_dataframe=True)
+
+        assert str(df["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert df["price"].tolist() == [p.price for p in points] == [0.5, 0.7]
+        assert df["timestamp"].dt.to_pydatetime().tolist() == [p.timestamp for p in points]
+
+        mock_response.result.list = [{"t": 10, "p": 0.5}, {"t": 30, "p": 0.7}]
+        df = exchange_with_mock.fetch_price_history(market, as_dataframe=True)
+        assert df["price"].tolist() == [0.5, 0.7]
+        assert df.index.tolist() == [0, 1]
+
+    def test_search_markets_numeric_prefilter(self, exchange_with_mock):
+        """Test liquidity/binary prefilter runs before the text filters."""
+        from dr_manhattan.models.market import Market
+
+        def make(mid, liquidity, outcomes, question):
+            return Market(
+                id=mid,
+                question=question,
+                outcomes=outcomes,
+                close_time=None,
+                volume=0,
+                liquidity=liquidity,
+                prices={},
+                metadata={},
+                tick_size=0.001,
+            )
+
+        markets = [
+            make("1", 100.0, ["Yes", "No"], "Will BTC rise?"),
+            make("2", 5.0, ["Yes", "No"], "Will BTC fall?"),
+            make("3", 200.0, ["A", "B", "C"], "Which BTC level?"),
+            make("4", 300.0, ["Yes", "No"], "Will ETH rise?"),
+        ]
+        exchange_with_mock.fetch_markets = MagicMock(return_value=markets)
+
+        results = exchange_with_mock.search_markets(query="btc", min_liquidity=50, binary=True)
+        assert [m.id for m in results] == ["1"]
+
+        results = exchange_with_mock.search_markets(binary=False)
+        assert [m.id for m in results] == ["3"]
+
+        results = exchange_with_mock.search_markets(query="will", keywords=["RISE", "will"])
+        assert [m.id for m in results] == ["1", "4"]
+
+    def test_search_markets_fetches_a_single_page(self, exchange_with_mock):
+        """Test search_markets requests one page, capped at the API page size."""
+        exchange_with_mock.fetch_markets = MagicMock(return_value=[])
+
+        assert exchange_with_mock.search_markets(limit=45, page=2) == []
+        exchange_with_mock.fetch_markets.assert_called_once()
+        params = exchange_with_mock.fetch_markets.call_args.args[0]
+        assert (params["page"], params["limit"]) == (2, 20)
+
+    def test_lookup_token_id_caches_per_market(self, exchange_with_mock):
+        """Test token IDs and outcome indexes are cached until their source changes."""
+        from dr_manhattan.base.errors import ExchangeError
+        from dr_manhattan.models.market import Market
+
+        market = Market(
+            id="1",
+            question="Q?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={"clobTokenIds": '["t1", "t2"]'},
+            tick_size=0.001,
+        )
+
+        assert exchange_with_mock._lookup_token_id(market, "No") == "t2"
+        assert exchange_with_mock._lookup_token_id(market, None) == "t1"
+        assert exchange_with_mock._lookup_token_id(market, 1) == "t2"
+
+        with patch("dr_manhattan.exchanges.opinion.json.loads") as loads:
+            assert exchange_with_mock._lookup_token_id(market, "Yes") == "t1"
+        loads.assert_not_called()
+
+        market.metadata["clobTokenIds"] = '["x1", "x2"]'
+        market.outcomes.reverse()
+        assert exchange_with_mock._lookup_token_id(market, "Yes") == "x2"
+        assert isinstance(Opinion._extract_token_ids(market), tuple)
+
+        with pytest.raises(ExchangeError, match="Outcome Maybe not found"):
+            exchange_with_mock._lookup_token_id(market, "Maybe")
+
+    def test_fetch_price_history_retries_network_errors(self, exchange_with_mock, mock_client):
+        """Test transient network errors are retried through _call_with_retry."""
+        from unittest.mock import patch
+
+        from dr_manhattan.base.errors import NetworkError
+        from dr_manhattan.models.market import Market
+
+        ok = MagicMock(errno=0)
+        ok.result.list = [{"t": 10, "p": 0.5}]
+        mock_client.get_price_history.side_effect = [NetworkError("reset"), ok]
+
+        market = Market(
+            id="1",
+            question="Q?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={"clobTokenIds": ["t1", "t2"]},
+            tick_size=0.001,
+        )
+        with patch("dr_manhattan.base.exchange.time.sleep"):
+            points = exchange_with_mock.fetch_price_history(market, interval="1d")
+
+        assert [p.price for p in points] == [0.5]
+        assert mock_client.get_price_history.call_count == 2
+        mock_client.get_price_history.assert_called_with(
+            token_id="t1", interval="1d", start_at=None, end_at=None
+        )
+
+    def test_fetch_price_history_rejects_unknown_interval(self, exchange_with_mock):
+        """Test intervals are validated against SUPPORTED_INTERVALS."""
+        assert Opinion._INTERVAL_SET == frozenset(Opinion.SUPPORTED_INTERVALS)
+
+        with pytest.raises(ValueError, match="Unsupported interval '6h'"):
+            exchange_with_mock.fetch_price_history("1", interval="6h")
+
+    def test_extract_token_ids_formats(self):
+        """Test JSON arrays decode and bare or malformed strings stay single IDs."""
+        from dr_manhattan.models.market import Market
+
+        def ids(raw):
+            market = Market(
+                id="1",
+                question="Q?",
+                outcomes=["Yes", "No"],
+                close_time=None,
+                volume=0,
+                liquidity=0,
+                prices={},
+                metadata={"clobTokenIds": raw},
+                tick_size=0.001,
+            )
+            return Opinion._extract_token_ids(market)
+
+        assert ids(' ["t1", "t2"]') == ("t1", "t2")
+        assert ids(["t1", None, 7]) == ("t1", "7")
+        assert ids("123456789012345678901234567890") == ("123456789012345678901234567890",)
+        assert ids("[broken") == ("[broken",)
+
+    def test_search_text_and_categories_cached(self, exchange_with_mock):
+        """Test search text and category sets are cached until their fields change."""
+        import sys
+
+        from dr_manhattan.models.market import Market
+
+        market = Market(
+            id="1",
+            question="Will BTC reach $100k?",
+            outcomes=["Yes", "No"],
+            close_time=None,
+            volume=0,
+            liquidity=0,
+            prices={},
+            metadata={"description": "Bitcoin", "category": "Crypto", "tags": ["BTC"]},
+            tick_size=0.001,
+        )
+
+        text = Opinion._build_search_text(market)
+        cats = Opinion._category_set(market)
+        assert "bitcoin" in text and "btc" in text
+        assert cats == frozenset({"crypto"})
+        assert next(iter(cats)) is sys.intern("crypto")
+
+        assert Opinion._build_search_text(market) is text
+        assert Opinion._category_set(market) is cats
+
+        market.metadata["tags"].append("Halving")
+        market.metadata["category"] = "Sports"
+        assert "halving" in Opinion._build_search_text(market)
+        assert Opinion._category_set(market) == frozenset({"sports"})
+
+        exchange_with_mock.fetch_markets = MagicMock(return_value=[market])
+        assert exchange_with_mock.search_markets(categories=["SPORTS"]) == [market]
+        assert exchange_with_mock.search_markets(categories=["crypto"]) == []
 
     def test_cancel_order_success(self, exchange_with_mock, mock_client):
         """Test successful order cancellation."""
@@ -291,6 +957,8 @@ class TestOpinionWithMockedClient:
 
         assert order.id == "order_123"
         assert order.status == OrderStatus.CANCELLED
+        assert order.updated_at == order.created_at
+        assert order.created_at.tzinfo is not None
         mock_client.cancel_order.assert_called_once_with("order_123")
 
     def test_fetch_balance_success(self, exchange_with_mock, mock_client):
@@ -309,3 +977,22 @@ class TestOpinionWithMockedClient:
 
         assert "USDC" in balance
         assert balance["USDC"] == 1000.0
+
+    def test_fetch_balance_remembers_schema(self, exchange_with_mock, mock_client):
+        """Test the matched balance shape is reused and re-probed when it changes."""
+        item = MagicMock(spec=["symbol", "balance"])
+        item.symbol = "USDT"
+        item.balance = "12.5"
+        mock_client.get_my_balances.return_value = MagicMock(
+            errno=0, result=MagicMock(spec=["list"], list=[item])
+        )
+
+        assert exchange_with_mock.fetch_balance() == {"USDT": 12.5}
+        assert exchange_with_mock._balance_schema == "list"
+        assert exchange_with_mock.fetch_balance() == {"USDT": 12.5}
+
+        mock_client.get_my_balances.return_value = MagicMock(
+            errno=0, result=MagicMock(spec=["data"], data=MagicMock(balance=3))
+        )
+        assert exchange_with_mock.fetch_balance() == {"USDC": 3.0}
+        assert exchange_with_mock._balance_schema == "data"
@@ -42,7 +42,7 @@ def test_polymarket_initialization_with_private_key():
         Polymarket(config)
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_fetch_markets(mock_get):
     """Test fetching markets from CLOB API"""
     mock_response = Mock()
@@ -74,7 +74,7 @@ def test_fetch_markets(mock_get):
     assert markets[0].prices == {"Yes": 0.6, "No": 0.4}
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_fetch_market(mock_request):
     """Test fetching a specific market"""
     mock_response = Mock()
@@ -98,7 +98,7 @@ def test_fetch_market(mock_request):
     assert market.question == "Test question?"
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_fetch_market_not_found(mock_request):
     """Test fetching non-existent market"""
     mock_response = Mock()
@@ -111,6 +111,195 @@ def test_fetch_market_not_found(mock_request):
         exchange.fetch_market("invalid_market")
 
 
+def test_session_reused_across_requests():
+    """Test REST calls share one pooled session and auth stays on Gamma calls"""
+    exchange = Polymarket({"api_key": "k"})
+    adapter = exchange._session.get_adapter("https://clob.polymarket.com")
+
+    assert adapter._pool_maxsize == Polymarket.HTTP_POOL_SIZE
+    assert adapter.max_retries.total == 0
+    assert "Authorization" not in exchange._session.headers
+
+    book = Mock(status_code=200)
+    book.json.return_value = {"bids": [], "asks": [{"price": "0.5", "size": "1"}]}
+    gamma = Mock(status_code=200)
+    gamma.json.return_value = {"id": "m"}
+    exchange._session.get = Mock(return_value=book)
+    exchange._session.request = Mock(return_value=gamma)
+
+    assert exchange.get_orderbook("t1")["asks"][0]["price"] == "0.5"
+    assert exchange._request("GET", "/markets/m") == {"id": "m"}
+    assert exchange._session.request.call_args.kwargs["headers"] == {"Authorization": "Bearer k"}
+    exchange.close()
+
+
+def test_fetch_token_ids_probes_endpoints_in_order():
+    """Test fallback CLOB endpoints are only fetched after earlier ones miss"""
+    rows = {
+        "/simplified-markets": {"data": [{"condition_id": "other", "tokens": ["x"]}]},
+        "/sampling-simplified-markets": [
+            {"condition_id": "0xabc", "tokens": [{"token_id": 1}, {"token_id": 2}]}
+        ],
+        "/markets": {"data": [{"condition_id": "0xabc", "tokens": ["m1", "m2"]}]},
+    }
+    seen = []
+
+    def get(url, timeout=None, stream=False):
+        endpoint = url.removeprefix(Polymarket.CLOB_URL)
+        seen.append(endpoint)
+        response = Mock(status_code=200)
+        response.json.return_value = rows[endpoint]
+        return response
+
+    exchange = Polymarket()
+    exchange._stream_items = None
+    exchange._session.get = get
+
+    assert exchange.fetch_token_ids("0xabc") == ["1", "2"]
+    assert seen == ["/simplified-markets", "/sampling-simplified-markets"]
+    exchange.close()
+
+
+@pytest.mark.parametrize("bare_list", [False, True])
+def test_probe_token_ids_streams_and_stops_at_match(bare_list):
+    """Test streamed market lists are consumed only up to the matching market"""
+    import io
+    import json
+
+    markets = [
+        {"condition_id": "other", "tokens": ["x"]},
+        {"condition_id": "0xabc", "tokens": [{"token_id": "1"}, {"token_id": "2"}]},
+        {"condition_id": "later", "tokens": ["y"]},
+    ]
+    body = markets if bare_list else {"data": markets, "next_cursor": "LTE="}
+    consumed = []
+
+    def items(raw, prefix):
+        # Stand-in for ijson.items on the two prefixes the probe uses
+        assert prefix == ("item" if bare_list else "data.item")
+        parsed = json.load(raw)
+        for market in parsed if bare_list else parsed["data"]:
+            consumed.append(market["condition_id"])
+            yield market
+
+    response = Mock(status_code=200)
+    response.raw = io.BytesIO(b" " + json.dumps(body).encode())
+
+    exchange = Polymarket()
+    exchange._stream_items = items
+    exchange._session.get = Mock(return_value=response)
+
+    assert exchange._probe_token_ids("/simplified-markets", "0xabc") == ["1", "2"]
+    assert consumed == ["other", "0xabc"]
+    assert exchange._session.get.call_args.kwargs["stream"] is True
+    response.json.assert_not_called()
+    response.close.assert_called_once()
+    exchange.close()
+
+
+def test_cache_ttl_reuses_market_lists_and_books():
+    """Test cache_ttl serves repeated market-list and orderbook reads from memory"""
+    exchange = Polymarket({"cache_ttl": 60})
+    markets = Mock(status_code=200)
+    markets.json.return_value = {
+        "data": [{"condition_id": "0xabc", "tokens": [{"token_id": "t1", "outcome": "Yes"}]}]
+    }
+    book = Mock(status_code=200)
+    book.json.return_value = {"bids": [{"price": "0.4", "size": "1"}], "asks": []}
+    exchange._session.get = Mock(
+        side_effect=lambda url, **kw: book if url.endswith("/book") else markets
+    )
+
+    first = exchange.fetch_markets()
+    assert exchange.fetch_markets({"limit": 1}) == first
+    first[0].metadata["closed"] = True
+    first[0].prices["Yes"] = 0.9
+    first.clear()
+    again = exchange.fetch_markets()
+    assert len(again) == 1
+    assert again[0].is_open
+    assert "Yes" not in again[0].prices
+
+    exchange.get_orderbook("t1")["bids"][0]["price"] = "0.9"
+    exchange.get_orderbook("t1")["asks"].append({"price": "0.6", "size": "1"})
+    assert exchange.get_orderbook("t1") == {"bids": [{"price": "0.4", "size": "1"}], "asks": []}
+    assert exchange._session.get.call_count == 2
+
+
+def test_fetch_token_ids_cached_per_condition():
+    """Test resolved token IDs are cached for cache_ttl like other reads"""
+    exchange = Polymarket({"cache_ttl": 60})
+    exchange._probe_token_ids = Mock(return_value=["a", "b"])
+
+    first = exchange.fetch_token_ids("0xabc")
+    first.append("mutated")
+    assert exchange.fetch_token_ids("0xabc") == ["a", "b"]
+    assert exchange._probe_token_ids.call_count == 1
+
+    uncached = Polymarket()
+    uncached._probe_token_ids = Mock(return_value=["a", "b"])
+    uncached.fetch_token_ids("0xabc")
+    uncached.fetch_token_ids("0xabc")
+    assert uncached._probe_token_ids.call_count == 2
+    exchange.close()
+    uncached.close()
+
+
+def test_use_orjson_decodes_response_bodies():
+    """Test use_orjson decodes raw response bytes instead of calling .json()"""
+    pytest.importorskip("orjson")
+
+    exchange = Polymarket({"use_orjson": True})
+    response = Mock(status_code=200, content=b'{"bids": [], "asks": [{"price": "0.5"}]}')
+    exchange._session.get = Mock(return_value=response)
+
+    assert exchange.get_orderbook("t1")["asks"] == [{"price": "0.5"}]
+    response.json.assert_not_called()
+    assert Polymarket()._loads is None
+
+
+def test_parse_market_identifier():
+    """Test slugs are extracted from event URLs and passed through otherwise"""
+    parse = Polymarket.parse_market_identifier
+
+    assert parse("fed-decision") == "fed-decision"
+    assert parse("https://polymarket.com/event/fed-decision?tid=1") == "fed-decision"
+    assert parse("https://polymarket.com/en/event/fed-decision/sub-market") == "fed-decision"
+    assert parse("https://polymarket.com/markets/other/") == "other"
+    assert parse("https://polymarket.com/myevent/slug") == "slug"
+    assert parse("") == ""
+
+
+def test_record_dataclasses_use_slots():
+    """Test PricePoint, PublicTrade and Tag are slotted records"""
+    from dr_manhattan.exchanges.polymarket import PricePoint, PublicTrade, Tag
+
+    for cls in (PricePoint, PublicTrade, Tag):
+        assert cls.__slots__ and "__dict__" not in dir(cls)
+
+    points = Polymarket._parse_history([{"t": 20, "p": "0.6"}, {"t": 10, "p": 0.5}])
+    assert [p.price for p in points] == [0.5, 0.6]
+    with pytest.raises(AttributeError):
+        points[0].extra = 1
+
+
+def test_parse_clob_tokens():
+    """Test CLOB token arrays split into IDs, outcomes and float prices"""
+    token_ids, outcomes, prices = Polymarket._parse_clob_tokens(
+        [
+            {"token_id": 1, "outcome": "Yes", "price": 0.6},
+            {"token_id": "t2", "outcome": "No", "price": "0.4"},
+            {"token_id": "t3", "outcome": "Maybe", "price": "n/a"},
+            {"token_id": "t4", "outcome": ""},
+            "junk",
+        ]
+    )
+
+    assert token_ids == ["1", "t2", "t3", "t4"]
+    assert outcomes == ["Yes", "No", "Maybe"]
+    assert prices == {"Yes": 0.6, "No": 0.4}
+
+
 def test_create_order_without_client():
     """Test creating order without authenticated client raises error"""
     exchange = Polymarket()
@@ -187,3 +376,38 @@ def test_parse_datetime():
     # Test invalid
     dt = exchange._parse_datetime("invalid")
     assert dt is None
+
+
+def test_parse_datetime_caches_iso_strings():
+    """Test ISO strings parse through a shared cache; datetimes are immutable"""
+    exchange = Polymarket()
+
+    first = exchange._parse_datetime("2025-06-30T12:00:00Z")
+    assert first is exchange._parse_datetime("2025-06-30T12:00:00Z")
+    assert first.tzinfo is not None
+    assert Polymarket.normalize_token("bitcoin") == "BTC"
+    assert Polymarket.normalize_token("doge") == "DOGE"
+
+
+def test_parse_sampling_market_leaves_row_untouched():
+    """Test sampling-market metadata is a new dict and the row is not mutated"""
+    exchange = Polymarket({})
+    row = {
+        "condition_id": "0xabc",
+        "question": "Will it rain?",
+        "closed": False,
+        "rewards": {"min_size": 50},
+        "tokens": [
+            {"token_id": "1", "outcome": "Yes", "price": 0.6},
+            {"token_id": "2", "outcome": "No", "price": 0.4},
+        ],
+    }
+
+    original = dict(row)
+    market = exchange._parse_sampling_market(row)
+
+    assert market.metadata is not row
+    assert row == original
+    assert market.metadata["clobTokenIds"] == ["1", "2"]
+    assert market.metadata["rewards"] == {"min_size": 50}
+    assert market.is_open